@@ -21,6 +21,8 @@ auto_save_rom_path = auto_save_path / "auto_save.nes"
 auto_save_m3l_path = auto_save_path / "auto_save.m3l"
 auto_save_level_data_path = auto_save_path / "level_data.json"
 
+thumbnail_cache_path = home_dir / "thumbnails"
+
 data_dir = root_dir / "data"
 main_window_flags_path = data_dir / "main_window_flags.json"
 jump_creator_flags_path = data_dir / "jump_creator_flags.json"
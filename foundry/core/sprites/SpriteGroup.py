@@ -10,7 +10,7 @@ from foundry.core.size.Size import Size, SizeProtocol
 from foundry.core.sprites import SPRITE_SIZE
 from foundry.core.sprites.Sprite import SpriteProtocol
 from foundry.game.gfx.drawable import MASK_COLOR
-from foundry.game.gfx.drawable.Sprite import Sprite as MetaSprite
+from foundry.game.gfx.drawable.SpriteAtlas import get_sprite_atlas
 
 
 class SpriteGroupProtocol(Protocol):
@@ -61,26 +61,24 @@ class SpriteGroup:
         image.fill(QColor(*MASK_COLOR))
         painter = QPainter(image)
 
+        atlas = get_sprite_atlas(self.graphics_set, self.palette_group)
+
         for sprite_data in self.sprites:
             if sprite_data.do_not_render:
                 continue
-            else:
-                sprite = MetaSprite(
-                    sprite_data.index,
-                    tuple(tuple(c for c in pal) for pal in self.palette_group),  # type: ignore
-                    sprite_data.palette_index,
-                    self.graphics_set,
-                    sprite_data.horizontal_mirror,
-                    sprite_data.vertical_mirror,
-                )
-                sprite.draw(
-                    painter,
-                    sprite_data.position.x * scale_factor,
-                    sprite_data.position.y * scale_factor,
-                    SPRITE_SIZE.width * scale_factor,
-                    SPRITE_SIZE.height * scale_factor,
-                    transparent=True,
-                )
+
+            atlas.draw(
+                painter,
+                sprite_data.index,
+                sprite_data.palette_index,
+                sprite_data.position.x * scale_factor,
+                sprite_data.position.y * scale_factor,
+                SPRITE_SIZE.width * scale_factor,
+                SPRITE_SIZE.height * scale_factor,
+                sprite_data.horizontal_mirror,
+                sprite_data.vertical_mirror,
+                transparent=True,
+            )
 
         painter.end()
         return image
@@ -234,6 +234,9 @@ class ROM(Rom):
     name: str = ""
     header: INESHeader
 
+    generation: int = 0
+    """Incremented whenever the ROM data changes, so caches derived from it know when they became stale."""
+
     W_INIT_OS_LIST: List[int] = []
 
     def __init__(self, path: Optional[str] = None):
@@ -281,6 +284,10 @@ class ROM(Rom):
         with open(path, "rb") as rom:
             data = bytearray(rom.read())
 
+        ROM.load_from_data(data, path)
+
+    @staticmethod
+    def load_from_data(data: bytearray, path: str = ""):
         ROM.path = path
         ROM.name = basename(path)
 
@@ -296,6 +303,7 @@ class ROM(Rom):
 
             ROM.additional_data = data[additional_data_start:].decode("utf-8")
         ROM.header = INESHeader.from_data(ROM.rom_data)
+        ROM.generation += 1
 
     @staticmethod
     def save_to_file(path: str, set_new_path=True):
@@ -341,3 +349,8 @@ class ROM(Rom):
     def bulk_write(self, data: bytearray, position: int):
         position = self.header.normalized_address(position)
         self.rom_data[position : position + len(data)] = data
+        ROM.generation += 1
+
+    def write(self, offset: int, data: bytes):
+        super(ROM, self).write(offset, data)
+        ROM.generation += 1
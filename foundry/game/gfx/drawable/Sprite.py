@@ -1,33 +1,13 @@
-from functools import lru_cache
-
 from PySide6.QtCore import QPoint
 from PySide6.QtGui import QColor, QImage, QPainter, Qt
 
 from foundry.core.graphics_set.GraphicsSet import GraphicsSetProtocol
 from foundry.core.palette import NESPalette
 from foundry.core.palette.PaletteGroup import MutablePaletteGroupProtocol
-from foundry.game.File import ROM
 from foundry.game.gfx.drawable import MASK_COLOR, apply_selection_overlay
 from foundry.game.gfx.drawable.Tile import Tile
 
 
-@lru_cache(2**10)
-def get_sprite(
-    index: int,
-    palette_group: MutablePaletteGroupProtocol,
-    palette_index: int,
-    graphics_set: GraphicsSetProtocol,
-    horizontal_mirror: bool = False,
-    vertical_mirror: bool = False,
-):
-    if index > 0xFF:
-        return Sprite(
-            ROM().get_byte(index), palette_group, palette_index, graphics_set, horizontal_mirror, vertical_mirror
-        )
-    else:
-        return Sprite(index, palette_group, palette_index, graphics_set, horizontal_mirror, vertical_mirror)
-
-
 class Sprite:
     WIDTH: int = Tile.SIDE_LENGTH  # type: ignore
     HEIGHT: int = Tile.SIDE_LENGTH * 2  # type: ignore
@@ -50,8 +30,8 @@ class Sprite:
         self.palette_group = palette_group
         self.palette_index = palette_index
 
-        # can't hash list, so turn it into a string instead
-        self._sprite_id = (index, str(palette_group), palette_index, graphics_set)
+        # can't hash list, so turn it into a tuple instead
+        self._sprite_id = (index, tuple(tuple(palette) for palette in palette_group), palette_index, graphics_set)
 
         self.top_tile = Tile(index, palette_group, palette_index, graphics_set)
         self.bottom_tile = Tile(index + 1, palette_group, palette_index, graphics_set)
@@ -0,0 +1,154 @@
+from functools import lru_cache
+
+from PySide6.QtCore import QPoint
+from PySide6.QtGui import QColor, QImage, QPainter, Qt
+
+from foundry.core.graphics_set.GraphicsSet import GraphicsSetProtocol
+from foundry.core.palette import NESPalette
+from foundry.core.palette.PaletteGroup import MutablePaletteGroupProtocol
+from foundry.game.File import ROM
+from foundry.game.gfx.drawable import MASK_COLOR, apply_selection_overlay
+from foundry.game.gfx.drawable.Sprite import Sprite
+from foundry.game.gfx.drawable.Tile import Tile
+from foundry.game.gfx.drawable.TileAtlas import TileAtlas, decode_color_indices
+
+PaletteGroupKey = tuple[tuple[int, ...], ...]
+
+
+def get_sprite_atlas(graphics_set: GraphicsSetProtocol, palette_group: MutablePaletteGroupProtocol) -> "SpriteAtlas":
+    """
+    The sprite atlas of a graphics set in a palette group, shared by everything drawing sprites with them.
+    """
+    return _sprite_atlas(graphics_set, tuple(tuple(palette) for palette in palette_group), ROM.generation)
+
+
+@lru_cache(2**5)
+def _sprite_atlas(graphics_set: GraphicsSetProtocol, palette_group: PaletteGroupKey, _rom_generation: int):
+    return SpriteAtlas(graphics_set, palette_group)
+
+
+class SpriteAtlas:
+    """
+    Every 8x16 sprite of a graphics set, drawn from strips of images instead of an image per sprite.
+
+    A strip holds the sprites of every tile index side by side, in one palette, mirroring, size and selection. It is
+    made the first time a sprite of it is drawn, so drawing a sprite afterwards is a blit of a part of the strip.
+    """
+
+    def __init__(self, graphics_set: GraphicsSetProtocol, palette_group: PaletteGroupKey):
+        self.palette_group = palette_group
+
+        tiles = _tile_color_indices(graphics_set)
+
+        self.sprite_count = len(tiles)
+
+        # a sprite is made up of the tile at its index and the one after it
+        tiles.append(bytes(Tile.PIXEL_COUNT))
+
+        self._color_indices = b"".join(
+            tiles[index + tile_row // Tile.HEIGHT][(tile_row % Tile.HEIGHT) * Tile.WIDTH :][: Tile.WIDTH]
+            for tile_row in range(Sprite.HEIGHT)
+            for index in range(self.sprite_count)
+        )
+
+        self._strips: dict[tuple, QImage] = {}
+
+    def draw(
+        self,
+        painter: QPainter,
+        index: int,
+        palette_index: int,
+        x,
+        y,
+        width: int,
+        height: int,
+        horizontal_mirror: bool = False,
+        vertical_mirror: bool = False,
+        selected: bool = False,
+        transparent: bool = False,
+    ):
+        """
+        Draws a sprite the same way as Sprite.draw would.
+
+        :param index: The index of the top tile of the sprite, or the position in the ROM to read it from, if it is
+            larger than 0xFF.
+        """
+        if index > 0xFF:
+            index = ROM().get_byte(index)
+
+        if not 0 <= index < self.sprite_count:
+            return
+
+        strip = self._strip(palette_index, horizontal_mirror, vertical_mirror, width, height, selected, transparent)
+
+        column = self.sprite_count - 1 - index if horizontal_mirror else index
+
+        painter.drawImage(x, y, strip, column * width, 0, width, height)
+
+    def _strip(
+        self,
+        palette_index: int,
+        horizontal_mirror: bool,
+        vertical_mirror: bool,
+        width: int,
+        height: int,
+        selected: bool,
+        transparent: bool,
+    ) -> QImage:
+        strip_attributes = (palette_index, horizontal_mirror, vertical_mirror, width, height, selected, transparent)
+
+        if strip_attributes not in self._strips:
+            palette = self.palette_group[palette_index]
+
+            colors = [bytes(MASK_COLOR)] + [bytes(NESPalette[color].toTuple()[:3]) for color in palette[1:]]
+            pixels = b"".join([colors[color_index] for color_index in self._color_indices])
+
+            image = QImage(pixels, self.sprite_count * Sprite.WIDTH, Sprite.HEIGHT, QImage.Format_RGB888).copy()
+            image = image.mirrored(horizontal_mirror, vertical_mirror)
+
+            if width != Sprite.WIDTH or height != Sprite.HEIGHT:
+                image = image.scaled(self.sprite_count * width, height)
+
+            # mask out the transparent pixels first
+            mask = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
+            image.setAlphaChannel(mask)
+
+            if not transparent:
+                image = _replace_transparent_with_background(image, palette)
+
+            if selected:
+                apply_selection_overlay(image, mask)
+
+            self._strips[strip_attributes] = image
+
+        return self._strips[strip_attributes]
+
+
+def _tile_color_indices(graphics_set: GraphicsSetProtocol) -> list[bytes]:
+    atlas = TileAtlas.installed
+    data = bytes(graphics_set)
+
+    tiles = []
+
+    for tile_index in range(len(data) // Tile.SIZE):
+        if atlas is not None and atlas.covers(graphics_set, tile_index):
+            tiles.append(atlas.color_indices(graphics_set, tile_index))
+        else:
+            tiles.append(decode_color_indices(data[tile_index * Tile.SIZE : (tile_index + 1) * Tile.SIZE]))
+
+    return tiles
+
+
+def _replace_transparent_with_background(image: QImage, palette: tuple[int, ...]) -> QImage:
+    # draw image on background layer, to fill transparent pixels
+    background = image.copy()
+    try:
+        background.fill(NESPalette[palette[0]])
+    except IndexError:
+        return image
+
+    _painter = QPainter(background)
+    _painter.drawImage(QPoint(), image)
+    _painter.end()
+
+    return background
@@ -6,8 +6,7 @@ from foundry.core.graphics_set.GraphicsSet import GraphicsSetProtocol
 from foundry.core.palette import NESPalette
 from foundry.core.palette.PaletteGroup import MutablePaletteGroup
 from foundry.game.gfx.drawable import MASK_COLOR, bit_reverse
-
-PIXEL_OFFSET = 8  # both bits describing the color of a pixel are in separate 8 byte chunks at the same index
+from foundry.game.gfx.drawable.TileAtlas import TileAtlas, decode_color_indices
 
 BACKGROUND_COLOR_INDEX = 0
 
@@ -39,25 +38,19 @@ class Tile:
         self.pixels = bytearray()
         self.mask_pixels = bytearray()
 
-        self.data = bytearray(bytes(graphics_set))[start : start + Tile.SIZE]
-
-        if mirrored:
-            self._mirror()
-
-        for i in range(Tile.PIXEL_COUNT):
-            byte_index = i // Tile.HEIGHT
-            bit_index = 2 ** (7 - (i % Tile.WIDTH))
-
-            left_bit = right_bit = 0
+        atlas = TileAtlas.installed
 
-            if self.data[byte_index] & bit_index:
-                left_bit = 1
+        if atlas is not None and atlas.covers(graphics_set, object_index):
+            color_indices = atlas.color_indices(graphics_set, object_index, mirrored)
+        else:
+            self.data = bytearray(bytes(graphics_set))[start : start + Tile.SIZE]
 
-            if self.data[PIXEL_OFFSET + byte_index] & bit_index:
-                right_bit = 1
+            if mirrored:
+                self._mirror()
 
-            color_index = (right_bit << 1) | left_bit
+            color_indices = decode_color_indices(self.data)
 
+        for color_index in color_indices:
             color = self.palette[color_index]
 
             # add alpha values
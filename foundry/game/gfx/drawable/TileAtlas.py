@@ -0,0 +1,145 @@
+from hashlib import sha1
+from pathlib import Path
+from typing import ClassVar, Optional, Union
+
+from foundry.core.graphics_page import CHR_ROM_SEGMENT_SIZE
+from foundry.core.graphics_set.GraphicsSet import GraphicsSetProtocol
+from foundry.game.File import ROM, INESHeader
+
+TILE_SIZE = 16  # bytes
+TILE_WIDTH = 8  # pixels
+TILE_PIXEL_COUNT = TILE_WIDTH * TILE_WIDTH
+TILES_PER_PAGE = CHR_ROM_SEGMENT_SIZE // TILE_SIZE
+
+PIXEL_OFFSET = 8  # both bits describing the color of a pixel are in separate 8 byte chunks at the same index
+
+
+def decode_color_indices(data: bytes) -> bytes:
+    """
+    Decodes the two bit planes of a tile into the palette index of every pixel, row by row.
+
+    :param data: The 16 bytes of a tile, as they are stored in the ROM.
+
+    :return: 64 palette indices between 0 and 3.
+    """
+    color_indices = bytearray(TILE_PIXEL_COUNT)
+
+    for i in range(TILE_PIXEL_COUNT):
+        byte_index = i // TILE_WIDTH
+        bit_index = 2 ** (7 - (i % TILE_WIDTH))
+
+        left_bit = right_bit = 0
+
+        if data[byte_index] & bit_index:
+            left_bit = 1
+
+        if data[PIXEL_OFFSET + byte_index] & bit_index:
+            right_bit = 1
+
+        color_indices[i] = (right_bit << 1) | left_bit
+
+    return bytes(color_indices)
+
+
+def graphics_hash(rom: ROM) -> bytes:
+    """
+    A hash of the graphics data of the ROM, to tell if an atlas was made from the same graphics.
+    """
+    return sha1(_graphics_data(rom)).digest()
+
+
+def _graphics_data(rom: ROM) -> bytes:
+    return bytes(rom.rom_data[INESHeader.INES_HEADER_SIZE + rom.header.program_size :])
+
+
+class TileAtlas:
+    """
+    The decoded palette indices of every tile in the graphics data of a ROM.
+
+    Decoding the bit planes of tiles is one of the slower parts of drawing a level for the first time. The atlas
+    does it once for the whole ROM and can be saved to a file, so other processes, like the workers of the batch
+    renderer, can load it instead of decoding the same tiles over and over.
+
+    Once installed, Tiles read from the atlas instead of the ROM, as long as the ROM did not change in between.
+    """
+
+    MAGIC: ClassVar[bytes] = b"SMB3ATLS"
+
+    installed: ClassVar[Optional["TileAtlas"]] = None
+    _installed_generation: ClassVar[int] = -1
+
+    def __init__(self, rom_hash: bytes, color_indices: bytes):
+        self.rom_hash = rom_hash
+        self.data = color_indices
+
+        self.page_count = len(self.data) // (TILES_PER_PAGE * TILE_PIXEL_COUNT)
+
+    @classmethod
+    def from_rom(cls, rom: ROM) -> "TileAtlas":
+        graphics_data = _graphics_data(rom)
+        tile_count = len(graphics_data) // CHR_ROM_SEGMENT_SIZE * TILES_PER_PAGE
+
+        color_indices = bytearray()
+
+        for tile_index in range(tile_count):
+            start = tile_index * TILE_SIZE
+
+            color_indices.extend(decode_color_indices(graphics_data[start : start + TILE_SIZE]))
+
+        return cls(sha1(graphics_data).digest(), bytes(color_indices))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TileAtlas":
+        with open(path, "rb") as atlas_file:
+            data = atlas_file.read()
+
+        if not data.startswith(cls.MAGIC):
+            raise ValueError(f"{path} is not a tile atlas.")
+
+        hash_start = len(cls.MAGIC)
+        data_start = hash_start + sha1().digest_size
+
+        return cls(data[hash_start:data_start], data[data_start:])
+
+    def save(self, path: Union[str, Path]):
+        with open(path, "wb") as atlas_file:
+            atlas_file.write(self.MAGIC)
+            atlas_file.write(self.rom_hash)
+            atlas_file.write(self.data)
+
+    @classmethod
+    def install(cls, atlas: Optional["TileAtlas"]):
+        """
+        Makes Tiles use the given atlas, or decode themselves again, if it is None.
+
+        The atlas is only used, while the ROM stays as it was at the time of installation.
+        """
+        cls.installed = atlas
+        cls._installed_generation = ROM.generation
+
+    def covers(self, graphics_set: GraphicsSetProtocol, tile_index: int) -> bool:
+        if ROM.generation != self._installed_generation:
+            return False
+
+        page_index, _ = divmod(tile_index, TILES_PER_PAGE)
+
+        if page_index >= len(graphics_set.pages):
+            return False
+
+        page = graphics_set.pages[page_index]
+
+        # pages loaded from separate files are not part of the ROM
+        return getattr(page, "path", None) is None and page.index < self.page_count
+
+    def color_indices(self, graphics_set: GraphicsSetProtocol, tile_index: int, mirrored: bool = False) -> bytes:
+        page_index, tile_in_page = divmod(tile_index, TILES_PER_PAGE)
+
+        start = (graphics_set.pages[page_index].index * TILES_PER_PAGE + tile_in_page) * TILE_PIXEL_COUNT
+        color_indices = self.data[start : start + TILE_PIXEL_COUNT]
+
+        if mirrored:
+            color_indices = b"".join(
+                color_indices[row : row + TILE_WIDTH][::-1] for row in range(0, TILE_PIXEL_COUNT, TILE_WIDTH)
+            )
+
+        return color_indices
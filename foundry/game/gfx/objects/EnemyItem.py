@@ -1,4 +1,4 @@
-from PySide6.QtCore import QRect, QSize
+from PySide6.QtCore import QRect, QRectF, QSize
 from PySide6.QtGui import QColor, QImage, QPainter, Qt
 
 from foundry.core.graphics_page.GraphicsPage import GraphicsPage
@@ -12,7 +12,7 @@ from foundry.game.EnemyDefinitions import (
 )
 from foundry.game.gfx.drawable import apply_selection_overlay
 from foundry.game.gfx.drawable.Block import Block
-from foundry.game.gfx.drawable.Sprite import get_sprite
+from foundry.game.gfx.drawable.SpriteAtlas import get_sprite_atlas
 from foundry.game.gfx.objects.Enemy import Enemy
 from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
@@ -20,6 +20,8 @@ MASK_COLOR = [0xFF, 0x33, 0xFF]
 
 
 class EnemyObject(ObjectLike):
+    _block_cache = {}
+
     def __init__(self, data, png_data, palette_group: MutablePaletteGroup):
         super().__init__()
         self.enemy = Enemy.from_bytes(data)
@@ -82,15 +84,35 @@ class EnemyObject(ObjectLike):
         self.sprites = self.definition.sprites
 
     def _render_blocks(self):
-        self.blocks = []
+        self.blocks = list(self.definition.blocks)
+
+    def _block_image(self, block_id: int, block_length: int, selected: bool) -> QImage:
+        """
+        The masked image of a block of gfx.png, scaled to the block length and selected, if necessary.
 
-        block_ids = self.definition.blocks
+        The images are shared between all enemies, so drawing one only blits them.
+        """
+        block_attributes = (self.png_data.cacheKey(), block_id, block_length, selected)
 
-        for block_id in block_ids:
+        if block_attributes not in EnemyObject._block_cache:
             x = (block_id % 64) * Block.WIDTH
             y = (block_id // 64) * Block.WIDTH
 
-            self.blocks.append(self.png_data.copy(QRect(x, y, Block.WIDTH, Block.HEIGHT)))
+            block = self.png_data.copy(QRect(x, y, Block.WIDTH, Block.HEIGHT))
+
+            mask = block.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
+            block.setAlphaChannel(mask)
+
+            # todo better effect
+            if selected:
+                apply_selection_overlay(block, mask)
+
+            if block_length != Block.SIDE_LENGTH:
+                block = block.scaled(block_length, block_length)
+
+            EnemyObject._block_cache[block_attributes] = block
+
+        return EnemyObject._block_cache[block_attributes]
 
     def render(self):
         # nothing to re-render since enemies are just copied over
@@ -103,68 +125,90 @@ class EnemyObject(ObjectLike):
             self.draw_sprites(painter, block_length // 2, transparency, is_icon)
 
     def draw_sprites(self, painter: QPainter, scale_factor, transparency, is_icon):
+        atlas = get_sprite_atlas(self.graphics_set, self.palette_group)
+
         for i, sprite_info in enumerate(self.sprites):
             if sprite_info.index < 0:
                 continue
 
-            x = (self.position.x * 2) + (i % self.width) if not is_icon else (i % self.width)
-            y = self.position.y + (i // self.width) if not is_icon else (i // self.width)
-            x += sprite_info.x_offset / 16
-            y -= sprite_info.y_offset / 16
-
-            if is_icon:
-                definition = get_enemy_metadata().__root__[self.obj_index]
-                x_offset, y_offset = definition.suggested_icon_x_offset, definition.suggested_icon_y_offset
-                x += x_offset / 16
-                y -= y_offset / 16
-            if not is_icon:
-                y_offset = self.height - 1
-                y -= y_offset
-
-            sprite = get_sprite(
+            x, y = self._sprite_position(i, sprite_info, is_icon)
+
+            atlas.draw(
+                painter,
                 sprite_info.index,
-                self.palette_group,
                 sprite_info.palette_index,
-                self.graphics_set,
-                sprite_info.horizontal_mirror,
-                sprite_info.vertical_mirror,
-            )
-            sprite.draw(
-                painter,
                 x * scale_factor,
                 y * scale_factor * 2,
                 scale_factor,
                 scale_factor * 2,
+                sprite_info.horizontal_mirror,
+                sprite_info.vertical_mirror,
                 self.selected,
                 transparency,
             )
 
     def draw_blocks(self, painter: QPainter, block_length, is_icon):
-        for i, image in enumerate(self.blocks):
-            x = self.position.x + (i % self.width) if not is_icon else (i % self.width)
-            y = self.position.y + (i // self.width) if not is_icon else (i // self.width)
+        for i, block_id in enumerate(self.blocks):
+            x, y = self._block_position(i, is_icon)
 
-            if is_icon:
-                definition = get_enemy_metadata().__root__[self.obj_index]
-                x_offset, y_offset = definition.suggested_icon_x_offset, definition.suggested_icon_y_offset
-                x -= x_offset
-            if not is_icon:
-                y_offset = self.height - 1
-                y -= y_offset
+            painter.drawImage(
+                x * block_length, y * block_length, self._block_image(block_id, block_length, self.selected)
+            )
 
-            block = image.copy()
+    def _sprite_position(self, index: int, sprite_info, is_icon: bool) -> tuple[float, float]:
+        """
+        The position of a sprite, in sprite widths horizontally and in blocks vertically.
+        """
+        x = (self.position.x * 2) + (index % self.width) if not is_icon else (index % self.width)
+        y = self.position.y + (index // self.width) if not is_icon else (index // self.width)
+        x += sprite_info.x_offset / 16
+        y -= sprite_info.y_offset / 16
+
+        if is_icon:
+            definition = get_enemy_metadata().__root__[self.obj_index]
+            x_offset, y_offset = definition.suggested_icon_x_offset, definition.suggested_icon_y_offset
+            x += x_offset / 16
+            y -= y_offset / 16
+        if not is_icon:
+            y_offset = self.height - 1
+            y -= y_offset
+
+        return x, y
+
+    def _block_position(self, index: int, is_icon: bool) -> tuple[int, int]:
+        x = self.position.x + (index % self.width) if not is_icon else (index % self.width)
+        y = self.position.y + (index // self.width) if not is_icon else (index // self.width)
+
+        if is_icon:
+            definition = get_enemy_metadata().__root__[self.obj_index]
+            x_offset, y_offset = definition.suggested_icon_x_offset, definition.suggested_icon_y_offset
+            x -= x_offset
+        if not is_icon:
+            y_offset = self.height - 1
+            y -= y_offset
+
+        return x, y
+
+    def drawn_bounds(self) -> QRect:
+        """
+        The rect in blocks, that the enemy is drawn into. Sprites can reach past the rect of the enemy, so this can be
+        larger than it.
+        """
+        bounds = QRectF(self.rect)
 
-            mask = block.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
-            block.setAlphaChannel(mask)
+        if not GeneratorType.SINGLE_SPRITE_OBJECT == self.definition.orientation:
+            for i in range(len(self.blocks)):
+                bounds = bounds.united(QRectF(*self._block_position(i, False), 1, 1))
+        else:
+            for i, sprite_info in enumerate(self.sprites):
+                if sprite_info.index < 0:
+                    continue
 
-            # todo better effect
-            if self.selected:
-                apply_selection_overlay(block, mask)
+                x, y = self._sprite_position(i, sprite_info, False)
 
-            if block_length != Block.SIDE_LENGTH:
-                block = block.scaled(block_length, block_length)
+                bounds = bounds.united(QRectF(x / 2, y, 0.5, 1))
 
-            painter.drawImage(x * block_length, y * block_length, block)
+        return bounds.toAlignedRect()
 
     def get_status_info(self):
         return [("Name", self.name), ("X", self.position.x), ("Y", self.position.y)]
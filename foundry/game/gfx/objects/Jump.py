@@ -1,4 +1,5 @@
 from json import loads
+from typing import Optional
 
 from PySide6.QtCore import QRect
 
@@ -101,5 +102,26 @@ class Jump(GeneratorObject):
                 block_length * GROUND,
             )
 
+    @staticmethod
+    def screen_index_at(x: int, y: int, vertical=False) -> Optional[int]:
+        """
+        The screen index of the jumps, whose rect contains the given block, or None, if no jump could.
+        """
+        if vertical:
+            screen_index, _ = divmod(y - 1, SCREEN_HEIGHT)
+
+            if not 0 <= x < SCREEN_WIDTH:
+                return None
+        else:
+            screen_index, _ = divmod(x, SCREEN_WIDTH)
+
+            if not 0 <= y < GROUND:
+                return None
+
+        if screen_index < 0:
+            return None
+
+        return screen_index
+
     def __contains__(self, point):
         return False
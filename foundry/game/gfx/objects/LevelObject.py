@@ -1,4 +1,6 @@
-from typing import List, Optional, Tuple
+from array import array
+from functools import lru_cache, wraps
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
 from warnings import warn
 
 from PySide6.QtCore import QRect, QSize
@@ -51,15 +53,79 @@ ORIENTATION_TO_STR = {
 
 # todo what is this, exactly?
 ENDING_OBJECT_OFFSET = 0x1C8F9
+ENDING_GRAPHIC_HEIGHT = 6
+ENDING_PAGE_WIDTH = 16
 
 # not all objects provide a block index for blank block
 BLANK = -1
 
+# some block indexes are offsets into the ROM, so they do not fit into 16 bits
+BLOCK_TYPECODE = "i"
+
 SCREEN_HEIGHT = 15
 SCREEN_WIDTH = 16
 
 MASK_COLOR = [0xFF, 0x33, 0xFF]
 
+GROUND_DEPENDENT_GENERATORS = [
+    GeneratorType.HORIZ_TO_GROUND,
+    GeneratorType.PYRAMID_TO_GROUND,
+    GeneratorType.PYRAMID_2,
+]
+"""Objects of these types extend downwards, until they hit one of the objects before them in the level."""
+
+
+_T = TypeVar("_T")
+
+
+def _cached_geometry(method: Callable[[Any], _T]) -> Callable[[Any], _T]:
+    """
+    Keeps the result of a method of a level object, until the object is marked dirty or rendered again.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self) -> _T:
+        try:
+            return self._geometry[name]
+        except KeyError:
+            value = self._geometry[name] = method(self)
+
+            return value
+
+    return wrapper
+
+
+@lru_cache(2**5)
+def _ending_graphics(ending_offset: int, rom_generation: int) -> tuple[array, ...]:
+    """
+    Reads the blocks of the graphic at the end of a level, row by row.
+
+    :param ending_offset: Which of the ending graphics to read, depending on the object set.
+    :param rom_generation: The generation of the ROM, so the graphic is read again, after the ROM changed.
+    """
+    rom = ROM()
+
+    # todo magic number
+    rom_offset = ENDING_OBJECT_OFFSET + ending_offset * 0x60
+
+    return tuple(
+        array(
+            BLOCK_TYPECODE, (rom.get_byte(rom_offset + y * ENDING_PAGE_WIDTH + x - 1) for x in range(ENDING_PAGE_WIDTH))
+        )
+        for y in range(ENDING_GRAPHIC_HEIGHT)
+    )
+
+
+def _repeat_to_length(pattern: array, length: int) -> array:
+    """
+    Repeats the pattern, until it is the given length, cutting off the last repetition, if necessary.
+    """
+    if not pattern or length <= 0:
+        return array(pattern.typecode)
+
+    return (pattern * -(-length // len(pattern)))[:length]
+
 
 class LevelObject(GeneratorObject):
     def __init__(
@@ -73,12 +139,21 @@ class LevelObject(GeneratorObject):
         index: int,
         size_minimal: bool = False,
     ):
+        self._geometry: dict[str, Any] = {}
+        self._scaled_rects: dict[int, QRect] = {}
+
         self.object_set = ObjectSet(object_set)
 
         self.graphics_set = graphics_set
         self._position = Point(0, 0)
         self._ignore_rendered_position = False
 
+        self._dirty = True
+        self.rect = QRect()
+
+        self._image = QImage()
+        self._image_key: Optional[tuple] = None
+
         self.palette_group = tuple(tuple(c for c in pal) for pal in palette_group)
 
         self.index_in_level = index
@@ -92,12 +167,72 @@ class LevelObject(GeneratorObject):
         self.size_minimal = size_minimal
 
         if self.size_minimal:
-            self.ground_level = 0
+            self._ground_level = 0
         else:
-            self.ground_level = GROUND
+            self._ground_level = GROUND
 
         self.render()
 
+    @property
+    def palette_group(self) -> tuple[tuple[int, ...], ...]:
+        return self._palette_group
+
+    @palette_group.setter
+    def palette_group(self, palette_group: tuple[tuple[int, ...], ...]):
+        if getattr(self, "_palette_group", None) != palette_group:
+            self._dirty = True
+
+        self._palette_group = palette_group
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Whether the data, position, length or palette of the object changed, since it was last rendered.
+        """
+        return self._dirty
+
+    def mark_dirty(self):
+        self._dirty = True
+        self._geometry.clear()
+
+    @property
+    def ground_level(self) -> int:
+        return self._ground_level
+
+    @ground_level.setter
+    def ground_level(self, ground_level: int):
+        self._ground_level = ground_level
+
+        self.mark_dirty()
+
+    @property
+    @_cached_geometry
+    def depends_on_ground(self) -> bool:
+        return self.orientation in GROUND_DEPENDENT_GENERATORS
+
+    @property
+    @_cached_geometry
+    def ground_dependency_rect(self) -> QRect:
+        """
+        The part of the level, in which objects before this one can stop it from reaching the ground. Empty, if the
+        object does not reach down to the ground.
+        """
+        if self.orientation == GeneratorType.HORIZ_TO_GROUND:
+            width = self.length + 1
+        elif self.orientation in [GeneratorType.PYRAMID_TO_GROUND, GeneratorType.PYRAMID_2]:
+            # pyramids grow 2 blocks wider every row
+            width = 2 * (self.ground_level - self.position.y)
+        else:
+            return QRect()
+
+        return QRect(self.position.x, self.position.y, width, self.ground_level - self.position.y)
+
+    def depends_on(self, rect: QRect) -> bool:
+        """
+        Whether an object with the given rect, coming before this object, could change its size.
+        """
+        return self.depends_on_ground and self.ground_dependency_rect.intersects(rect)
+
     @property
     def domain(self) -> int:
         return (self.data[0] & 0b1110_0000) >> 5
@@ -155,6 +290,8 @@ class LevelObject(GeneratorObject):
     def obj_index(self, value: int):
         self.data[2] = value
 
+        self.mark_dirty()
+
     @property
     def object_info(self):
         return self.object_set.number, self.domain, self.obj_index
@@ -185,6 +322,8 @@ class LevelObject(GeneratorObject):
                 except IndexError:
                     self.data.append(value)
 
+                self.mark_dirty()
+
     @property
     def secondary_length(self) -> int:
         if self.size == 3:
@@ -203,20 +342,28 @@ class LevelObject(GeneratorObject):
     def render(self):
         self._render()
 
+    def render_if_dirty(self):
+        """
+        Renders the object, only if it changed since the last time. Otherwise, the rendered blocks are still valid.
+        """
+        if self._dirty:
+            self._render()
+
     def _render(self):
-        try:
-            self.index_in_level = self.objects_ref.index(self)
-        except ValueError:
-            # the object has not been added yet, so stick with the one given in the constructor
-            pass
+        previous_rect = self.rect
 
-        blocks_to_draw = []
+        # the data might have been changed directly
+        self._geometry.clear()
 
-        if self.orientation == GeneratorType.TO_THE_SKY:
-            for _ in range(self.position.y):
-                blocks_to_draw.extend(self.blocks[0 : self.scale.width])
+        # work these out once, instead of for every block
+        blocks = array(BLOCK_TYPECODE, self.blocks)
+        scale = self.scale
+        rendered_size = self.rendered_size
 
-            blocks_to_draw.extend(self.blocks[-self.scale.width :])
+        blocks_to_draw = array(BLOCK_TYPECODE)
+
+        if self.orientation == GeneratorType.TO_THE_SKY:
+            blocks_to_draw = blocks[0 : scale.width] * self.position.y + blocks[-scale.width :]
 
         elif self.orientation == GeneratorType.DESERT_PIPE_BOX:
             # segments are the horizontal sections, which are 8 blocks long
@@ -225,39 +372,37 @@ class LevelObject(GeneratorObject):
 
             is_pipe_box_type_b = self.obj_index // 0x10 == 4
 
-            rows_per_box = self.scale.height
+            rows_per_box = scale.height
             lines_per_row = 4
 
-            segment_width = self.scale.width
+            segment_width = scale.width
             segments = (self.length + 1) * 2
 
+            lines = []
+
             for row_number in range(rows_per_box):
                 for line in range(lines_per_row):
                     if is_pipe_box_type_b and row_number > 0 and line == 0:
                         # in pipebox type b we do not repeat the horizontal beams
                         line += 1
 
-                    start = line * segment_width
-                    stop = start + segment_width
-
-                    for segment_number in range(segments):
-                        blocks_to_draw.extend(self.blocks[start:stop])
+                    lines.append(line)
 
             if is_pipe_box_type_b:
                 # draw another open row
-                start = segment_width
+                lines.append(1)
             else:
                 # draw the first row again to close the box
-                start = 0
+                lines.append(0)
 
-            stop = start + segment_width
+            for line in lines:
+                start = line * segment_width
+                stop = start + segment_width
 
-            for segment_number in range(segments):
-                blocks_to_draw.extend(self.blocks[start:stop])
+                line_blocks = blocks[start:stop] * segments
 
-            # every line repeats the last block again for some reason
-            for end_of_line in range(len(blocks_to_draw), 0, -(self.rendered_size.width - 1)):
-                blocks_to_draw.insert(end_of_line, blocks_to_draw[end_of_line - 1])
+                # every line repeats the last block again for some reason
+                blocks_to_draw.extend(line_blocks + line_blocks[-1:])
 
         elif self.orientation in [
             GeneratorType.DIAG_DOWN_LEFT,
@@ -265,68 +410,71 @@ class LevelObject(GeneratorObject):
             GeneratorType.DIAG_UP_RIGHT,
             GeneratorType.DIAG_WEIRD,
         ]:
+            blank = array(BLOCK_TYPECODE, [BLANK])
+
             if self.ending == EndType.UNIFORM:
-                left = [BLANK]
-                right = [BLANK]
-                slopes = self.blocks
+                left = blank
+                right = blank
+                slopes = blocks
 
             elif self.ending == EndType.END_ON_TOP_OR_LEFT:
                 if self.orientation in [GeneratorType.DIAG_DOWN_RIGHT, GeneratorType.DIAG_UP_RIGHT]:
-                    fill_block = self.blocks[0:1]
-                    slopes = self.blocks[1:]
+                    fill_block = blocks[0:1]
+                    slopes = blocks[1:]
 
                     left = fill_block
-                    right = [BLANK]
+                    right = blank
                 elif self.orientation == GeneratorType.DIAG_DOWN_LEFT:
-                    fill_block = self.blocks[-1:]
-                    slopes = self.blocks[0:-1]
+                    fill_block = blocks[-1:]
+                    slopes = blocks[0:-1]
 
                     right = fill_block
-                    left = [BLANK]
+                    left = blank
 
                 else:
-                    fill_block = self.blocks[0:1]
-                    slopes = self.blocks[1:]
+                    fill_block = blocks[0:1]
+                    slopes = blocks[1:]
 
-                    right = [BLANK]
+                    right = blank
                     left = fill_block
 
             elif self.ending == EndType.END_ON_BOTTOM_OR_RIGHT:
-                fill_block = self.blocks[-1:]
-                slopes = self.blocks[0:-1]
+                fill_block = blocks[-1:]
+                slopes = blocks[0:-1]
 
-                left = [BLANK]
+                left = blank
                 right = fill_block
             else:
                 # todo other two ends not used with diagonals?
                 warn(f"{self.name} was not rendered.", RuntimeWarning)
-                self.rendered_blocks = []
+                self.rendered_blocks = array(BLOCK_TYPECODE)
+                self._dirty = False
                 return
 
             rows = []
 
-            if self.scale.height > self.scale.width:
-                slope_width = self.scale.width
+            if scale.height > scale.width:
+                slope_width = scale.width
             else:
                 slope_width = len(slopes)
 
-            for y in range(self.rendered_size.height):
-                amount_right = (y // self.scale.height) * slope_width
-                amount_left = self.rendered_size.width - slope_width - amount_right
+            for y in range(rendered_size.height):
+                amount_right = (y // scale.height) * slope_width
+                amount_left = rendered_size.width - slope_width - amount_right
 
-                offset = y % self.scale.height
+                offset = y % scale.height
 
-                rows.append(amount_left * left + slopes[offset : offset + slope_width] + amount_right * right)
+                rows.append(left * amount_left + slopes[offset : offset + slope_width] + right * amount_right)
 
             if self.orientation in [GeneratorType.DIAG_UP_RIGHT]:
                 for row in rows:
                     row.reverse()
 
             if self.orientation in [GeneratorType.DIAG_DOWN_RIGHT, GeneratorType.DIAG_UP_RIGHT]:
-                if not self.scale.height > self.scale.width:
+                if not scale.height > scale.width:
                     rows.reverse()
 
-            if self.orientation == GeneratorType.DIAG_DOWN_RIGHT and self.scale.height > self.scale.width:
+            if self.orientation == GeneratorType.DIAG_DOWN_RIGHT and scale.height > scale.width:
                 # special case for 60 degree platform wire down right
                 for row in rows:
                     row.reverse()
@@ -337,195 +485,164 @@ class LevelObject(GeneratorObject):
         elif self.orientation in [GeneratorType.PYRAMID_TO_GROUND, GeneratorType.PYRAMID_2]:
             # since pyramids grow horizontally in both directions when extending
             # we need to check for new ground every time it grows
-            rendered_size = self.rendered_size
-
-            blank = self.blocks[0]
-            left_slope = self.blocks[1]
-            left_fill = self.blocks[2]
-            right_fill = self.blocks[3]
-            right_slope = self.blocks[4]
+            blank, left_slope, left_fill, right_fill, right_slope = (blocks[index : index + 1] for index in range(5))
 
             for y in range(rendered_size.height):
-                blank_blocks = (rendered_size.width // 2) - (y + 1)
+                blank_blocks = blank * ((rendered_size.width // 2) - (y + 1))
                 middle_blocks = y  # times two
 
-                blocks_to_draw.extend(blank_blocks * [blank])
-
-                blocks_to_draw.append(left_slope)
-                blocks_to_draw.extend(middle_blocks * [left_fill] + middle_blocks * [right_fill])
-                blocks_to_draw.append(right_slope)
-
-                blocks_to_draw.extend(blank_blocks * [blank])
+                blocks_to_draw.extend(
+                    blank_blocks + left_slope + left_fill * middle_blocks + right_fill * middle_blocks + right_slope
+                )
+                blocks_to_draw.extend(blank_blocks)
 
         elif self.orientation == GeneratorType.ENDING:
-            page_width = 16
-            page_limit = page_width - self.position.x % page_width
-
-            for y in range(SKY, GROUND - 1):
-                blocks_to_draw.append(self.blocks[0])
-                blocks_to_draw.extend([self.blocks[1]] * (self.rendered_size.width))
+            page_limit = ENDING_PAGE_WIDTH - self.position.x % ENDING_PAGE_WIDTH
 
-            # todo magic number
-            # ending graphics
-            rom_offset = ENDING_OBJECT_OFFSET + self.object_set.get_ending_offset() * 0x60
+            # the ending object is seemingly always 1 block too wide (going into the next screen), so the last block
+            # of every line is cut off
+            line_length = rendered_size.width
 
-            rom = ROM()
+            line = (blocks[0:1] + blocks[1:2] * rendered_size.width)[:line_length]
 
-            ending_graphic_height = 6
             floor_height = 1
 
-            y_offset = GROUND - floor_height - ending_graphic_height
+            y_offset = GROUND - floor_height - ENDING_GRAPHIC_HEIGHT
+            rows_below = (GROUND - 1) - SKY - y_offset - ENDING_GRAPHIC_HEIGHT
+
+            graphic_start = page_limit + 1
+            graphic_end = graphic_start + ENDING_PAGE_WIDTH
 
-            for y in range(ending_graphic_height):
-                for x in range(page_width):
-                    block_index = rom.get_byte(rom_offset + y * page_width + x - 1)
+            blocks_to_draw = line * y_offset
 
-                    block_position = (y_offset + y) * (self.rendered_size.width + 1) + x + page_limit + 1
-                    blocks_to_draw[block_position] = block_index
+            for graphic_row in _ending_graphics(self.object_set.get_ending_offset(), ROM.generation):
+                blocks_to_draw.extend(
+                    line[:graphic_start] + graphic_row[: max(0, line_length - graphic_start)] + line[graphic_end:]
+                )
 
-            # the ending object is seemingly always 1 block too wide (going into the next screen)
-            for end_of_line in range(len(blocks_to_draw) - 1, 0, -(self.rendered_size.width + 1)):
-                del blocks_to_draw[end_of_line]
+            blocks_to_draw.extend(line * rows_below)
 
         elif self.orientation == GeneratorType.VERTICAL:
             if self.ending == EndType.UNIFORM:
-                for _ in range(self.length + 1):
-                    for y in range(self.scale.height):
-                        for x in range(self.rendered_size.width):
-                            blocks_to_draw.append(self.blocks[y * self.scale.height + x % self.scale.width])
+                for y in range(scale.height):
+                    blocks_to_draw.extend(
+                        _repeat_to_length(
+                            array(
+                                BLOCK_TYPECODE,
+                                (blocks[y * scale.height + x] for x in range(min(scale.width, rendered_size.width))),
+                            ),
+                            rendered_size.width,
+                        )
+                    )
+
+                blocks_to_draw *= self.length + 1
 
             elif self.ending == EndType.END_ON_TOP_OR_LEFT:
                 # in case the drawn object is smaller than its actual size
-                for y in range(min(self.scale.height, self.rendered_size.height)):
-                    offset = y * self.scale.width
-                    blocks_to_draw.extend(self.blocks[offset : offset + self.scale.width])
+                blocks_to_draw = blocks[0 : min(scale.height, rendered_size.height) * scale.width]
 
-                additional_rows = self.rendered_size.height - self.scale.height
+                additional_rows = rendered_size.height - scale.height
 
                 # assume only the last row needs to repeat
                 # todo true for giant blocks?
                 if additional_rows > 0:
-                    last_row = self.blocks[-self.scale.width :]
-
-                    for _ in range(additional_rows):
-                        blocks_to_draw.extend(last_row)
+                    blocks_to_draw.extend(blocks[-scale.width :] * additional_rows)
 
             elif self.ending == EndType.END_ON_BOTTOM_OR_RIGHT:
-                additional_rows = self.rendered_size.height - self.scale.height
+                additional_rows = rendered_size.height - scale.height
 
                 # assume only the first row needs to repeat
                 # todo true for giant blocks?
                 if additional_rows > 0:
-                    last_row = self.blocks[0 : self.scale.width]
-
-                    for _ in range(additional_rows):
-                        blocks_to_draw.extend(last_row)
+                    blocks_to_draw.extend(blocks[0 : scale.width] * additional_rows)
 
                 # in case the drawn object is smaller than its actual size
-                for y in range(min(self.scale.height, self.rendered_size.height)):
-                    offset = y * self.scale.width
-                    blocks_to_draw.extend(self.blocks[offset : offset + self.scale.width])
+                blocks_to_draw.extend(blocks[0 : min(scale.height, rendered_size.height) * scale.width])
 
             elif self.ending == EndType.TWO_ENDS:
                 # object exists on ships
-                top_row = self.blocks[0 : self.scale.width]
-                bottom_row = self.blocks[-self.scale.width :]
+                top_row = blocks[0 : scale.width]
+                bottom_row = blocks[-scale.width :]
 
                 blocks_to_draw.extend(top_row)
 
-                additional_rows = self.rendered_size.height - 2
+                additional_rows = rendered_size.height - 2
 
                 # repeat second to last row
                 if additional_rows > 0:
-                    for _ in range(additional_rows):
-                        blocks_to_draw.extend(self.blocks[-2 * self.scale.width : -self.scale.width])
+                    blocks_to_draw.extend(blocks[-2 * scale.width : -scale.width] * additional_rows)
 
-                if self.rendered_size.height > 1:
+                if rendered_size.height > 1:
                     blocks_to_draw.extend(bottom_row)
 
         elif self.orientation in [GeneratorType.HORIZONTAL, GeneratorType.HORIZ_TO_GROUND, GeneratorType.HORIZONTAL_2]:
             if self.ending == EndType.UNIFORM and not self.is_4byte:
-                for y in range(self.rendered_size.height):
-                    if self.is_single_block:
-                        blocks_to_draw.extend(self.blocks[: self.scale.width])
-                    else:
-                        blocks_to_draw.extend(
-                            self.blocks[y * self.scale.width : (y + 1) * self.scale.width] * (self.length + 1)
-                        )
+                if self.is_single_block:
+                    blocks_to_draw = blocks[: scale.width] * rendered_size.height
+                else:
+                    for y in range(rendered_size.height):
+                        blocks_to_draw.extend(blocks[y * scale.width : (y + 1) * scale.width] * (self.length + 1))
 
             elif self.ending == EndType.UNIFORM and self.is_4byte:
                 # 4 byte objects
-                top = self.blocks[0:1]
-                bottom = self.blocks[-1:]
+                top = blocks[0:1] * rendered_size.width
+                bottom = blocks[-1:] * rendered_size.width
 
                 if self.orientation == GeneratorType.HORIZONTAL_2:
-                    for _ in range(0, self.rendered_size.height - 1):
-                        blocks_to_draw.extend(self.rendered_size.width * top)
-
-                    blocks_to_draw.extend(self.rendered_size.width * bottom)
+                    blocks_to_draw = top * (rendered_size.height - 1) + bottom
                 else:
-                    blocks_to_draw.extend(self.rendered_size.width * top)
-
-                    for _ in range(1, self.rendered_size.height):
-                        blocks_to_draw.extend(self.rendered_size.width * bottom)
+                    blocks_to_draw = top + bottom * (rendered_size.height - 1)
 
             elif self.ending == EndType.END_ON_TOP_OR_LEFT:
-                for y in range(self.rendered_size.height):
-                    offset = y * self.scale.width
+                for y in range(rendered_size.height):
+                    offset = y * scale.width
 
-                    blocks_to_draw.append(self.blocks[offset])
-
-                    for x in range(1, self.rendered_size.width):
-                        blocks_to_draw.append(self.blocks[offset + 1])
+                    blocks_to_draw.append(blocks[offset])
+                    blocks_to_draw.extend(blocks[offset + 1 : offset + 2] * (rendered_size.width - 1))
 
             elif self.ending == EndType.END_ON_BOTTOM_OR_RIGHT:
-                for y in range(self.rendered_size.height):
-                    offset = y * self.scale.width
-
-                    for x in range(self.rendered_size.width - 1):
-                        blocks_to_draw.append(self.blocks[offset])
+                for y in range(rendered_size.height):
+                    offset = y * scale.width
 
-                    blocks_to_draw.append(self.blocks[offset + self.scale.width - 1])
+                    blocks_to_draw.extend(blocks[offset : offset + 1] * (rendered_size.width - 1))
+                    blocks_to_draw.append(blocks[offset + scale.width - 1])
 
             elif self.ending == EndType.TWO_ENDS:
-                if self.scale.width > len(self.blocks):
+                if scale.width > len(blocks):
                     raise ValueError(f"{self} does not provide enough blocks to fill a row.")
                 else:
                     start = 0
-                    end = self.scale.width
+                    end = scale.width
 
-                for y in range(self.scale.height):
-                    new_start = y * self.scale.width
-                    new_end = (y + 1) * self.scale.width
+                for y in range(scale.height):
+                    new_start = y * scale.width
+                    new_end = (y + 1) * scale.width
 
-                    if new_end > len(self.blocks):
+                    if new_end > len(blocks):
                         # repeat the last line of blocks to fill the object
                         pass
                     else:
                         start = new_start
                         end = new_end
 
-                    left, *middle, right = self.blocks[start:end]
+                    left, *middle, right = blocks[start:end]
 
                     blocks_to_draw.append(left)
-                    blocks_to_draw.extend(middle * (self.rendered_size.width - 2))
+                    blocks_to_draw.extend(array(BLOCK_TYPECODE, middle) * (rendered_size.width - 2))
                     blocks_to_draw.append(right)
 
-                if not len(blocks_to_draw) % self.scale.height == 0:
+                if not len(blocks_to_draw) % scale.height == 0:
                     warn(f"Blocks to draw are not divisible by height. {self}", RuntimeWarning)
 
-                new_width = int(len(blocks_to_draw) / self.scale.height)
+                new_width = int(len(blocks_to_draw) / scale.height)
 
                 top_row = blocks_to_draw[0:new_width]
                 middle_blocks = blocks_to_draw[new_width : new_width * 2]
                 bottom_row = blocks_to_draw[-new_width:]
 
-                blocks_to_draw = top_row
-
-                for y in range(1, self.rendered_size.height - 1):
-                    blocks_to_draw.extend(middle_blocks)
+                blocks_to_draw = top_row + middle_blocks * (rendered_size.height - 2)
 
-                if self.rendered_size.height > 1:
+                if rendered_size.height > 1:
                     blocks_to_draw.extend(bottom_row)
         else:
             if not self.orientation == GeneratorType.SINGLE_BLOCK_OBJECT:
@@ -533,31 +650,101 @@ class LevelObject(GeneratorObject):
                 # breakpoint()
 
             if self.name.lower() == "black boss room background":
-                blocks_to_draw = SCREEN_WIDTH * SCREEN_HEIGHT * [self.blocks[0]]
+                blocks_to_draw = blocks[0:1] * (SCREEN_WIDTH * SCREEN_HEIGHT)
 
         # for not yet implemented objects and single block objects
         if blocks_to_draw:
             self.rendered_blocks = blocks_to_draw
         else:
-            self.rendered_blocks = self.blocks
+            self.rendered_blocks = blocks
 
         self.rect = QRect(
             self.rendered_position.x, self.rendered_position.y, self.rendered_size.width, self.rendered_size.height
         )
+        self._scaled_rects.clear()
+
+        self._dirty = False
+
+        if self.rect != previous_rect:
+            self._mark_dependents_dirty(previous_rect, self.rect)
+
+    def _mark_dependents_dirty(self, *rects: QRect):
+        """
+        Objects reaching down to the ground stop at the objects before them, so they need to be rendered again, when
+        the rect of one of those changes, where it could be in their way.
+
+        Dependents, whose rect changes in turn, mark their own dependents, when they are rendered.
+        """
+        index = self.index_in_level
+
+        if not (0 <= index < len(self.objects_ref) and self.objects_ref[index] is self):
+            # not part of a level (yet)
+            return
+
+        for level_object in self.objects_ref[index + 1 :]:
+            if any(level_object.depends_on(rect) for rect in rects):
+                level_object.mark_dirty()
 
     def draw(self, painter: QPainter, block_length, transparent, blocks: Optional[list[Block]] = None):
-        size = self.rendered_size
-        size.width = max(size.width, 1)
+        if not self.rendered_blocks:
+            return
+
+        if self._ignore_rendered_position:
+            x = y = 0
+        else:
+            x, y = self.rect.x(), self.rect.y()
+
+        painter.drawImage(x * block_length, y * block_length, self._get_image(block_length, transparent, blocks))
+
+    def _get_image(self, block_length, transparent, blocks: Optional[list[Block]] = None) -> QImage:
+        """
+        Returns all rendered blocks of the object drawn into a single image, so it can be drawn with one call.
+
+        The image is kept, as long as nothing it depends on changes. The rect stands in for the objects around it,
+        since those only ever change the size of an object.
+        """
+        image_key = (
+            bytes(self.data),
+            self.object_set.number,
+            self.graphics_set,
+            self.palette_group,
+            self.rect.size().toTuple(),
+            ROM.generation,
+            block_length,
+            self.selected,
+            transparent,
+            blocks is None,
+        )
+
+        if image_key != self._image_key:
+            self._image = self._compose_image(block_length, transparent, blocks)
+            self._image_key = image_key
+
+        return self._image
+
+    def _compose_image(self, block_length, transparent, blocks: Optional[list[Block]] = None) -> QImage:
+        # use the rect of the last render, instead of working out the rendered size again
+        width = max(self.rect.width(), 1)
+        height = -(-len(self.rendered_blocks) // width)
+
+        image = QImage(width * block_length, height * block_length, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+
+        painter = QPainter(image)
 
         for index, block_index in enumerate(self.rendered_blocks):
             if block_index == BLANK:
                 continue
 
-            x = self.rendered_position.x + index % size.width
-            y = self.rendered_position.y + index // size.width
+            x = index % width
+            y = index // width
 
             self._draw_block(painter, block_index, x, y, block_length, transparent, blocks=blocks)
 
+        painter.end()
+
+        return image
+
     def _draw_block(
         self, painter: QPainter, block_index, x, y, block_length, transparent, blocks: Optional[list[Block]] = None
     ):
@@ -580,10 +767,30 @@ class LevelObject(GeneratorObject):
             transparent=transparent,
         )
 
-    def move_by(self, dx: int, dy: int):
-        self.position = Point(self.position.x + dx, self.position.y + dy)
+    def move_by(self, dx: int, dy: int, *, render: bool = True):
+        """
+        :param render: Whether to render the object right away. Otherwise, it is only marked dirty, so multiple objects
+            can be moved, before rendering them.
+        """
+        self._move_to(Point(self.position.x + dx, self.position.y + dy))
+
+        if render:
+            self._render()
+
+    def get_rect(self, block_length=1) -> QRect:
+        # the rect is only updated, when the object is rendered, and callers are free to change the one they get
+        self.render_if_dirty()
+
+        if block_length == 1:
+            return QRect(self.rect)
+
+        if block_length not in self._scaled_rects:
+            self._scaled_rects[block_length] = super(LevelObject, self).get_rect(block_length)
+
+        return QRect(self._scaled_rects[block_length])
 
     @property
+    @_cached_geometry
     def position(self) -> PointProtocol:
         y = self.data[0] & 0b0001_1111
         x = self.data[1]
@@ -598,6 +805,11 @@ class LevelObject(GeneratorObject):
 
     @position.setter
     def position(self, position: PointProtocol) -> None:
+        self._move_to(position)
+
+        self._render()
+
+    def _move_to(self, position: PointProtocol):
         x, y = position.x, position.y
 
         # todo also check for the upper bounds
@@ -616,13 +828,18 @@ class LevelObject(GeneratorObject):
         self.data[0] = (self.data[0] & 0b1110_0000) + y
         self.data[1] = x
 
-        self._render()
+        self.mark_dirty()
 
     @property
     def rendered_position(self) -> PointProtocol:
         if self._ignore_rendered_position:
             return Point(0, 0)
-        elif self.orientation == GeneratorType.TO_THE_SKY:
+
+        return self._rendered_position()
+
+    @_cached_geometry
+    def _rendered_position(self) -> PointProtocol:
+        if self.orientation == GeneratorType.TO_THE_SKY:
             return Point(self.position.x, SKY)
         elif self.orientation in [GeneratorType.DIAG_UP_RIGHT]:
             return Point(self.position.x, self.position.y - self.rendered_size.height + 1)
@@ -639,10 +856,12 @@ class LevelObject(GeneratorObject):
         return self.position
 
     @property
+    @_cached_geometry
     def scale(self) -> SizeProtocol:
         return Size(self.definition.bmp_width, self.definition.bmp_height)
 
     @property
+    @_cached_geometry
     def rendered_size(self) -> SizeProtocol:
         if self.orientation == GeneratorType.TO_THE_SKY:
             return Size(self.scale.width, self.position.y + self.scale.height - 1)
@@ -759,6 +978,7 @@ class LevelObject(GeneratorObject):
     def vertically_expands(self) -> bool:
         return bool(self.expands() & EXPANDS_VERT)
 
+    @_cached_geometry
     def expands(self):
         expands = EXPANDS_NOT
 
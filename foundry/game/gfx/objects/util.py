@@ -41,6 +41,8 @@ def change_level_object_type(item: LevelObject, increment: bool):
     item.data[0] |= new_domain << 5
     item.data[2] = new_type
 
+    item.mark_dirty()
+
     if item.is_4byte and item.size == 3:
         item.data.append(0)
 
@@ -61,6 +63,7 @@ def set_level_object_width(item: LevelObject, width: int, *, render: bool = True
     else:
         if item.is_4byte:
             item.data[3] = max(0, min(0xFF, width - item.position.x))
+            item.mark_dirty()
         else:
             raise NotImplementedError(f"Resize is not possible for {item}")
 
@@ -77,6 +80,7 @@ def set_level_object_height(item: LevelObject, height: int, *, render: bool = Tr
     else:
         if item.is_4byte:
             item.data[3] = max(0, min(0xFF, height - item.position.y))
+            item.mark_dirty()
         else:
             raise NotImplementedError(f"Resize is not possible for {item}")
 
@@ -84,11 +88,12 @@ def set_level_object_height(item: LevelObject, height: int, *, render: bool = Tr
         item._render()
 
 
-def resize_level_object(item: LevelObject, width_difference: int, height_difference: int):
+def resize_level_object(item: LevelObject, width_difference: int, height_difference: int, *, render: bool = True):
     if width_difference:
         set_level_object_width(item, item.position.x + width_difference, render=False)
 
     if height_difference:
         set_level_object_height(item, item.position.y + height_difference, render=False)
 
-    item._render()
+    if render:
+        item._render()
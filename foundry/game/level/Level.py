@@ -9,6 +9,7 @@ from foundry.game.gfx.objects.EnemyItemFactory import EnemyItemFactory
 from foundry.game.gfx.objects.Jump import Jump
 from foundry.game.gfx.objects.LevelObject import LevelObject
 from foundry.game.gfx.objects.LevelObjectFactory import LevelObjectFactory
+from foundry.game.gfx.objects.util import resize_level_object
 from foundry.game.level import LevelByteData
 from foundry.game.level.LevelLike import LevelLike
 from foundry.game.level.util import get_worlds, load_level_offsets
@@ -79,6 +80,9 @@ class Level(LevelLike):
         self.jumps: List[Jump] = []
         self.enemies: List[EnemyObject] = []
 
+        self._jumps_by_screen: Optional[List[Optional[Jump]]] = None
+        self.jumps_changed.connect(self._on_jumps_changed)
+
         if self.layout_address == self.enemy_offset == 0:
             # probably loaded to become an m3l
             return
@@ -136,6 +140,36 @@ class Level(LevelLike):
     def jumps_changed(self):
         return self._signal_emitter.jumps_changed
 
+    def jump_at(self, x: int, y: int) -> Optional[Jump]:
+        """
+        Returns the jump, whose area contains the given block, or None, if there is none.
+
+        The jumps are looked up by the screen the block is on, in a table, that is made anew after jumps_changed was
+        emitted. Code changing the jumps of a level needs to emit it.
+        """
+        screen_index = Jump.screen_index_at(x, y, self.is_vertical)
+
+        if screen_index is None:
+            return None
+
+        if self._jumps_by_screen is None:
+            self._jumps_by_screen = []
+
+            for jump in self.jumps:
+                if jump.screen_index >= len(self._jumps_by_screen):
+                    self._jumps_by_screen.extend([None] * (jump.screen_index + 1 - len(self._jumps_by_screen)))
+
+                if self._jumps_by_screen[jump.screen_index] is None:
+                    self._jumps_by_screen[jump.screen_index] = jump
+
+        if screen_index >= len(self._jumps_by_screen):
+            return None
+
+        return self._jumps_by_screen[screen_index]
+
+    def _on_jumps_changed(self):
+        self._jumps_by_screen = None
+
     def reload(self):
         (_, header_and_object_data), (_, enemy_data) = self.to_bytes()
 
@@ -195,6 +229,7 @@ class Level(LevelLike):
         self.jumps.clear()
 
         if not data or data[0] == 0xFF:
+            self.jumps_changed.emit()
             return
 
         while True:
@@ -219,6 +254,8 @@ class Level(LevelLike):
             if data[0] == 0xFF:
                 break
 
+        self.jumps_changed.emit()
+
     def _update_level_size(self):
         self.object_size_on_disk = self.current_object_size()
         self.enemy_size_on_disk = self.current_enemies_size()
@@ -523,12 +560,16 @@ class Level(LevelLike):
             elif isinstance(obj, EnemyObject):
                 objects = self.enemies
 
+            old_index = objects.index(obj)
             objects.remove(obj)
 
             index = objects.index(object_currently_in_the_foreground) + 1
 
             objects.insert(index, obj)
 
+            if isinstance(obj, LevelObject):
+                self._object_moved_in_order(obj, old_index, index)
+
     def bring_to_background(self, level_objects: List[Union[LevelObject, EnemyObject]]):
         for obj in level_objects:
             intersecting_objects = self.get_intersecting_objects(obj)
@@ -545,12 +586,73 @@ class Level(LevelLike):
             else:
                 raise TypeError()
 
+            old_index = objects.index(obj)
             objects.remove(obj)
 
             index = objects.index(object_currently_in_the_background)
 
             objects.insert(index, obj)
 
+            if isinstance(obj, LevelObject):
+                self._object_moved_in_order(obj, old_index, index)
+
+    def _object_moved_in_order(self, level_object: LevelObject, old_index: int, new_index: int):
+        self._object_order_changed(level_object.get_rect(), min(old_index, new_index))
+
+        if level_object.depends_on_ground:
+            # the objects before it changed
+            level_object.mark_dirty()
+
+    def _object_order_changed(self, rect: QRect, start_index: int):
+        """
+        Updates the indexes of the level objects, after an object was added, removed or moved in the list.
+
+        Objects reaching down to the ground depend on the objects before them. Those, that the object with the given
+        rect could be in the way of, are marked to be rendered again.
+
+        :param rect: The rect of the object, that was added, removed or moved.
+        :param start_index: The first index in the list of objects, whose objects came after the object before, or do
+            so now.
+        """
+        for index, level_object in enumerate(self.objects):
+            level_object.index_in_level = index
+
+            if index >= start_index and level_object.depends_on(rect):
+                level_object.mark_dirty()
+
+    def move_objects(self, objects: List[Union[LevelObject, EnemyObject]], dx: int, dy: int):
+        """
+        Moves all given objects by the same amount of blocks.
+
+        The level objects are rendered only after all of them were moved, so objects reaching down to the ground are
+        not rendered against objects, that are about to be moved away as well.
+        """
+        for obj in objects:
+            if isinstance(obj, LevelObject):
+                obj.move_by(dx, dy, render=False)
+            else:
+                obj.move_by(dx, dy)
+
+        self._render_dirty_objects()
+
+    def resize_objects(
+        self, objects: List[Union[LevelObject, EnemyObject]], width_difference: int, height_difference: int
+    ):
+        """
+        Resizes all given level objects, that can be resized, rendering them only after all of them were resized.
+        Enemies can not be resized and are ignored.
+        """
+        for obj in objects:
+            if isinstance(obj, LevelObject):
+                resize_level_object(obj, width_difference, height_difference, render=False)
+
+        self._render_dirty_objects()
+
+    def _render_dirty_objects(self):
+        # objects only depend on the objects before them, so rendering in order renders every object at most once
+        for level_object in self.objects:
+            level_object.render_if_dirty()
+
     @overload
     def get_intersecting_objects(self, obj: LevelObject) -> List[LevelObject]:
         ...
@@ -627,6 +729,8 @@ class Level(LevelLike):
         obj = self.object_factory.from_properties(domain, object_index, x, y, length, index)
         self.objects.insert(index, obj)
 
+        self._object_order_changed(obj.get_rect(), index + 1)
+
         return obj
 
     def add_enemy(self, object_index: int, x: int, y: int, index: int = -1) -> EnemyObject:
@@ -644,11 +748,13 @@ class Level(LevelLike):
     def add_jump(self):
         self.jumps.append(Jump.from_properties(0, 0, 0, 0))
 
+        self.jumps_changed.emit()
         self.data_changed.emit()
 
     def remove_jump(self, jump: Jump):
         self.jumps.remove(jump)
 
+        self.jumps_changed.emit()
         self.data_changed.emit()
 
     def index_of(self, obj: Union[EnemyObject, LevelObject]) -> int:
@@ -670,7 +776,10 @@ class Level(LevelLike):
             return
 
         if isinstance(obj, LevelObject):
+            index = self.objects.index(obj)
             self.objects.remove(obj)
+
+            self._object_order_changed(obj.get_rect(), index)
         elif isinstance(obj, EnemyObject):
             self.enemies.remove(obj)
 
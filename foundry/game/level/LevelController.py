@@ -13,6 +13,7 @@ from foundry.game.gfx.objects.EnemyItem import EnemyObject
 from foundry.game.gfx.objects.LevelObject import LevelObject
 from foundry.game.level.Level import Level, get_level_name_suggestion
 from foundry.game.level.LevelControlled import LevelControlled
+from foundry.game.level.LevelPrefetcher import LevelPrefetcher
 from foundry.game.level.LevelRef import LevelRef
 from foundry.gui.AutoScrollEditor import AutoScrollEditor
 from foundry.gui.BlockViewer import BlockViewerController as BlockViewer
@@ -21,6 +22,7 @@ from foundry.gui.JumpEditor import JumpEditor
 from foundry.gui.LevelSelector import LevelSelector
 from foundry.gui.LevelView import undoable
 from foundry.gui.PaletteViewer import PaletteViewer
+from foundry.gui.settings import SETTINGS
 
 
 def require_safe_to_change(function: Callable):
@@ -41,6 +43,7 @@ class LevelController:
         self.level_ref = level_ref
         self.level_ref.data_changed.connect(self.on_level_data_changed)
         self.level_selector_last_level = None
+        self.prefetcher = LevelPrefetcher(SETTINGS["level_prefetch_size"])
 
     @property
     def changes(self) -> list[DataProtocol]:
@@ -51,6 +54,9 @@ class LevelController:
     def screenshot(self) -> QPixmap:
         return self.parent.level_view.make_screenshot()
 
+    def save_screenshot(self, path: str):
+        self.parent.level_view.save_screenshot(path)
+
     @property
     def title_suggestion(self) -> str:
         return f"{self.parent.level_view.level_ref.level.name} - {ROM.name}"
@@ -219,6 +225,7 @@ class LevelController:
 
         if isinstance(self.level_ref.level, Level):
             self.level_ref.level.jumps[index] = jump
+            self.level_ref.level.jumps_changed.emit()
             self.parent.jump_list.item(index).setText(str(jump))
 
     @undoable
@@ -269,11 +276,16 @@ class LevelController:
         )
 
     def update_level(self, level_name: str, object_data_offset: int, enemy_data_offset: int, object_set: int):
-        self.level_ref.load_level(level_name, object_data_offset, enemy_data_offset, object_set)
+        prefetched_level = self.prefetcher.take(object_data_offset, enemy_data_offset, object_set)
+
+        self.level_ref.load_level(level_name, object_data_offset, enemy_data_offset, object_set, prefetched_level)
         self.update_gui_for_level()
         self.parent.update_title()
         self.parent.side_palette.load_from_level(self.level_ref.level)
 
+        self.prefetcher.max_size = SETTINGS["level_prefetch_size"]
+        self.prefetcher.prefetch_around(self.level_ref.level)
+
     def update_gui_for_level(self):
         self.parent.side_palette.load_from_level(self.level_ref.level)
 
@@ -13,6 +13,7 @@ from foundry.game.level.LevelRef import LevelRef
 from foundry.gui.ContextMenu import ContextMenu
 from foundry.gui.JumpCreator import JumpCreator
 from foundry.gui.JumpList import JumpList
+from foundry.gui.LevelMinimap import LevelMinimap
 from foundry.gui.LevelSelector import select_by_world_and_level
 from foundry.gui.LevelSizeBar import LevelSizeBar
 from foundry.gui.LevelView import LevelView
@@ -190,6 +191,11 @@ class LevelManager:
         create_toolbar(self.parent, "Object Viewer", [self.parent.object_toolbar_viewer], Qt.LeftToolBarArea)
         create_toolbar(self.parent, "Object Toolbar", [self.parent.object_toolbar], Qt.LeftToolBarArea)
 
+        self.parent.minimap = LevelMinimap(self.parent, level_ref, self.parent.level_view, self.parent.scroll_panel)
+
+        minimap_toolbar = create_toolbar(self.parent, "Minimap", [self.parent.minimap], Qt.BottomToolBarArea)
+        minimap_toolbar.setAllowedAreas(Qt.TopToolBarArea | Qt.BottomToolBarArea)
+
         # Warning List Creation
 
         self.parent.warning_list = WarningList(self.parent, level_ref, self.parent.level_view, self.parent.object_list)
@@ -330,6 +336,10 @@ class LevelManager:
     def screenshot(self, controller: LevelController) -> QPixmap:
         return controller.screenshot
 
+    @require_enabled
+    def save_screenshot(self, path: str, *, controller: LevelController):
+        controller.save_screenshot(path)
+
     @require_enabled
     def cut(self, controller: LevelController):
         controller.cut()
@@ -0,0 +1,173 @@
+from collections import OrderedDict
+from typing import Optional
+
+from PySide6.QtCore import QObject, QTimer
+
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level
+from foundry.game.level.util import Level as LevelMeta
+from foundry.game.level.util import get_world_levels
+from foundry.smb3parse.objects.object_set import WORLD_MAP_OBJECT_SET
+
+LevelKey = tuple[int, int, int]
+"""The object data offset, enemy data offset and object set number identifying a level inside the ROM."""
+
+DEFAULT_PREFETCH_SIZE = 8
+
+
+class LevelPrefetcher(QObject):
+    """
+    A bounded cache of levels, that were parsed and rendered ahead of time, while the editor was idle.
+
+    After a level is loaded, the level it jumps to and its neighbours on the world map are queued up. They are
+    parsed one at a time from the event loop, so the GUI stays responsive. Loading one of them afterwards takes it
+    out of the cache instead of parsing it again.
+
+    Every write to the ROM invalidates the cache, since the cached levels might not reflect the ROM anymore.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PREFETCH_SIZE, parent: Optional[QObject] = None):
+        super(LevelPrefetcher, self).__init__(parent)
+
+        self.max_size = max_size
+
+        self._levels: OrderedDict[LevelKey, Level] = OrderedDict()
+        self._queue: list[LevelKey] = []
+        self._rom_generation = ROM.generation
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._prefetch_next)
+
+    def __contains__(self, key: LevelKey) -> bool:
+        self._check_rom_generation()
+
+        return key in self._levels
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def clear(self):
+        self._levels.clear()
+        self._queue.clear()
+        self._timer.stop()
+
+    def take(self, object_data_offset: int, enemy_data_offset: int, object_set: int) -> Optional[Level]:
+        """
+        Removes a prefetched level from the cache.
+
+        The level is handed out and not kept, since it will likely be edited afterwards.
+
+        :return: The prefetched level or None, if it was not prefetched (yet).
+        """
+        self._check_rom_generation()
+
+        key = (object_data_offset, enemy_data_offset, object_set)
+
+        if key in self._queue:
+            self._queue.remove(key)
+
+        return self._levels.pop(key, None)
+
+    def prefetch(self, keys: list[LevelKey]):
+        """
+        Queues up levels to be parsed and rendered, whenever the event loop is idle.
+
+        Earlier keys are prefetched first. Levels, that were already prefetched, are marked as recently used.
+        """
+        self._check_rom_generation()
+
+        for key in reversed(keys[: self.max_size]):
+            if key in self._levels:
+                self._levels.move_to_end(key)
+            elif key not in self._queue:
+                self._queue.insert(0, key)
+
+        del self._queue[self.max_size :]
+
+        if self._queue and self.max_size > 0:
+            self._timer.start()
+
+    def prefetch_around(self, level: Level):
+        """
+        Queues up the level the given level jumps to and its neighbours on the world map.
+        """
+        self.prefetch([key for key in neighbouring_levels(level) if key != level_key(level)])
+
+    def _prefetch_next(self):
+        self._check_rom_generation()
+
+        if not self._queue or not ROM.is_loaded():
+            return
+
+        key = self._queue.pop(0)
+        object_data_offset, enemy_data_offset, object_set = key
+
+        try:
+            level = Level("", object_data_offset, enemy_data_offset, object_set)
+        except (IndexError, ValueError):
+            # not every pointer in a hacked ROM leads to a valid level, the user will see the error, when loading it
+            level = None
+
+        if level is not None:
+            self._levels[key] = level
+
+            while len(self._levels) > self.max_size:
+                self._levels.popitem(last=False)
+
+        if self._queue:
+            self._timer.start()
+
+    def _check_rom_generation(self):
+        if self._rom_generation != ROM.generation:
+            self._rom_generation = ROM.generation
+            self._levels.clear()
+
+
+def level_key(level: Level) -> LevelKey:
+    return level.header_offset, level.enemy_offset, level.object_set_number
+
+
+def level_meta_key(level_meta: LevelMeta) -> LevelKey:
+    """
+    The key of a level from levels.json, matching the offsets the LevelSelector loads it with.
+    """
+    return level_meta.generator_pointer - Level.HEADER_LENGTH, level_meta.enemy_pointer, level_meta.tileset
+
+
+def neighbouring_levels(level: Level) -> list[LevelKey]:
+    """
+    Finds the levels, that are likely to be loaded after the given one.
+
+    Those are the level the given one jumps to, for example through a pipe, and the levels next to it on the world
+    maps it appears on.
+    """
+    keys: list[LevelKey] = []
+
+    if not level.attached_to_rom:
+        return keys
+
+    if level.has_next_area:
+        keys.append((level.next_area_objects, level.next_area_enemies + 1, level.next_area_object_set))
+
+    for level_meta in Level.offsets:
+        if level_meta.generator_pointer != level.object_offset:
+            continue
+
+        for location in level_meta.display_information.locations:
+            world_levels = get_world_levels(location.world, Level.offsets)
+
+            try:
+                index = world_levels.index(level_meta)
+            except ValueError:
+                # another level took its spot in this world
+                continue
+
+            for neighbour in world_levels[max(0, index - 1) : index + 2]:
+                if neighbour is level_meta or neighbour.tileset == WORLD_MAP_OBJECT_SET:
+                    continue
+
+                keys.append(level_meta_key(neighbour))
+
+    return keys
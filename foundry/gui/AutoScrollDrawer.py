@@ -1,5 +1,9 @@
-from PySide6.QtCore import QPoint, QPointF, QRectF, QSizeF
-from PySide6.QtGui import QBrush, QPainter, QPen, QPolygonF, Qt
+from functools import lru_cache
+from typing import Optional
+
+from attr import attrs
+from PySide6.QtCore import QLineF, QPoint, QPointF, QRectF, QSizeF
+from PySide6.QtGui import QBrush, QPainter, QPen, QPolygonF, Qt, QTransform
 
 from foundry.game.File import ROM
 from foundry.game.gfx.drawable.Block import Block
@@ -26,17 +30,68 @@ WATER_LEVEL_SCROLL = 5
 _ASCROLL_SCREEN_HEIGHT = 12
 
 
+@attrs(slots=True, auto_attribs=True)
+class AutoScrollMovement:
+    """
+    A single movement of the screen along the autoscroll path.
+
+    Attributes
+    ----------
+    accelerating: bool
+        Whether the screen changes its speed during this movement.
+    start: QPointF
+        Where the movement starts.
+    lines: list[QLineF]
+        The lines the screen moves along.
+    """
+
+    accelerating: bool
+    start: QPointF
+    lines: list[QLineF]
+
+
+@attrs(slots=True, auto_attribs=True)
+class AutoScrollPath:
+    """
+    The path the center of the screen takes through an autoscrolling level, in pixels, at a block length of 16.
+
+    Attributes
+    ----------
+    movements: list[AutoScrollMovement]
+        The movements along the path, in order.
+    end: QPointF
+        Where the path ends.
+    screen_polygon: QPolygonF
+        The area of the level, that the screen passes over.
+    """
+
+    movements: list[AutoScrollMovement]
+    end: QPointF
+    screen_polygon: QPolygonF
+
+
+def get_auto_scroll_path(auto_scroll_row: int, level: Level) -> Optional[AutoScrollPath]:
+    """
+    The path of the autoscroll, if the type of autoscroll set by the row can be visualized.
+
+    The path only depends on the autoscroll tables in the ROM and where Mario starts, so it is cached and only made
+    anew, if one of them changed.
+    """
+    _, mario_y = level.header.mario_position()
+
+    return _auto_scroll_path(auto_scroll_row, mario_y, ROM.generation)
+
+
+@lru_cache(2**4)
+def _auto_scroll_path(auto_scroll_row: int, mario_y: int, _rom_generation: int) -> Optional[AutoScrollPath]:
+    return _AutoScrollSimulation(auto_scroll_row, mario_y).run()
+
+
 class AutoScrollDrawer:
     def __init__(self, auto_scroll_row: int, level: Level):
         self.auto_scroll_row = auto_scroll_row
         self.level = level
 
-        self.current_pos = QPointF()
-        self.horizontal_speed = 0
-        self.vertical_speed = 0
-
-        self.rom = ROM()
-
         self.pixel_length = 1
 
         self.acceleration_pen = Qt.NoPen
@@ -44,8 +99,6 @@ class AutoScrollDrawer:
         self.scroll_pen = Qt.NoPen
         self.scroll_brush = Qt.NoBrush
 
-        self.screen_polygon = QPolygonF()
-
     def draw(self, painter: QPainter, block_length: int):
         self.pixel_length = block_length / Block.WIDTH
 
@@ -58,6 +111,57 @@ class AutoScrollDrawer:
         painter.setPen(self.scroll_pen)
         painter.setBrush(self.scroll_brush)
 
+        path = get_auto_scroll_path(self.auto_scroll_row, self.level)
+
+        if path is None:
+            return
+
+        for movement in path.movements:
+            if movement.accelerating:
+                painter.setPen(self.acceleration_pen)
+                painter.setBrush(self.acceleration_brush)
+            else:
+                painter.setPen(self.scroll_pen)
+                painter.setBrush(self.scroll_brush)
+
+            # circle at start of new command
+            painter.drawEllipse(movement.start * self.pixel_length, 4 * self.pixel_length, 4 * self.pixel_length)
+
+            for line in movement.lines:
+                painter.drawLine(QLineF(line.p1() * self.pixel_length, line.p2() * self.pixel_length))
+
+        stop_marker = QRectF(QPoint(0, 0), QSizeF(10, 10) * self.pixel_length)
+        stop_marker.moveCenter(path.end * self.pixel_length)
+
+        painter.setPen(Qt.NoPen)
+        painter.drawRect(stop_marker)
+
+        painter.setPen(self.scroll_pen)
+        painter.setBrush(self.scroll_brush)
+
+        painter.setOpacity(0.2)
+        painter.drawPolygon(QTransform.fromScale(self.pixel_length, self.pixel_length).map(path.screen_polygon))
+
+
+class _AutoScrollSimulation:
+    """
+    Follows the movement commands of an autoscroll routine in the ROM, to find the path the screen takes.
+    """
+
+    def __init__(self, auto_scroll_row: int, mario_y: int):
+        self.auto_scroll_row = auto_scroll_row
+        self.mario_y = mario_y
+
+        self.current_pos = QPointF()
+        self.horizontal_speed = 0
+        self.vertical_speed = 0
+
+        self.rom = ROM()
+
+        self.movements: list[AutoScrollMovement] = []
+        self.screen_polygon = QPolygonF()
+
+    def run(self) -> Optional[AutoScrollPath]:
         auto_scroll_type_index = self.auto_scroll_row >> 4
         auto_scroll_routine_index = self.auto_scroll_row & 0b0001_1111
 
@@ -68,39 +172,26 @@ class AutoScrollDrawer:
             UP_RIGHT_DIAG_SCROLL,
         ]:
             # not visualized
-            return
+            return None
         elif auto_scroll_type_index not in [HORIZONTAL_SCROLL_0, HORIZONTAL_SCROLL_1]:
             # illegal value, those appear in the vanilla ROM, though; so error out
-            return
+            return None
 
         first_movement_command_index = (self.rom.int(AScroll_HorizontalInitMove + auto_scroll_routine_index) + 1) % 256
         last_movement_command_index = (self.rom.int(AScroll_HorizontalInitMove + auto_scroll_routine_index + 1)) % 256
 
-        self.horizontal_speed = 0
-        self.vertical_speed = 0
-
-        self.current_pos = self._determine_auto_scroll_start(block_length)
+        self.current_pos = self._determine_auto_scroll_start()
 
         for movement_command_index in range(first_movement_command_index, last_movement_command_index + 1):
 
             movement_command = self.rom.int(AScroll_Movement + movement_command_index)
             movement_repeat = self.rom.int(AScroll_MovementRepeat + movement_command_index)
 
-            self._execute_movement_command(painter, movement_command, movement_repeat)
+            self._execute_movement_command(movement_command, movement_repeat)
 
-        stop_marker = QRectF(QPoint(0, 0), QSizeF(10, 10) * self.pixel_length)
-        stop_marker.moveCenter(self.current_pos)
+        return AutoScrollPath(self.movements, QPointF(self.current_pos), self.screen_polygon)
 
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(stop_marker)
-
-        painter.setPen(self.scroll_pen)
-        painter.setBrush(self.scroll_brush)
-
-        painter.setOpacity(0.2)
-        painter.drawPolygon(self.screen_polygon)
-
-    def _execute_movement_command(self, painter: QPainter, command: int, repeat: int):
+    def _execute_movement_command(self, command: int, repeat: int):
         h_updates_per_tick = 4  # got those by reading the auto scroll routine
         v_updates_per_tick = 2
 
@@ -155,37 +246,29 @@ class AutoScrollDrawer:
 
                 for _ in range(repeat):
                     for sub_command, sub_repeat in zip(movement_loop_commands, movement_loop_repeats):
-                        self._execute_movement_command(painter, sub_command, sub_repeat)
+                        self._execute_movement_command(sub_command, sub_repeat)
 
                 return
 
-        if is_acceleration_command and (h_acceleration or v_acceleration):
-            painter.setPen(self.acceleration_pen)
-            painter.setBrush(self.acceleration_brush)
-        else:
-            painter.setPen(self.scroll_pen)
-            painter.setBrush(self.scroll_brush)
+        accelerating = is_acceleration_command and bool(h_acceleration or v_acceleration)
 
-        # circle at start of new command
-        painter.drawEllipse(self.current_pos, 4 * self.pixel_length, 4 * self.pixel_length)
+        movement = AutoScrollMovement(accelerating, QPointF(self.current_pos), [])
+        self.movements.append(movement)
 
         self._add_points_for_position(self.current_pos)
 
-        if is_acceleration_command and (h_acceleration or v_acceleration):
+        if accelerating:
             for _ in range(movement_ticks):
                 self.horizontal_speed += h_acceleration
                 self.vertical_speed += v_acceleration
 
-                old_pos = self.current_pos
+                old_pos = QPointF(self.current_pos)
 
-                self.current_pos += (
-                    QPointF(
-                        h_updates_per_tick * self.horizontal_speed / 256, v_updates_per_tick * self.vertical_speed / 256
-                    )
-                    * self.pixel_length
+                self.current_pos += QPointF(
+                    h_updates_per_tick * self.horizontal_speed / 256, v_updates_per_tick * self.vertical_speed / 256
                 )
 
-                painter.drawLine(old_pos, self.current_pos)
+                movement.lines.append(QLineF(old_pos, self.current_pos))
                 self._add_points_for_position(self.current_pos)
         else:
             old_pos = QPointF(self.current_pos)
@@ -193,9 +276,9 @@ class AutoScrollDrawer:
             h_movement = h_updates_per_tick * self.horizontal_speed / 256 * movement_ticks * repeat
             v_movement = v_updates_per_tick * self.vertical_speed / 256 * movement_ticks * repeat
 
-            self.current_pos += QPointF(h_movement, v_movement) * self.pixel_length
+            self.current_pos += QPointF(h_movement, v_movement)
 
-            painter.drawLine(old_pos, self.current_pos)
+            movement.lines.append(QLineF(old_pos, self.current_pos))
 
             self._add_points_for_line(old_pos, self.current_pos)
 
@@ -222,18 +305,16 @@ class AutoScrollDrawer:
         self.screen_polygon = self.screen_polygon.united(QPolygonF.fromList(point_list))
 
     def _rect_for_point(self, pos: QPointF):
-        top_right = pos + QPointF(SCREEN_WIDTH // 2, -_ASCROLL_SCREEN_HEIGHT // 2) * self.pixel_length * Block.WIDTH
-        bottom_right = pos + QPoint(SCREEN_WIDTH // 2, _ASCROLL_SCREEN_HEIGHT // 2) * self.pixel_length * Block.WIDTH
+        top_right = pos + QPointF(SCREEN_WIDTH // 2, -_ASCROLL_SCREEN_HEIGHT // 2) * Block.WIDTH
+        bottom_right = pos + QPoint(SCREEN_WIDTH // 2, _ASCROLL_SCREEN_HEIGHT // 2) * Block.WIDTH
 
-        top_left = top_right - QPointF(SCREEN_WIDTH, 0) * self.pixel_length * Block.WIDTH
-        bottom_left = bottom_right - QPointF(SCREEN_WIDTH, 0) * self.pixel_length * Block.WIDTH
+        top_left = top_right - QPointF(SCREEN_WIDTH, 0) * Block.WIDTH
+        bottom_left = bottom_right - QPointF(SCREEN_WIDTH, 0) * Block.WIDTH
 
         return top_left, top_right, bottom_right, bottom_left
 
-    def _determine_auto_scroll_start(self, block_length: int) -> QPointF:
+    def _determine_auto_scroll_start(self) -> QPointF:
         # only support horizontal levels for now
-        _, mario_y = self.level.header.mario_position()
-
-        scroll_x, scroll_y = SCREEN_WIDTH // 2, min(mario_y + 2, GROUND - _ASCROLL_SCREEN_HEIGHT // 2)
+        scroll_x, scroll_y = SCREEN_WIDTH // 2, min(self.mario_y + 2, GROUND - _ASCROLL_SCREEN_HEIGHT // 2)
 
-        return QPointF(scroll_x, scroll_y) * block_length
+        return QPointF(scroll_x, scroll_y) * Block.WIDTH
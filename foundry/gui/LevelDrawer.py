@@ -1,13 +1,18 @@
+from collections.abc import Iterator
+from enum import Enum
+from functools import cache, lru_cache
 from itertools import product
-from typing import Tuple
+from typing import Optional, Tuple, Union
 
-from PySide6.QtCore import QPoint, QRect
+from attr import attrs
+from PySide6.QtCore import QLine, QPoint, QRect, QSize
 from PySide6.QtGui import QBrush, QColor, QImage, QPainter, QPen, Qt
 
 from foundry import data_dir
 from foundry.core.graphics_set.GraphicsSet import GraphicsSet
 from foundry.core.palette import NESPalette
 from foundry.core.palette.PaletteGroup import MutablePaletteGroup
+from foundry.game.EnemyDefinitions import get_enemy_metadata
 from foundry.game.File import ROM
 from foundry.game.gfx.drawable import apply_selection_overlay
 from foundry.game.gfx.drawable.Block import Block
@@ -24,6 +29,7 @@ from foundry.game.gfx.objects.ObjectLike import (
     EXPANDS_VERT,
 )
 from foundry.game.level.Level import Level
+from foundry.game.ObjectSet import ObjectSet
 from foundry.gui.AutoScrollDrawer import AutoScrollDrawer
 from foundry.gui.settings import SETTINGS
 from foundry.smb3parse.constants import OBJ_AUTOSCROLL, TILESET_BACKGROUND_BLOCKS
@@ -82,6 +88,13 @@ ITEM_ARROW = _load_from_png(53, 53)
 EMPTY_IMAGE = _load_from_png(0, 53)
 
 
+MARIO_POWERUP_Y_OFFSETS = [0, 0x20, 0x60, 0x40, 0xC0, 0xA0, 0x80, 0x60, 0xC0]
+
+CULLING_MARGIN = 2
+"""Objects this many blocks outside of the visible part of the level are still drawn."""
+
+SELECTION_OUTLINE_COLOR = QColor(0x00, 0x00, 0x00, 0x80)
+
 SPECIAL_BACKGROUND_OBJECTS = [
     "blue background",
     "starry background",
@@ -90,6 +103,135 @@ SPECIAL_BACKGROUND_OBJECTS = [
 ]
 
 
+class OverlayKind(Enum):
+    NONE = 0
+    PIPE = 1
+    DOOR = 2
+    ITEM_BLOCK = 3
+    INVISIBLE_ITEM = 4
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class Overlay:
+    """
+    How the drawer marks an object of a certain type, for example the item inside of a '?' block.
+
+    Attributes
+    ----------
+    kind: OverlayKind
+        What the overlay shows, which decides where it is drawn and which setting turns it off.
+    icon: Optional[QImage]
+        The icon to draw. For pipes and doors it is replaced by NO_JUMP, when they do not lead anywhere.
+    fill: bool
+        Whether the icon is repeated over the whole width of the object.
+    trigger_corner: Optional[Qt.Corner]
+        The corner of the object, that the trigger offset is relative to. The position of the object, if None.
+    trigger_offset: tuple[int, int]
+        Where a pipe or door triggers a jump, relative to the trigger corner, in blocks.
+    special_background: bool
+        Whether the object fills the rest of the level with its first block.
+    """
+
+    kind: OverlayKind = OverlayKind.NONE
+    icon: Optional[QImage] = None
+    fill: bool = True
+    trigger_corner: Optional[Qt.Corner] = None
+    trigger_offset: tuple[int, int] = (0, 0)
+    special_background: bool = False
+
+
+def _overlay_from_name(name: str) -> Overlay:
+    name = name.lower()
+
+    special_background = name in SPECIAL_BACKGROUND_OBJECTS
+
+    if "pipe" in name and "can go" in name:
+        if "left" in name:
+            # leftward pipes trigger on the column to the left of the opening
+            return Overlay(OverlayKind.PIPE, LEFT_ARROW, False, Qt.BottomRightCorner, (-1, 0), special_background)
+        elif "right" in name:
+            return Overlay(OverlayKind.PIPE, RIGHT_ARROW, False, special_background=special_background)
+        elif "down" in name:
+            return Overlay(OverlayKind.PIPE, DOWN_ARROW, False, special_background=special_background)
+        else:
+            # upwards pipes trigger on the second to last row
+            return Overlay(OverlayKind.PIPE, UP_ARROW, False, Qt.BottomLeftCorner, (0, -1), special_background)
+
+    elif "door" == name or "door (can go" in name or "invisible door" in name or "red invisible note" in name:
+        # jumps seemingly trigger on the bottom block
+        icon = UP_ARROW if "note" in name else DOWN_ARROW
+
+        return Overlay(OverlayKind.DOOR, icon, False, trigger_offset=(0, 1), special_background=special_background)
+
+    # "?" - blocks, note blocks, wooden blocks and bricks
+    elif "'?' with" in name or "brick with" in name or "bricks with" in name or "block with" in name:
+        if "flower" in name:
+            icon = FIRE_FLOWER
+        elif "leaf" in name:
+            icon = LEAF
+        elif "continuous star" in name:
+            icon = CONTINUOUS_STAR
+        elif "star" in name:
+            icon = NORMAL_STAR
+        elif "multi-coin" in name:
+            icon = MULTI_COIN
+        elif "coin" in name:
+            icon = COIN
+        elif "1-up" in name:
+            icon = ONE_UP
+        elif "vine" in name:
+            icon = VINE
+        elif "p-switch" in name:
+            icon = P_SWITCH
+        else:
+            icon = EMPTY_IMAGE
+
+        return Overlay(OverlayKind.ITEM_BLOCK, icon, special_background=special_background)
+
+    elif "invisible" in name:
+        if "coin" in name:
+            icon = INVISIBLE_COIN
+        elif "1-up" in name:
+            icon = INVISIBLE_1_UP
+        else:
+            icon = EMPTY_IMAGE
+
+        return Overlay(OverlayKind.INVISIBLE_ITEM, icon, special_background=special_background)
+
+    elif "silver coins" in name:
+        return Overlay(OverlayKind.INVISIBLE_ITEM, SILVER_COIN, special_background=special_background)
+
+    return Overlay(special_background=special_background)
+
+
+@cache
+def object_overlays(object_set_number: int) -> tuple[Overlay, ...]:
+    """
+    The overlays of all object types of an object set, in the order of their definitions.
+    """
+    definitions = ObjectSet(object_set_number).definitions.__root__
+
+    return tuple(_overlay_from_name(definition.description) for definition in definitions)
+
+
+@cache
+def enemy_overlays() -> tuple[Overlay, ...]:
+    """
+    The overlays of all enemy and item types. Only invisible doors have one, so far.
+    """
+    return tuple(
+        _overlay_from_name(definition.description) if "invisible door" in definition.description.lower() else Overlay()
+        for definition in get_enemy_metadata().__root__
+    )
+
+
+def get_overlay(level_object: Union[LevelObject, EnemyObject]) -> Overlay:
+    if isinstance(level_object, LevelObject):
+        return object_overlays(level_object.object_set.number)[level_object.type]
+    else:
+        return enemy_overlays()[level_object.type]
+
+
 def get_blocks(level: Level) -> list[Block]:
     palette_group = MutablePaletteGroup.from_tileset(level.object_set_number, level.header.object_palette_index)
     palette_group = tuple(tuple(c for c in pal) for pal in palette_group)
@@ -99,20 +241,106 @@ def get_blocks(level: Level) -> list[Block]:
     return [Block(i, palette_group, graphics_set, tsa_data) for i in range(0x100)]
 
 
-def _block_from_index(block_index: int, level: Level) -> Block:
+def default_block_fills(level: Level) -> list[tuple[QRect, tuple[int, ...]]]:
     """
-    Returns the block at the given index, from the TSA table for the given level.
+    The blocks the level is filled with, before any objects are drawn on top.
 
-    :param block_index:
-    :param level:
-    :return:
+    :return: Rects in blocks, each filled with a row of blocks repeating from the left side of the level, in the order
+        they are filled in.
     """
+    fills = [(level.get_rect(), (TILESET_BACKGROUND_BLOCKS[level.object_set_number],))]
 
-    palette_group = MutablePaletteGroup.from_tileset(level.object_set_number, level.header.object_palette_index)
-    graphics_set = GraphicsSet.from_tileset(level.header.graphic_set_index)
-    tsa_data = ROM().get_tsa_data(level.object_set_number)
+    if level.object_set_number == DESERT_OBJECT_SET:
+        fills.append((QRect(0, GROUND - 1, level.width, 1), (86,)))
+    elif level.object_set_number == DUNGEON_OBJECT_SET:
+        fills.append((level.get_rect(), (140,)))  # background
+        fills.append((QRect(0, 0, level.width, 1), (139,)))  # ceiling
+        fills.append((QRect(0, GROUND - 2, level.width, 1), (20, 21)))  # floor
+        fills.append((QRect(0, GROUND - 1, level.width, 1), (22, 23)))
+    elif level.object_set_number == ICE_OBJECT_SET:
+        fills.append((level.get_rect(), (0x80,)))
+
+    return fills
 
-    return Block(block_index, tuple(tuple(c for c in pal) for pal in palette_group), graphics_set, tsa_data)
+
+@cache
+def _mario_actions() -> QImage:
+    mario_actions = QImage(str(data_dir / "mario.png"))
+
+    mario_actions.convertTo(QImage.Format_RGBA8888)
+
+    return mario_actions
+
+
+@lru_cache(2**5)
+def _mario_frame(start_action: int, powerup: int, block_length: int) -> QImage:
+    """
+    The frame of Mario in the given start action and power-up, scaled to cover 2 by 2 blocks.
+    """
+    x_offset = 32 * start_action
+    y_offset = MARIO_POWERUP_Y_OFFSETS[powerup]
+
+    return _mario_actions().copy(QRect(x_offset, y_offset, 32, 32)).scaled(2 * block_length, 2 * block_length)
+
+
+def drawn_bounds(level_object: Union[LevelObject, EnemyObject]) -> QRect:
+    """
+    The rect in blocks, that the object was last rendered into. Some objects draw more blocks, than their size
+    suggests, so this can be larger than their rect.
+    """
+    if isinstance(level_object, EnemyObject):
+        return level_object.drawn_bounds()
+
+    rect = level_object.get_rect()
+
+    width = max(rect.width(), 1)
+    height = -(-len(level_object.rendered_blocks) // width)
+
+    return rect.united(QRect(rect.x(), rect.y(), width, height))
+
+
+def covered_rect(level_object: Union[LevelObject, EnemyObject]) -> QRect:
+    """
+    The rect in blocks, that the object covers, when the level is drawn. Special backgrounds fill the rest of the
+    level, below and to the right of them.
+    """
+    if get_overlay(level_object).special_background:
+        x, y = level_object.position.x, level_object.position.y
+
+        return QRect(x, y, LEVEL_MAX_LENGTH, GROUND - y)
+
+    return drawn_bounds(level_object)
+
+
+def _draw_outline(painter: QPainter, rect: QRect, color: QColor):
+    """
+    Draws the same outline as drawRect with a pen of width 1 would, but draws every pixel exactly once.
+
+    Where the corners of a translucent outline are drawn twice, depends on how much of it is clipped, so the same
+    outline would look different when a level is drawn in parts.
+    """
+    x, y, width, height = rect.getRect()
+
+    painter.fillRect(QRect(x, y, width + 1, 1), color)
+    painter.fillRect(QRect(x, y + height, width + 1, 1), color)
+    painter.fillRect(QRect(x, y + 1, 1, height - 1), color)
+    painter.fillRect(QRect(x + width, y + 1, 1, height - 1), color)
+
+
+def _trigger_position(level_object: Union[LevelObject, EnemyObject], overlay: Overlay) -> tuple[int, int]:
+    """
+    The block, that the pipe or door needs to be in a jump area from, to lead somewhere.
+    """
+    if overlay.trigger_corner == Qt.BottomRightCorner:
+        x, y = level_object.get_rect().bottomRight().toTuple()
+    elif overlay.trigger_corner == Qt.BottomLeftCorner:
+        x, y = level_object.get_rect().bottomLeft().toTuple()
+    else:
+        x, y = level_object.position.x, level_object.position.y
+
+    x_offset, y_offset = overlay.trigger_offset
+
+    return x + x_offset, y + y_offset
 
 
 class LevelDrawer:
@@ -129,22 +357,42 @@ class LevelDrawer:
 
         self.block_length = Block.WIDTH
 
+        self._culling_rect = QRect()
+
+        self._palette_key: Optional[tuple] = None
+        self._bg_palette_group: tuple[tuple[int, ...], ...] = ()
+        self._spr_palette_group: tuple[tuple[int, ...], ...] = ()
+        self._blocks: list[Block] = []
+
+        self._brush_block_length = self.block_length
+        self._block_row_brushes: dict[tuple[int, ...], QBrush] = {}
+
+        self._icon_block_length = self.block_length
+        self._icons: dict[tuple[int, bool], QImage] = {}
+
         self.grid_pen = QPen(QColor(0x80, 0x80, 0x80, 0x80))
         self.grid_pen.setWidth(1)
         self.screen_pen = QPen(QColor(0xFF, 0x00, 0x00, 0xFF))
         self.screen_pen.setWidth(1)
 
-    def draw(self, painter: QPainter, level: Level):
-        self._draw_background(painter, level)
+    def draw(self, painter: QPainter, level: Level, visible_rect: Optional[QRect] = None):
+        """
+        Draws the level and everything on top of it, that is enabled.
+
+        :param painter: The painter to draw with.
+        :param level: The level to draw.
+        :param visible_rect: The part of the level, that is actually visible, in pixels. Objects outside of it, give
+            or take a margin, are neither rendered nor drawn. If None, the clip rect of the painter is used, or the
+            whole level, if the painter does not clip.
+        """
+        self._culling_rect = self._get_culling_rect(painter, level, visible_rect)
 
-        self._draw_default_graphics(painter, level)
+        self.apply_palettes(level)
+
+        self._draw_background(painter, level)
 
-        if level.object_set_number == DESERT_OBJECT_SET:
-            self._draw_desert_default_graphics(painter, level)
-        elif level.object_set_number == DUNGEON_OBJECT_SET:
-            self._draw_dungeon_default_graphics(painter, level)
-        elif level.object_set_number == ICE_OBJECT_SET:
-            self._draw_ice_default_graphics(painter, level)
+        for rect, block_indexes in default_block_fills(level):
+            self._fill_with_blocks(painter, rect, block_indexes)
 
         self._draw_objects(painter, level)
 
@@ -165,6 +413,36 @@ class LevelDrawer:
         if self.draw_autoscroll:
             self._draw_auto_scroll(painter, level)
 
+    def _get_culling_rect(self, painter: QPainter, level: Level, visible_rect: Optional[QRect]) -> QRect:
+        if visible_rect is None and painter.hasClipping():
+            visible_rect = painter.clipBoundingRect().toAlignedRect()
+
+        if visible_rect is None:
+            return level.get_rect()
+
+        left, top = visible_rect.left() // self.block_length, visible_rect.top() // self.block_length
+        right, bottom = visible_rect.right() // self.block_length, visible_rect.bottom() // self.block_length
+
+        culling_rect = QRect(QPoint(left, top), QPoint(right, bottom))
+
+        return culling_rect.adjusted(-CULLING_MARGIN, -CULLING_MARGIN, CULLING_MARGIN, CULLING_MARGIN)
+
+    def _is_visible(self, rect: QRect) -> bool:
+        """Whether a rect in blocks intersects with the visible part of the level, give or take the margin."""
+        # objects without a size still draw at least one block
+        return self._culling_rect.intersects(QRect(rect.topLeft(), rect.size().expandedTo(QSize(1, 1))))
+
+    def _visible_blocks(self, level: Level, rect: Optional[QRect] = None) -> Iterator[tuple[int, int]]:
+        """The positions of all blocks inside the given rect, or the level, that are visible."""
+        if rect is None:
+            rect = level.get_rect()
+
+        visible_rect = rect.intersected(self._culling_rect)
+
+        return product(
+            range(visible_rect.left(), visible_rect.right() + 1), range(visible_rect.top(), visible_rect.bottom() + 1)
+        )
+
     def _draw_background(self, painter: QPainter, level: Level):
         painter.save()
 
@@ -181,84 +459,118 @@ class LevelDrawer:
 
         painter.restore()
 
-    def _draw_dungeon_default_graphics(self, painter: QPainter, level: Level):
-        # draw_background
-        bg_block = _block_from_index(140, level)
+    def _fill_with_blocks(self, painter: QPainter, rect: QRect, block_indexes: tuple[int, ...]):
+        """
+        Fills the visible part of a rect in blocks with a row of blocks, repeating from the left side of the level.
+        """
+        visible_rect = rect.intersected(self._culling_rect)
 
-        for x, y in product(range(level.width), range(level.height)):
-            bg_block.draw(painter, x * self.block_length, y * self.block_length, self.block_length)
+        if visible_rect.isEmpty():
+            return
 
-        # draw ceiling
-        ceiling_block = _block_from_index(139, level)
+        pixel_rect = QRect(visible_rect.topLeft() * self.block_length, visible_rect.size() * self.block_length)
 
-        for x in range(level.width):
-            ceiling_block.draw(painter, x * self.block_length, 0, self.block_length)
+        painter.save()
 
-        # draw floor
-        upper_floor_blocks = [_block_from_index(20, level), _block_from_index(21, level)]
-        lower_floor_blocks = [_block_from_index(22, level), _block_from_index(23, level)]
+        painter.setBrushOrigin(0, 0)
+        painter.fillRect(pixel_rect, self._block_row_brush(block_indexes))
 
-        upper_y = (GROUND - 2) * self.block_length
-        lower_y = (GROUND - 1) * self.block_length
+        painter.restore()
 
-        for block_x in range(level.width):
-            pixel_x = block_x * self.block_length
+    def _block_row_brush(self, block_indexes: tuple[int, ...]) -> QBrush:
+        """
+        A brush with a texture of the given blocks next to each other, at the current block length.
 
-            upper_floor_blocks[block_x % 2].draw(painter, pixel_x, upper_y, self.block_length)
-            lower_floor_blocks[block_x % 2].draw(painter, pixel_x, lower_y, self.block_length)
+        The brushes are kept, until the block length or the blocks of the level change.
+        """
+        if self._brush_block_length != self.block_length:
+            self._brush_block_length = self.block_length
+            self._block_row_brushes.clear()
 
-    def _draw_desert_default_graphics(self, painter: QPainter, level: Level):
-        floor_level = (GROUND - 1) * self.block_length
-        floor_block_index = 86
+        if block_indexes not in self._block_row_brushes:
+            texture = QImage(
+                len(block_indexes) * self.block_length, self.block_length, QImage.Format_ARGB32_Premultiplied
+            )
+            texture.fill(Qt.transparent)
 
-        floor_block = _block_from_index(floor_block_index, level)
+            painter = QPainter(texture)
 
-        for x in range(level.width):
-            floor_block.draw(painter, x * self.block_length, floor_level, self.block_length)
+            for x, block_index in enumerate(block_indexes):
+                self._blocks[block_index].draw(painter, x * self.block_length, 0, self.block_length)
 
-    def _draw_ice_default_graphics(self, painter: QPainter, level: Level):
-        bg_block = _block_from_index(0x80, level)
+            painter.end()
 
-        for x, y in product(range(level.width), range(level.height)):
-            bg_block.draw(painter, x * self.block_length, y * self.block_length, self.block_length)
+            self._block_row_brushes[block_indexes] = QBrush(texture)
 
-    def _draw_default_graphics(self, painter: QPainter, level: Level):
-        bg_block = _block_from_index(TILESET_BACKGROUND_BLOCKS[level.object_set_number], level)
+        return self._block_row_brushes[block_indexes]
 
-        for x, y in product(range(level.width), range(level.height)):
-            bg_block.draw(painter, x * self.block_length, y * self.block_length, self.block_length)
+    def _update_palettes(self, level: Level):
+        """
+        Loads the palettes and blocks of the level, only if they could have changed since the last paint.
+        """
+        palette_key = (
+            level.object_set_number,
+            level.header.object_palette_index,
+            level.header.enemy_palette_index,
+            level.header.graphic_set_index,
+            ROM.generation,
+        )
 
-    def _draw_objects(self, painter: QPainter, level: Level):
-        bg_palette_group = tuple(
+        if palette_key == self._palette_key:
+            return
+
+        self._palette_key = palette_key
+
+        self._bg_palette_group = tuple(
             tuple(c for c in pal)
             for pal in MutablePaletteGroup.from_tileset(level.object_set_number, level.header.object_palette_index)
         )
-        spr_palette_group = tuple(
+        self._spr_palette_group = tuple(
             tuple(c for c in pal)
             for pal in MutablePaletteGroup.from_tileset(level.object_set_number, 8 + level.header.enemy_palette_index)
         )
 
-        blocks = get_blocks(level)
+        self._blocks = get_blocks(level)
+        self._block_row_brushes.clear()
+
+    def apply_palettes(self, level: Level):
+        """
+        Gives the objects and enemies of the level the palettes of the level, so they are rendered with them.
+        """
+        self._update_palettes(level)
+
+        bg_palette_group = self._bg_palette_group
+        spr_palette_group = self._spr_palette_group
+
+        # only objects, that were not given the current palettes yet, need to be touched
         for level_object in level.objects:
-            level_object.palette_group = bg_palette_group
+            if level_object.palette_group is not bg_palette_group:
+                level_object.palette_group = bg_palette_group
         for enemy in level.enemies:
-            enemy.palette_group = spr_palette_group
+            if enemy.palette_group is not spr_palette_group:
+                enemy.palette_group = spr_palette_group
 
-        for level_object in level.get_all_objects():
+    def _draw_objects(self, painter: QPainter, level: Level):
+        blocks = self._blocks
 
-            level_object.render()
+        for level_object in level.get_all_objects():
+            is_special_background = get_overlay(level_object).special_background
 
-            if level_object.name.lower() in SPECIAL_BACKGROUND_OBJECTS and isinstance(level_object, LevelObject):
-                width = LEVEL_MAX_LENGTH
-                height = GROUND - level_object.position.y
+            if isinstance(level_object, LevelObject):
+                # objects are in the order they depend on each other, so the ones before are up to date already
+                level_object.render_if_dirty()
 
-                blocks_to_draw = [level_object.blocks[0]] * width * height
+            bounds = covered_rect(level_object)
 
-                for index, block_index in enumerate(blocks_to_draw):
-                    x = level_object.position.x + index % width
-                    y = level_object.position.y + index // width
+            if not self._is_visible(bounds):
+                continue
 
-                    level_object._draw_block(painter, block_index, x, y, self.block_length, False, blocks=blocks)
+            if is_special_background:
+                # spans the rest of the level, so only fill the visible part of it
+                for x, y in self._visible_blocks(level, bounds):
+                    level_object._draw_block(
+                        painter, level_object.blocks[0], x, y, self.block_length, False, blocks=blocks
+                    )
             else:
                 if isinstance(level_object, LevelObject):
                     level_object.draw(painter, self.block_length, self.transparency, blocks=blocks)
@@ -266,176 +578,118 @@ class LevelDrawer:
                     level_object.draw(painter, self.block_length, self.transparency)
 
             if level_object.selected:
-                painter.save()
-
-                pen = QPen(QColor(0x00, 0x00, 0x00, 0x80))
-                pen.setWidth(1)
-                painter.setPen(pen)
-                painter.drawRect(level_object.get_rect(self.block_length))
-
-                painter.restore()
+                _draw_outline(painter, level_object.get_rect(self.block_length), SELECTION_OUTLINE_COLOR)
 
     def _draw_overlays(self, painter: QPainter, level: Level):
         painter.save()
 
         for level_object in level.get_all_objects():
-            name = level_object.name.lower()
+            overlay = get_overlay(level_object)
+
+            if overlay.kind == OverlayKind.NONE or not self._is_visible(level_object.get_rect()):
+                continue
 
-            # only handle this specific enemy item for now
-            if isinstance(level_object, EnemyObject) and "invisible door" not in name:
+            if overlay.kind == OverlayKind.PIPE and not self.draw_jumps_on_objects:
+                continue
+            elif overlay.kind == OverlayKind.ITEM_BLOCK and not self.draw_items_in_blocks:
+                continue
+            elif overlay.kind == OverlayKind.INVISIBLE_ITEM and not self.draw_invisible_items:
                 continue
 
+            image = overlay.icon
+
             pos = level_object.get_rect(self.block_length).topLeft()
             rect = level_object.get_rect(self.block_length)
 
-            # invisible coins, for example, expand and need to have multiple overlays drawn onto them
-            # set true by default, since for most overlays it doesn't matter
-            fill_object = True
-
             # pipe entries
-            if "pipe" in name and "can go" in name:
-                if not self.draw_jumps_on_objects:
-                    continue
-
-                fill_object = False
-
+            if overlay.kind == OverlayKind.PIPE:
                 # center() is one pixel off for some reason
                 pos = rect.topLeft() + QPoint(*(rect.size() / 2).toTuple())
 
-                trigger_position = (level_object.position.x, level_object.position.y)
-
-                if "left" in name:
-                    image = LEFT_ARROW
-
+                if image is LEFT_ARROW:
                     pos.setX(rect.right())
                     pos.setY(pos.y() - self.block_length / 2)
 
-                    # leftward pipes trigger on the column to the left of the opening
-                    x, y = level_object.get_rect().bottomRight().toTuple()
-                    trigger_position = (x - 1, y)
-
-                elif "right" in name:
-                    image = RIGHT_ARROW
+                elif image is RIGHT_ARROW:
                     pos.setX(rect.left() - self.block_length)
                     pos.setY(pos.y() - self.block_length / 2)
 
-                elif "down" in name:
-                    image = DOWN_ARROW
-
+                elif image is DOWN_ARROW:
                     pos.setX(pos.x() - self.block_length / 2)
                     pos.setY(rect.top() - self.block_length)
                 else:
                     # upwards pipe
-                    image = UP_ARROW
-
                     pos.setX(pos.x() - self.block_length / 2)
                     pos.setY(rect.bottom())
 
-                    # upwards pipes trigger on the second to last row
-                    x, y = level_object.get_rect().bottomLeft().toTuple()
-                    trigger_position = (x, y - 1)
-
-                if not self._object_in_jump_area(level, trigger_position):
+                if not self._object_in_jump_area(level, _trigger_position(level_object, overlay)):
                     image = NO_JUMP
 
-            elif "door" == name or "door (can go" in name or "invisible door" in name or "red invisible note" in name:
-                fill_object = False
-
-                if "note" in name:
-                    image = UP_ARROW
-                else:
-                    # door
-                    image = DOWN_ARROW
-
+            elif overlay.kind == OverlayKind.DOOR:
                 pos.setY(rect.top() - self.block_length)
 
-                x, y = level_object.position.x, level_object.position.y
-
-                # jumps seemingly trigger on the bottom block
-                if not self._object_in_jump_area(level, (x, y + 1)):
+                if not self._object_in_jump_area(level, _trigger_position(level_object, overlay)):
                     image = NO_JUMP
 
-            # "?" - blocks, note blocks, wooden blocks and bricks
-            elif "'?' with" in name or "brick with" in name or "bricks with" in name or "block with" in name:
-                if not self.draw_items_in_blocks:
-                    continue
-
+            elif overlay.kind == OverlayKind.ITEM_BLOCK:
                 pos.setY(pos.y() - self.block_length)
 
-                if "flower" in name:
-                    image = FIRE_FLOWER
-                elif "leaf" in name:
-                    image = LEAF
-                elif "continuous star" in name:
-                    image = CONTINUOUS_STAR
-                elif "star" in name:
-                    image = NORMAL_STAR
-                elif "multi-coin" in name:
-                    image = MULTI_COIN
-                elif "coin" in name:
-                    image = COIN
-                elif "1-up" in name:
-                    image = ONE_UP
-                elif "vine" in name:
-                    image = VINE
-                elif "p-switch" in name:
-                    image = P_SWITCH
-                else:
-                    image = EMPTY_IMAGE
-
                 # draw little arrow for the offset item overlay
                 arrow_pos = QPoint(pos)
                 arrow_pos.setY(arrow_pos.y() + self.block_length / 4)
-                painter.drawImage(arrow_pos, ITEM_ARROW.scaled(self.block_length, self.block_length))
+                painter.drawImage(arrow_pos, self._icon(ITEM_ARROW))
 
-            elif "invisible" in name:
-                if not self.draw_invisible_items:
-                    continue
-
-                if "coin" in name:
-                    image = INVISIBLE_COIN
-                elif "1-up" in name:
-                    image = INVISIBLE_1_UP
-                else:
-                    image = EMPTY_IMAGE
-
-            elif "silver coins" in name:
-                if not self.draw_invisible_items:
-                    continue
-
-                image = SILVER_COIN
-            else:
-                continue
+            # invisible coins, for example, expand and need to have multiple overlays drawn onto them
+            if overlay.fill:
+                selection_overlay = self._icon(image, selected=True) if level_object.selected else None
+                image = self._icon(image)
 
-            if fill_object:
                 for x in range(level_object.rendered_size.width):
                     adapted_pos = QPoint(pos)
                     adapted_pos.setX(pos.x() + x * self.block_length)
 
-                    image = image.scaled(self.block_length, self.block_length)
                     painter.drawImage(adapted_pos, image)
 
-                    if level_object.selected:
-                        painter.drawImage(adapted_pos, _make_image_selected(image))
+                    if selection_overlay is not None:
+                        painter.drawImage(adapted_pos, selection_overlay)
 
             else:
-                image = image.scaled(self.block_length, self.block_length)
-                painter.drawImage(pos, image)
+                painter.drawImage(pos, self._icon(image))
 
         painter.restore()
 
+    def _icon(self, icon: QImage, selected: bool = False) -> QImage:
+        """
+        Returns the overlay icon scaled to the current block length. If selected, returns the selection overlay of
+        the scaled icon instead, which is drawn on top of it.
+
+        Scaled icons are kept, until the block length changes.
+        """
+        if self._icon_block_length != self.block_length:
+            self._icon_block_length = self.block_length
+            self._icons.clear()
+
+        icon_attributes = (icon.cacheKey(), selected)
+
+        if icon_attributes not in self._icons:
+            image = icon.scaled(self.block_length, self.block_length)
+
+            if selected:
+                image = _make_image_selected(image)
+
+            self._icons[icon_attributes] = image
+
+        return self._icons[icon_attributes]
+
     @staticmethod
     def _object_in_jump_area(level: Level, pos: Tuple[int, int]):
-        for jump in level.jumps:
-            jump_rect = jump.get_rect(1, level.is_vertical)
-
-            if jump_rect.contains(QPoint(*pos)):
-                return True
-        else:
-            return False
+        return level.jump_at(*pos) is not None
 
     def _draw_expansions(self, painter: QPainter, level: Level):
         for level_object in level.get_all_objects():
+            if not self._is_visible(level_object.get_rect()):
+                continue
+
             if level_object.selected:
                 painter.drawRect(level_object.get_rect(self.block_length))
 
@@ -456,22 +710,12 @@ class LevelDrawer:
                 painter.restore()
 
     def _draw_mario(self, painter: QPainter, level: Level):
-        mario_actions = QImage(str(data_dir / "mario.png"))
-
-        mario_actions.convertTo(QImage.Format_RGBA8888)
-
         mario_position = QPoint(*level.header.mario_position()) * self.block_length
 
-        x_offset = 32 * level.start_action
-        MARIO_POWERUP_Y_OFFSETS = [0, 0x20, 0x60, 0x40, 0xC0, 0xA0, 0x80, 0x60, 0xC0]
-        y_offset = MARIO_POWERUP_Y_OFFSETS[SETTINGS["default_powerup"]]
-
-        mario_cutout = mario_actions.copy(QRect(x_offset, y_offset, 32, 32)).scaled(
-            2 * self.block_length, 2 * self.block_length
+        painter.drawImage(
+            mario_position, _mario_frame(level.start_action, SETTINGS["default_powerup"], self.block_length)
         )
 
-        painter.drawImage(mario_position, mario_cutout)
-
     def _draw_jumps(self, painter: QPainter, level: Level):
         for jump in level.jumps:
             painter.setBrush(QBrush(QColor(0xFF, 0x00, 0x00), Qt.FDiagPattern))
@@ -481,21 +725,39 @@ class LevelDrawer:
     def _draw_grid(self, painter: QPainter, level: Level):
         panel_width, panel_height = level.get_rect(self.block_length).size().toTuple()
 
-        painter.setPen(self.grid_pen)
+        # only lines crossing the visible part of the level are drawn, which is the whole level, if nothing is culled
+        visible_rect = level.get_rect().intersected(self._culling_rect)
+
+        if visible_rect.isEmpty():
+            return
 
-        for x in range(0, panel_width, self.block_length):
-            painter.drawLine(x, 0, x, panel_height)
-        for y in range(0, panel_height, self.block_length):
-            painter.drawLine(0, y, panel_width, y)
+        left, top = visible_rect.left() * self.block_length, visible_rect.top() * self.block_length
+        right = min(panel_width, (visible_rect.right() + 1) * self.block_length)
+        bottom = min(panel_height, (visible_rect.bottom() + 1) * self.block_length)
 
-        painter.setPen(self.screen_pen)
+        grid_lines = [QLine(x, top, x, bottom) for x in range(left, right, self.block_length)]
+        grid_lines.extend(QLine(left, y, right, y) for y in range(top, bottom, self.block_length))
+
+        painter.setPen(self.grid_pen)
+        painter.drawLines(grid_lines)
 
         if level.is_vertical:
-            for y in range(0, panel_height, self.block_length * SCREEN_HEIGHT):
-                painter.drawLine(0, self.block_length + y, panel_width, self.block_length + y)
+            screen_height = self.block_length * SCREEN_HEIGHT
+
+            screen_lines = [
+                QLine(left, self.block_length + y, right, self.block_length + y)
+                for y in range(0, panel_height, screen_height)
+                if top <= self.block_length + y <= bottom
+            ]
         else:
-            for x in range(0, panel_width, self.block_length * SCREEN_WIDTH):
-                painter.drawLine(x, 0, x, panel_height)
+            screen_width = self.block_length * SCREEN_WIDTH
+
+            screen_lines = [
+                QLine(x, top, x, bottom) for x in range(-(-left // screen_width) * screen_width, right, screen_width)
+            ]
+
+        painter.setPen(self.screen_pen)
+        painter.drawLines(screen_lines)
 
     def _draw_auto_scroll(self, painter: QPainter, level: Level):
         for item in level.enemies:
@@ -0,0 +1,257 @@
+from typing import Optional
+
+from PySide6.QtCore import QPoint, QRect, QSize
+from PySide6.QtGui import QColor, QImage, QMouseEvent, QPainter, QPaintEvent, QPen, Qt
+from PySide6.QtWidgets import QScrollArea, QSizePolicy, QWidget
+
+from foundry.game.File import ROM
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.gfx.objects.LevelObject import BLANK, LevelObject
+from foundry.game.level.Level import Level
+from foundry.game.level.LevelRef import LevelRef
+from foundry.game.level.WorldMap import WorldMap
+from foundry.gui.LevelDrawer import (
+    covered_rect,
+    default_block_fills,
+    get_blocks,
+    get_overlay,
+)
+from foundry.gui.LevelView import LevelView
+
+MINIMAP_BLOCK_LENGTH = 2  # pixels per block
+
+ObjectKey = tuple[int, int, int, tuple[int, int, int, int], bytes]
+
+
+def block_colors(level: Level) -> list[bytes]:
+    """
+    The color of every block of the level, when it is shrunk down to a single pixel, as RGB bytes.
+    """
+    image = QImage(Block.WIDTH, Block.HEIGHT, QImage.Format_RGB888)
+    colors = []
+
+    for block in get_blocks(level):
+        painter = QPainter(image)
+        block.draw(painter, 0, 0, Block.WIDTH)
+        painter.end()
+
+        pixel = image.scaled(1, 1, Qt.IgnoreAspectRatio, Qt.SmoothTransformation).pixelColor(0, 0)
+
+        colors.append(bytes(pixel.toTuple()[:3]))
+
+    return colors
+
+
+def _object_key(index: int, level_object: LevelObject) -> ObjectKey:
+    """
+    Everything about an object, that decides, which blocks it puts into the tilemap.
+    """
+    return (
+        index,
+        id(level_object),
+        level_object.type,
+        covered_rect(level_object).getRect(),
+        bytes(level_object.rendered_blocks),
+    )
+
+
+class LevelMinimap(QWidget):
+    """
+    The whole level at a glance, with every block shrunk down to a square of a single color.
+
+    The level is kept as a tilemap of block indexes. When the level changes, only the part of the tilemap, that the
+    changed objects covered before and after the change, is filled in again. Nothing is ever drawn at the size of the
+    level view, so the minimap stays cheap, even for the longest levels.
+
+    The part of the level, that the level view currently shows, is outlined. Clicking or dragging with the left mouse
+    button scrolls the level view to that point.
+    """
+
+    def __init__(self, parent: Optional[QWidget], level_ref: LevelRef, level_view: LevelView, scroll_area: QScrollArea):
+        super(LevelMinimap, self).__init__(parent)
+
+        self.level_ref = level_ref
+        self.level_view = level_view
+        self.scroll_area = scroll_area
+
+        self.viewport_pen = QPen(QColor(0xFF, 0x00, 0x00, 0xFF))
+        self.viewport_pen.setWidth(1)
+
+        self._level: Optional[Level] = None
+        self._level_size = (0, 0)
+        self._palette_key: Optional[tuple] = None
+        self._block_colors: list[bytes] = []
+        self._tilemap: list[int] = []
+        self._object_keys: set[ObjectKey] = set()
+        self._image = QImage()
+
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+
+        self.level_ref.data_changed.connect(self._on_level_changed)
+
+        for scroll_bar in [self.scroll_area.horizontalScrollBar(), self.scroll_area.verticalScrollBar()]:
+            scroll_bar.valueChanged.connect(self.update)
+            scroll_bar.rangeChanged.connect(self.update)
+
+    def sizeHint(self) -> QSize:
+        if self._image.isNull():
+            return super(LevelMinimap, self).sizeHint()
+
+        return self._image.size() * MINIMAP_BLOCK_LENGTH
+
+    def _on_level_changed(self):
+        if not self.level_ref or isinstance(self.level_ref.level, WorldMap):
+            self._level = None
+            self._image = QImage()
+            self.updateGeometry()
+            self.update()
+
+            return
+
+        level = self.level_ref.level
+
+        dirty_rect = QRect()
+
+        if level is not self._level or level.size != self._level_size:
+            self._level = level
+            self._level_size = level.size
+            self._tilemap = [0] * (level.width * level.height)
+            self._object_keys = set()
+
+            dirty_rect = level.get_rect()
+
+        # objects are in the order they depend on each other, so the ones before are up to date already
+        for level_object in level.objects:
+            level_object.render_if_dirty()
+
+        object_keys = {_object_key(index, level_object) for index, level_object in enumerate(level.objects)}
+        changed_keys = object_keys ^ self._object_keys
+
+        for changed_key in changed_keys:
+            dirty_rect = dirty_rect.united(QRect(*changed_key[3]))
+
+        self._object_keys = object_keys
+
+        palette_key = (
+            level.object_set_number,
+            level.header.object_palette_index,
+            level.header.graphic_set_index,
+            ROM.generation,
+        )
+
+        if palette_key != self._palette_key:
+            self._palette_key = palette_key
+            self._block_colors = block_colors(level)
+        elif dirty_rect.isEmpty():
+            return
+
+        self._fill_tilemap(level, dirty_rect.intersected(level.get_rect()))
+
+        self._image = QImage(
+            b"".join([self._block_colors[block_index] for block_index in self._tilemap]),
+            level.width,
+            level.height,
+            3 * level.width,
+            QImage.Format_RGB888,
+        ).copy()
+
+        self.updateGeometry()
+        self.update()
+
+    def _fill_tilemap(self, level: Level, rect: QRect):
+        """
+        Puts the blocks inside the given rect into the tilemap again, first the default blocks of the level, then the
+        blocks of every object, that reaches into it.
+        """
+        if rect.isEmpty():
+            return
+
+        width = level.width
+
+        for fill_rect, block_indexes in default_block_fills(level):
+            fill_rect = fill_rect.intersected(rect)
+
+            for y in range(fill_rect.top(), fill_rect.bottom() + 1):
+                for x in range(fill_rect.left(), fill_rect.right() + 1):
+                    self._tilemap[y * width + x] = block_indexes[x % len(block_indexes)]
+
+        rom = ROM()
+
+        for level_object in level.objects:
+            object_rect = covered_rect(level_object)
+
+            if not object_rect.intersects(rect):
+                continue
+
+            if get_overlay(level_object).special_background:
+                block_index = level_object.blocks[0]
+
+                if block_index > 0xFF:
+                    block_index = rom.get_byte(block_index)
+
+                filled_rect = object_rect.intersected(rect)
+
+                for y in range(filled_rect.top(), filled_rect.bottom() + 1):
+                    for x in range(filled_rect.left(), filled_rect.right() + 1):
+                        self._tilemap[y * width + x] = block_index
+
+                continue
+
+            object_x, object_y = level_object.rect.x(), level_object.rect.y()
+            object_width = max(level_object.rect.width(), 1)
+
+            for index, block_index in enumerate(level_object.rendered_blocks):
+                if block_index == BLANK:
+                    continue
+
+                x = object_x + index % object_width
+                y = object_y + index // object_width
+
+                if not rect.contains(x, y):
+                    continue
+
+                if block_index > 0xFF:
+                    block_index = rom.get_byte(block_index)
+
+                self._tilemap[y * width + x] = block_index
+
+    def paintEvent(self, event: QPaintEvent):
+        if self._image.isNull():
+            return
+
+        painter = QPainter(self)
+
+        painter.drawImage(QRect(QPoint(0, 0), self._image.size() * MINIMAP_BLOCK_LENGTH), self._image)
+
+        visible_rect = self.level_view.visible_rect()
+        scale = MINIMAP_BLOCK_LENGTH / self.level_view.block_length
+
+        viewport_rect = QRect(
+            round(visible_rect.x() * scale),
+            round(visible_rect.y() * scale),
+            round(visible_rect.width() * scale),
+            round(visible_rect.height() * scale),
+        )
+
+        painter.setPen(self.viewport_pen)
+        painter.drawRect(viewport_rect.adjusted(0, 0, -1, -1))
+
+        painter.end()
+
+    def mousePressEvent(self, event: QMouseEvent):
+        if event.button() == Qt.LeftButton:
+            self._scroll_to(event.position().toPoint())
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        if event.buttons() & Qt.LeftButton:
+            self._scroll_to(event.position().toPoint())
+
+    def _scroll_to(self, position: QPoint):
+        """
+        Scrolls the level view, so that the point of the minimap is in the center of it.
+        """
+        scale = self.level_view.block_length / MINIMAP_BLOCK_LENGTH
+        viewport = self.scroll_area.viewport()
+
+        self.scroll_area.horizontalScrollBar().setValue(round(position.x() * scale - viewport.width() / 2))
+        self.scroll_area.verticalScrollBar().setValue(round(position.y() * scale - viewport.height() / 2))
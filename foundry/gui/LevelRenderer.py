@@ -0,0 +1,154 @@
+import struct
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QImage, QPainter
+
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.level.Level import Level
+from foundry.gui.LevelDrawer import LevelDrawer
+
+DEFAULT_BAND_HEIGHT = 8  # in blocks
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_COLOR_TYPE_RGB = 2
+PNG_FILTER_NONE = b"\x00"
+
+
+def block_length_for_zoom(zoom: float) -> int:
+    """
+    The side length of a block in pixels, at the given zoom. The same as the one used by the LevelView.
+    """
+    return int(Block.SIDE_LENGTH * zoom)
+
+
+def render_level(
+    level: Level, zoom: float = 1, region: Optional[QRect] = None, drawer: Optional[LevelDrawer] = None
+) -> QImage:
+    """
+    Renders a level into an image, without the need for a widget.
+
+    :param level: The level to render.
+    :param zoom: The zoom factor, 1 being 16 pixels per block.
+    :param region: The part of the level to render in blocks. The whole level, if None.
+    :param drawer: The drawer, whose settings, like drawing the grid or jumps, should be used. A drawer with the
+        default settings, if None.
+
+    :return: An RGB image of the rendered region.
+    """
+    if drawer is None:
+        drawer = LevelDrawer()
+
+    if region is None:
+        region = level.get_rect()
+
+    block_length = block_length_for_zoom(zoom)
+    pixel_region = QRect(region.topLeft() * block_length, region.size() * block_length)
+
+    image = QImage(pixel_region.size(), QImage.Format_RGB888)
+    image.fill(0)
+
+    previous_block_length = drawer.block_length
+    drawer.block_length = block_length
+
+    painter = QPainter(image)
+    painter.translate(-pixel_region.topLeft())
+    painter.setClipRect(pixel_region)
+
+    drawer.draw(painter, level)
+
+    painter.end()
+
+    drawer.block_length = previous_block_length
+
+    return image
+
+
+def render_level_bands(
+    level: Level, zoom: float = 1, band_height: int = DEFAULT_BAND_HEIGHT, drawer: Optional[LevelDrawer] = None
+) -> Iterator[tuple[QRect, QImage]]:
+    """
+    Renders a level in horizontal bands from top to bottom, so only a single band needs to be kept in memory.
+
+    :param band_height: The height of every band in blocks. The last band might be shorter.
+
+    :return: The region in blocks and the rendered image of every band.
+    """
+    width, height = level.size
+
+    for y in range(0, height, band_height):
+        region = QRect(0, y, width, min(band_height, height - y))
+
+        yield region, render_level(level, zoom, region, drawer)
+
+
+def save_level_png(
+    level: Level,
+    path: Union[str, Path],
+    zoom: float = 1,
+    band_height: int = DEFAULT_BAND_HEIGHT,
+    drawer: Optional[LevelDrawer] = None,
+):
+    """
+    Renders a level into a PNG file, streaming the rows of every band to disk, as soon as they are rendered.
+    Memory use is bound by the size of a single band, no matter how large the level is.
+    """
+    width, height = (level.get_rect(block_length_for_zoom(zoom)).size()).toTuple()
+
+    with open(path, "wb") as png_file:
+        writer = _PngWriter(png_file, width, height)
+
+        for _, image in render_level_bands(level, zoom, band_height, drawer):
+            writer.write_image_rows(image)
+
+        writer.finish()
+
+
+class _PngWriter:
+    """
+    Writes an 8 bit RGB PNG file row by row, so the whole image never has to be in memory at once.
+    """
+
+    def __init__(self, file: BinaryIO, width: int, height: int):
+        self.file = file
+        self.width = width
+        self.height = height
+
+        self._compressor = zlib.compressobj()
+
+        self.file.write(PNG_SIGNATURE)
+        self._write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, PNG_COLOR_TYPE_RGB, 0, 0, 0))
+
+    def write_image_rows(self, image: QImage):
+        assert image.width() == self.width
+
+        image = image.convertToFormat(QImage.Format_RGB888)
+
+        row_length = 3 * image.width()
+        bytes_per_line = image.bytesPerLine()
+        bits = image.constBits()
+
+        rows = bytearray()
+
+        for y in range(image.height()):
+            rows.extend(PNG_FILTER_NONE)
+            rows.extend(bits[y * bytes_per_line : y * bytes_per_line + row_length])
+
+        self._write_data(self._compressor.compress(bytes(rows)))
+
+    def finish(self):
+        self._write_data(self._compressor.flush())
+        self._write_chunk(b"IEND", b"")
+
+    def _write_data(self, data: bytes):
+        if data:
+            self._write_chunk(b"IDAT", data)
+
+    def _write_chunk(self, chunk_type: bytes, data: bytes):
+        self.file.write(struct.pack(">I", len(data)))
+        self.file.write(chunk_type)
+        self.file.write(data)
+        self.file.write(struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
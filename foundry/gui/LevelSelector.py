@@ -19,10 +19,13 @@ from PySide6.QtWidgets import (
 
 from foundry.game.gfx.drawable.Block import Block
 from foundry.game.level.Level import Level
+from foundry.game.level.LevelPrefetcher import LevelKey, level_meta_key
 from foundry.game.level.util import Level as LevelMeta
 from foundry.game.level.util import get_world_levels
 from foundry.game.level.WorldMap import WorldMap
+from foundry.gui.settings import SETTINGS
 from foundry.gui.Spinner import Spinner
+from foundry.gui.ThumbnailCache import get_thumbnail_cache
 from foundry.gui.WorldMapView import WorldMapView
 from foundry.smb3parse.levels import WORLD_COUNT
 
@@ -62,6 +65,8 @@ OBJECT_SET_ITEMS = [
 OVERWORLD_MAPS_INDEX = 0
 WORLD_1_INDEX = 1
 
+PREVIEW_HEIGHT = 108  # pixels, a level with the default height at a quarter of the default zoom
+
 
 def select_by_world_and_level(world: int, level: int) -> LevelMeta:
     return get_world_levels(world, Level.offsets)[level]
@@ -119,6 +124,19 @@ class LevelSelector(QDialog):
         stock_level_layout.addWidget(self.world_list, 1, 0)
         stock_level_layout.addWidget(self.level_list, 1, 1)
 
+        self.preview = QLabel(parent=self)
+        self.preview.setAlignment(Qt.AlignCenter)
+        self.preview.setMinimumHeight(PREVIEW_HEIGHT)
+        self.preview.setVisible(SETTINGS["level_thumbnails_enabled"])
+
+        stock_level_layout.addWidget(self.preview, 2, 0, 1, 2)
+
+        self._previewed_level: Optional[LevelKey] = None
+        self._listens_for_thumbnails = SETTINGS["level_thumbnails_enabled"]
+
+        if self._listens_for_thumbnails:
+            get_thumbnail_cache().thumbnail_ready.connect(self._on_thumbnail_ready)
+
         self.source_selector = QTabWidget()
         self.source_selector.addTab(stock_level_widget, "Stock Levels")
 
@@ -172,7 +190,13 @@ class LevelSelector(QDialog):
 
         self.level_list.clear()
 
-        self.level_list.addItems([level.display_information.name for level in get_world_levels(index, Level.offsets)])
+        world_levels = get_world_levels(index, Level.offsets)
+
+        self.level_list.addItems([level.display_information.name for level in world_levels])
+
+        if SETTINGS["level_thumbnails_enabled"] and index != OVERWORLD_MAPS_INDEX:
+            # render the previews of the whole world, since the user is likely to browse through it
+            get_thumbnail_cache().request_all([level_meta_key(level) for level in world_levels])
 
         if self.level_list.count():
             self.level_list.setCurrentRow(0)
@@ -211,6 +235,33 @@ class LevelSelector(QDialog):
 
         self._fill_in_data(object_set_index, object_data_for_lvl, enemy_data_for_lvl)
 
+        if level_is_overworld:
+            self._show_preview(None)
+        else:
+            # the spinner shows the enemy offset minus one, but on_ok adds it back, before the level is loaded
+            self._show_preview(level_meta_key(level))
+
+    def _show_preview(self, level_key: Optional[LevelKey]):
+        self._previewed_level = level_key
+
+        if not SETTINGS["level_thumbnails_enabled"]:
+            return
+
+        if level_key is None:
+            self.preview.clear()
+            return
+
+        thumbnail = get_thumbnail_cache().thumbnail(level_key)
+
+        if thumbnail is None:
+            self.preview.setText("Rendering preview...")
+        else:
+            self.preview.setPixmap(thumbnail.scaledToHeight(PREVIEW_HEIGHT, Qt.SmoothTransformation))
+
+    def _on_thumbnail_ready(self, level_key: LevelKey):
+        if level_key == self._previewed_level:
+            self._show_preview(level_key)
+
     def _fill_in_data(self, object_set: int, layout_address: int, enemy_address: int):
         self.object_set_dropdown.setCurrentIndex(object_set)
         self.object_data_spinner.setValue(layout_address)
@@ -235,6 +286,14 @@ class LevelSelector(QDialog):
 
         self.accept()
 
+    def done(self, result: int):
+        if self._listens_for_thumbnails:
+            # the thumbnail cache outlives the dialog, which is made anew every time
+            get_thumbnail_cache().thumbnail_ready.disconnect(self._on_thumbnail_ready)
+            self._listens_for_thumbnails = False
+
+        super(LevelSelector, self).done(result)
+
     def closeEvent(self, _close_event: QCloseEvent):
         self.reject()
 
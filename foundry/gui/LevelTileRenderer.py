@@ -0,0 +1,442 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from typing import Optional, Union
+
+from attr import attrs
+from PySide6.QtCore import QCoreApplication, QObject, QRect, Qt, Signal, SignalInstance
+from PySide6.QtGui import QImage, QPainter
+
+from foundry.game.File import ROM
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.gfx.objects.Enemy import Enemy
+from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.gfx.objects.Jump import Jump
+from foundry.game.gfx.objects.LevelObject import (
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    LevelObject,
+)
+from foundry.game.level.Level import Level
+from foundry.gui.LevelDrawer import CULLING_MARGIN, LevelDrawer, covered_rect
+from foundry.gui.LevelRenderer import render_level
+from foundry.gui.settings import SETTINGS
+from foundry.smb3parse.constants import OBJ_AUTOSCROLL
+
+RENDER_THREADS = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+DRAWER_SETTINGS = (
+    "draw_jumps",
+    "draw_grid",
+    "draw_expansions",
+    "draw_mario",
+    "draw_jumps_on_objects",
+    "draw_items_in_blocks",
+    "draw_invisible_items",
+    "draw_autoscroll",
+    "transparency",
+)
+"""The attributes of a LevelDrawer, which change what a level looks like."""
+
+_thread_local = threading.local()
+
+ObjectKey = tuple[int, int, int, tuple[int, int, int, int], bytes, bool, tuple]
+
+
+@attrs(slots=True, auto_attribs=True)
+class Tile:
+    """
+    The rendered image of a screen of the level.
+
+    Attributes
+    ----------
+    generation: int
+        The generation of the level state, that the image shows.
+    block_length: int
+        The block length the image was rendered with.
+    image: QImage
+        The rendered screen.
+    """
+
+    generation: int
+    block_length: int
+    image: QImage
+
+
+def snapshot_level(
+    level: Level, object_snapshots: Optional[dict[ObjectKey, Union[LevelObject, EnemyObject]]] = None
+) -> Level:
+    """
+    A copy of the level, that can be drawn in another thread, while the level itself keeps being edited.
+
+    Only the parts, that are changed in place while editing or drawing, are copied. The objects are rendered
+    beforehand, so drawing the copy does not have to.
+
+    :param level: The level to take a snapshot of.
+    :param object_snapshots: The snapshots of the objects of an earlier snapshot, by their key. Objects, that did not
+        change since, are taken from there, instead of being copied again. Afterwards, it holds the objects of this
+        snapshot.
+    """
+    # objects are in the order they depend on each other, so the ones before are up to date already
+    for level_object in level.objects:
+        level_object.render_if_dirty()
+
+    previous_snapshots = object_snapshots or {}
+    current_snapshots = {}
+
+    # enemies are drawn after all objects, so adding or removing objects does not change their order
+    for index, level_object in [*enumerate(level.objects), *enumerate(level.enemies)]:
+        object_key = _object_key(index, level_object)
+
+        if object_key in previous_snapshots:
+            current_snapshots[object_key] = previous_snapshots[object_key]
+        else:
+            current_snapshots[object_key] = _snapshot_object(level_object)
+
+    if object_snapshots is not None:
+        object_snapshots.clear()
+        object_snapshots.update(current_snapshots)
+
+    snapshot_objects = list(current_snapshots.values())
+
+    snapshot = copy(level)
+
+    snapshot.header_bytes = bytearray(level.header_bytes)
+    snapshot.objects = snapshot_objects[: len(level.objects)]
+
+    for level_object in snapshot.objects:
+        # objects look at the objects before them, to find out how far down they reach
+        level_object.objects_ref = snapshot.objects
+
+    snapshot.enemies = snapshot_objects[len(level.objects) :]
+    snapshot.jumps = [_snapshot_jump(jump) for jump in level.jumps]
+    snapshot._jumps_by_screen = None
+
+    return snapshot
+
+
+def _object_key(index: int, level_object: Union[LevelObject, EnemyObject]) -> ObjectKey:
+    """
+    Everything about an object, that decides, what it looks like in the level and where.
+    """
+    if isinstance(level_object, LevelObject):
+        object_data = bytes(level_object.data) + bytes(level_object.rendered_blocks)
+    else:
+        object_data = bytes(level_object.enemy)
+
+    return (
+        index,
+        id(level_object),
+        level_object.type,
+        covered_rect(level_object).getRect(),
+        object_data,
+        level_object.selected,
+        level_object.palette_group,
+    )
+
+
+def _level_key(level: Level) -> tuple:
+    """
+    Everything about a level, that can change what all of it looks like.
+    """
+    return (
+        bytes(level.header_bytes),
+        level.object_set_number,
+        # pipes and doors show, whether they lead anywhere
+        tuple(bytes(jump.data) for jump in level.jumps),
+        # the autoscroll path spans the whole level
+        tuple(bytes(enemy.enemy) for enemy in level.enemies if enemy.obj_index == OBJ_AUTOSCROLL),
+    )
+
+
+def _snapshot_object(level_object: Union[LevelObject, EnemyObject]) -> Union[LevelObject, EnemyObject]:
+    snapshot = copy(level_object)
+
+    if isinstance(level_object, LevelObject):
+        snapshot.data = bytearray(level_object.data)
+        snapshot.rect = QRect(level_object.rect)
+
+        # these caches are filled and emptied in place, while the objects are drawn
+        snapshot._geometry = {}
+        snapshot._scaled_rects = {}
+        snapshot._image = QImage()
+        snapshot._image_key = None
+    else:
+        snapshot.enemy = Enemy.from_bytes(bytes(level_object.enemy))
+
+    return snapshot
+
+
+def _snapshot_jump(jump: Jump) -> Jump:
+    snapshot = copy(jump)
+    snapshot.data = bytearray(jump.data)
+
+    return snapshot
+
+
+def _thread_drawer() -> LevelDrawer:
+    # drawers keep state between draws, so every worker thread gets its own
+    if not hasattr(_thread_local, "drawer"):
+        _thread_local.drawer = LevelDrawer()
+
+    return _thread_local.drawer
+
+
+class LevelTileRenderer(QObject):
+    """
+    Draws a level from images of its screens, which are rendered in a pool of worker threads.
+
+    Whenever the level changes, the tiles showing the changed part of it are marked stale. Stale tiles are still
+    drawn, until their replacements arrive, so painting never waits on rendering the level. The workers render a
+    snapshot of the level, so it can be edited further in the meantime. Tiles, that were never rendered, like after
+    loading a level, are rendered right away, since there is nothing to show in their place.
+
+    Changes, that the tiles can not notice themselves, like edits of the objects of the level, need a call to
+    level_changed, for the tiles to be rendered again.
+    """
+
+    tile_ready: SignalInstance = Signal(QRect)  # type: ignore
+    _tile_rendered: SignalInstance = Signal(int, int, int, object)  # type: ignore
+
+    def __init__(self, drawer: LevelDrawer, parent: Optional[QObject] = None):
+        super(LevelTileRenderer, self).__init__(parent)
+
+        self.drawer = drawer
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._generation = 0
+        self._level_generation = 0
+        self._level: Optional[Level] = None
+        self._level_size = (0, 0)
+        self._state_key: Optional[tuple] = None
+
+        self._level_changed = True
+        self._level_key: Optional[tuple] = None
+        self._snapshot: Optional[Level] = None
+        self._object_snapshots: dict[ObjectKey, Union[LevelObject, EnemyObject]] = {}
+
+        self._tiles: dict[int, Tile] = {}
+        self._pending: set[int] = set()
+
+        # tiles older than the stale generation, or the generation they went stale in themselves, are stale
+        self._stale_generation = 0
+        self._stale_tiles: dict[int, int] = {}
+
+        self._tile_rendered.connect(self._on_tile_rendered, Qt.QueuedConnection)
+
+        if (app := QCoreApplication.instance()) is not None:
+            # the worker threads would still be rendering, while the application is torn down
+            app.aboutToQuit.connect(self.shutdown)
+
+    def invalidate(self, rect: Optional[QRect] = None):
+        """
+        Marks the tiles as stale, that are at least partly inside the given rect in blocks, or all of them. They are
+        drawn, until they are rendered again.
+        """
+        self._generation += 1
+
+        if rect is None:
+            self._stale_generation = self._generation
+            self._stale_tiles.clear()
+            self._pending.clear()
+
+            return
+
+        for index, tile_rect in enumerate(_tile_rects(self._level)):
+            if tile_rect.intersects(rect):
+                self._stale_tiles[index] = self._generation
+                self._pending.discard(index)
+
+    def level_changed(self):
+        """
+        The objects, enemies, jumps or header of the level changed. Only the tiles, that show a part of the level,
+        which changed, are rendered again.
+        """
+        self._level_changed = True
+
+    def draw(self, painter: QPainter, level: Level, rect: QRect):
+        """
+        Draws the tiles of the level inside the given rect in pixels and queues up stale ones to be rendered again.
+        """
+        self._check_state(level)
+
+        if self._level_changed:
+            self._update_snapshot(level)
+
+        block_length = self.drawer.block_length
+        stale_tiles = []
+
+        for index, tile_rect in self._tiles_in(level, rect, block_length):
+            tile = self._tiles.get(index)
+
+            if tile is None:
+                tile = Tile(self._generation, block_length, self._render(level, tile_rect, self.drawer, block_length))
+                self._tiles[index] = tile
+
+            elif (tile.generation < self._required_generation(index) or tile.block_length != block_length) and (
+                index not in self._pending
+            ):
+                stale_tiles.append((index, tile_rect))
+
+            painter.drawImage(QRect(tile_rect.topLeft() * block_length, tile_rect.size() * block_length), tile.image)
+
+        if stale_tiles:
+            self._pending.update(index for index, _ in stale_tiles)
+
+            settings = {name: getattr(self.drawer, name) for name in DRAWER_SETTINGS}
+
+            self._get_executor().submit(
+                self._render_tiles, self._snapshot, self._generation, block_length, settings, stale_tiles
+            )
+
+    def shutdown(self):
+        """
+        Stops the worker threads, after they finished the tile they are rendering.
+        """
+        self.invalidate()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _check_state(self, level: Level):
+        if level is not self._level or level.size != self._level_size:
+            self._level = level
+            self._level_size = level.size
+
+            self._tiles.clear()
+            self._snapshot = None
+            self._object_snapshots.clear()
+            self._level_changed = True
+
+            self.invalidate()
+            self._level_generation = self._generation
+
+        state_key = (
+            ROM.generation,
+            SETTINGS["default_powerup"],
+            tuple(getattr(self.drawer, name) for name in DRAWER_SETTINGS),
+        )
+
+        if state_key != self._state_key:
+            self._state_key = state_key
+
+            # the palettes of the objects could have changed with the ROM
+            self._level_changed = True
+            self.invalidate()
+
+    def _update_snapshot(self, level: Level):
+        """
+        Takes a new snapshot of the level to render tiles from and marks the tiles stale, that show a part of the
+        level, which changed since the last snapshot.
+        """
+        self._level_changed = False
+
+        # the workers would otherwise give the objects of the snapshot their palettes and render them again
+        self.drawer.apply_palettes(level)
+
+        previous_object_keys = set(self._object_snapshots)
+
+        self._snapshot = snapshot_level(level, self._object_snapshots)
+
+        level_key = _level_key(level)
+
+        if level_key != self._level_key:
+            self._level_key = level_key
+            self.invalidate()
+
+            return
+
+        changed_rect = QRect()
+
+        for object_key in previous_object_keys ^ set(self._object_snapshots):
+            changed_rect = changed_rect.united(QRect(*object_key[3]))
+
+        if not changed_rect.isEmpty():
+            # overlays and outlines are drawn around the objects
+            self.invalidate(changed_rect.adjusted(-CULLING_MARGIN, -CULLING_MARGIN, CULLING_MARGIN, CULLING_MARGIN))
+
+    def _required_generation(self, index: int) -> int:
+        """
+        The generation of the level state, that the tile has to show at least, to not be stale.
+        """
+        return max(self._stale_generation, self._stale_tiles.get(index, 0))
+
+    @staticmethod
+    def _tiles_in(level: Level, rect: QRect, block_length: int) -> list[tuple[int, QRect]]:
+        """
+        The index and the rect in blocks of every tile, that is at least partly inside the given rect in pixels.
+        """
+        return [
+            (index, tile_rect)
+            for index, tile_rect in enumerate(_tile_rects(level))
+            if QRect(tile_rect.topLeft() * block_length, tile_rect.size() * block_length).intersects(rect)
+        ]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=RENDER_THREADS, thread_name_prefix="level_render")
+
+        return self._executor
+
+    def _render_tiles(
+        self, level: Level, generation: int, block_length: int, settings: dict, tiles: list[tuple[int, QRect]]
+    ):
+        drawer = _thread_drawer()
+
+        for name, value in settings.items():
+            setattr(drawer, name, value)
+
+        for index, tile_rect in tiles:
+            if generation < self._required_generation(index):
+                # the tile changed again, so it is rendered from a newer snapshot anyway
+                continue
+
+            self._tile_rendered.emit(
+                generation, index, block_length, self._render(level, tile_rect, drawer, block_length)
+            )
+
+    @staticmethod
+    def _render(level: Level, tile_rect: QRect, drawer: LevelDrawer, block_length: int) -> QImage:
+        return render_level(level, block_length / Block.SIDE_LENGTH, tile_rect, drawer)
+
+    def _on_tile_rendered(self, generation: int, index: int, block_length: int, image: QImage):
+        if generation < self._level_generation:
+            # rendered for a level, that is not shown anymore
+            return
+
+        tile = self._tiles.get(index)
+
+        if tile is not None and tile.generation > generation:
+            return
+
+        self._tiles[index] = Tile(generation, block_length, image)
+
+        if generation >= self._required_generation(index):
+            self._pending.discard(index)
+
+        tile_rects = _tile_rects(self._level)
+
+        if index < len(tile_rects):
+            block_length = self.drawer.block_length
+            tile_rect = tile_rects[index]
+
+            self.tile_ready.emit(QRect(tile_rect.topLeft() * block_length, tile_rect.size() * block_length))
+
+
+def _tile_rects(level: Optional[Level]) -> list[QRect]:
+    """
+    The rects in blocks, that the level is split into, one for every screen.
+    """
+    if level is None:
+        return []
+
+    level_rect = level.get_rect()
+
+    return [
+        QRect(x, y, SCREEN_WIDTH, SCREEN_HEIGHT).intersected(level_rect)
+        for y in range(0, level.height, SCREEN_HEIGHT)
+        for x in range(0, level.width, SCREEN_WIDTH)
+    ]
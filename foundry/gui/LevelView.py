@@ -2,7 +2,15 @@ from bisect import bisect_right
 from typing import List, Optional, Tuple, Union
 from warnings import warn
 
-from PySide6.QtCore import QMimeData, QPoint, QSize, Signal, SignalInstance
+from PySide6.QtCore import (
+    QMimeData,
+    QPoint,
+    QRect,
+    QSize,
+    QTimer,
+    Signal,
+    SignalInstance,
+)
 from PySide6.QtGui import (
     QDragEnterEvent,
     QDragMoveEvent,
@@ -24,16 +32,14 @@ from foundry.game.gfx.objects.ObjectLike import (
     EXPANDS_HORIZ,
     EXPANDS_VERT,
 )
-from foundry.game.gfx.objects.util import (
-    decrement_type,
-    increment_type,
-    resize_level_object,
-)
+from foundry.game.gfx.objects.util import decrement_type, increment_type
 from foundry.game.level.Level import Level
 from foundry.game.level.LevelRef import LevelRef
 from foundry.game.level.WorldMap import WorldMap
 from foundry.gui.ContextMenu import ContextMenu
-from foundry.gui.LevelDrawer import LevelDrawer
+from foundry.gui.LevelDrawer import LevelDrawer, drawn_bounds
+from foundry.gui.LevelRenderer import render_level, save_level_png
+from foundry.gui.LevelTileRenderer import LevelTileRenderer
 from foundry.gui.SelectionSquare import SelectionSquare
 from foundry.gui.settings import RESIZE_LEFT_CLICK, RESIZE_RIGHT_CLICK, SETTINGS
 
@@ -49,6 +55,8 @@ MODE_RESIZE_VERT = 4
 MODE_RESIZE_DIAG = MODE_RESIZE_HORIZ | MODE_RESIZE_VERT
 RESIZE_MODES = [MODE_RESIZE_HORIZ, MODE_RESIZE_VERT, MODE_RESIZE_DIAG]
 
+MOUSE_MOVE_INTERVAL = 16  # ms, about once per frame at 60 frames per second
+
 
 def undoable(func):
     def wrapped(self, *args):
@@ -76,6 +84,9 @@ class LevelView(QWidget):
 
         self.level_drawer = LevelDrawer()
 
+        self.tile_renderer = LevelTileRenderer(self.level_drawer, self)
+        self.tile_renderer.tile_ready.connect(self._on_tile_ready)
+
         self.draw_grid = SETTINGS["draw_grid"]
         self.draw_jumps = SETTINGS["draw_jumps"]
         self.draw_expansions = SETTINGS["draw_expansion"]
@@ -109,6 +120,14 @@ class LevelView(QWidget):
         # dragged in from the object toolbar
         self.currently_dragged_object: Optional[Union[LevelObject, EnemyObject]] = None
 
+        # moving and resizing objects is done at most once per frame, with the last mouse position in between
+        self._pending_mouse_position: Optional[QPoint] = None
+
+        self._mouse_move_timer = QTimer(self)
+        self._mouse_move_timer.setSingleShot(True)
+        self._mouse_move_timer.setInterval(MOUSE_MOVE_INTERVAL)
+        self._mouse_move_timer.timeout.connect(self._apply_pending_mouse_move)
+
         self.setWhatsThis(
             "<b>Level View</b><br/>"
             "This renders the level as it would appear in game plus additional information, that can be "
@@ -208,14 +227,10 @@ class LevelView(QWidget):
     def mouseMoveEvent(self, event: QMouseEvent):
         if self.mouse_mode == MODE_DRAG:
             self.setCursor(Qt.ClosedHandCursor)
-            self._dragging(event)
+            self._queue_mouse_move(event.position().toPoint())
 
         elif self.mouse_mode in RESIZE_MODES:
-            previously_selected_objects = self.level_ref.selected_objects
-
-            self._resizing(event)
-
-            self.level_ref.selected_objects = previously_selected_objects
+            self._queue_mouse_move(event.position().toPoint())
 
         elif self.selection_square.active:
             self._set_selection_end(event.position().toPoint())
@@ -235,6 +250,36 @@ class LevelView(QWidget):
 
         return super(LevelView, self).mouseMoveEvent(event)
 
+    def _queue_mouse_move(self, position: QPoint):
+        """
+        Drags or resizes the selected objects to the given mouse position, unless that was already done in this frame.
+        In that case, the position is kept and applied, once the frame is over. Positions, that were replaced by newer
+        ones in the meantime, are skipped, since dragging and resizing only depend on the last one.
+        """
+        self._pending_mouse_position = position
+
+        if not self._mouse_move_timer.isActive():
+            self._apply_pending_mouse_move()
+
+    def _apply_pending_mouse_move(self):
+        if self._pending_mouse_position is None:
+            return
+
+        position = self._pending_mouse_position
+        self._pending_mouse_position = None
+
+        if self.mouse_mode == MODE_DRAG:
+            self._dragging(position)
+
+        elif self.mouse_mode in RESIZE_MODES:
+            previously_selected_objects = self.level_ref.selected_objects
+
+            self._resizing(position)
+
+            self.level_ref.selected_objects = previously_selected_objects
+
+        self._mouse_move_timer.start()
+
     def _set_cursor_for_position(self, event: QMouseEvent):
         level_object = self.object_at(*event.position().toTuple())
 
@@ -284,6 +329,10 @@ class LevelView(QWidget):
         return edges
 
     def mouseReleaseEvent(self, event: QMouseEvent):
+        # objects end up exactly where the mouse last moved them
+        self._apply_pending_mouse_move()
+        self._mouse_move_timer.stop()
+
         released_button = event.button()
 
         if released_button == Qt.LeftButton:
@@ -342,8 +391,14 @@ class LevelView(QWidget):
     def update(self):
         self.resize(self.sizeHint())
 
+        self.tile_renderer.level_changed()
+
         super(LevelView, self).update()
 
+    def _on_tile_ready(self, rect: QRect):
+        # only the tile needs to be drawn again, not the whole level
+        super(LevelView, self).update(rect)
+
     def _on_right_mouse_button_down(self, event: QMouseEvent):
         if self.mouse_mode == MODE_DRAG:
             return
@@ -372,13 +427,13 @@ class LevelView(QWidget):
         if obj is not None:
             self.resize_obj_start_point = obj.position.x, obj.position.y
 
-    def _resizing(self, event: QMouseEvent):
+    def _resizing(self, position: QPoint):
         self.resizing_happened = True
 
         if isinstance(self.level_ref.level, WorldMap):
             return
 
-        x, y = event.position().toPoint().toTuple()
+        x, y = position.toTuple()
 
         level_x, level_y = self._to_level_point(x, y)
 
@@ -394,8 +449,8 @@ class LevelView(QWidget):
 
         selected_objects = self.get_selected_objects()
 
-        for obj in selected_objects:
-            resize_level_object(obj, dx, dy)
+        if selected_objects:
+            self.level_ref.level.resize_objects(selected_objects, dx, dy)
 
             self.level_ref.level.changed = True
 
@@ -462,10 +517,10 @@ class LevelView(QWidget):
 
         return mode
 
-    def _dragging(self, event: QMouseEvent):
+    def _dragging(self, position: QPoint):
         self.dragging_happened = True
 
-        x, y = event.position().toPoint().toTuple()
+        x, y = position.toTuple()
 
         level_x, level_y = self._to_level_point(x, y)
 
@@ -476,9 +531,13 @@ class LevelView(QWidget):
 
         selected_objects = self.get_selected_objects()
 
-        for obj in selected_objects:
-            obj.move_by(dx, dy)
+        if isinstance(self.level_ref.level, WorldMap):
+            for obj in selected_objects:
+                obj.move_by(dx, dy)
+        else:
+            self.level_ref.level.move_objects(selected_objects, dx, dy)
 
+        if selected_objects:
             self.level_ref.level.changed = True
 
         self.update()
@@ -755,6 +814,7 @@ class LevelView(QWidget):
 
     def remove_jump(self, index: int):
         del self.level_ref.level.jumps[index]
+        self.level_ref.level.jumps_changed.emit()
 
         self.update()
 
@@ -791,27 +851,53 @@ class LevelView(QWidget):
     def make_screenshot(self) -> QPixmap:
         assert self.level_ref is not None
 
-        return self.grab()
+        return QPixmap.fromImage(render_level(self.level_ref.level, self.zoom, drawer=self.level_drawer))
+
+    def save_screenshot(self, path: str):
+        assert self.level_ref is not None
+
+        save_level_png(self.level_ref.level, path, self.zoom, drawer=self.level_drawer)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasFormat("application/level-object"):
+            self.currently_dragged_object = None
+
             event.acceptProposedAction()
 
     def dragMoveEvent(self, event: QDragMoveEvent):
         x, y = self._to_level_point(*event.position().toPoint().toTuple())
 
-        level_object = self._object_from_mime_data(event.mimeData())
+        previous_rect = self._dragged_object_rect()
 
-        level_object.position = Point(x, y)
+        # the object is made once per drag and only moved afterwards
+        if self.currently_dragged_object is None:
+            self.currently_dragged_object = self._object_from_mime_data(event.mimeData())
+        elif self.currently_dragged_object.position == Point(x, y):
+            return
 
-        self.currently_dragged_object = level_object
+        self.currently_dragged_object.position = Point(x, y)
 
-        self.repaint()
+        super(LevelView, self).update(previous_rect.united(self._dragged_object_rect()))
 
     def dragLeaveEvent(self, event):
+        previous_rect = self._dragged_object_rect()
+
         self.currently_dragged_object = None
 
-        self.repaint()
+        super(LevelView, self).update(previous_rect)
+
+    def _dragged_object_rect(self) -> QRect:
+        """
+        The part of the level view in pixels, that the object dragged in from the object toolbar is drawn onto.
+        """
+        level_object = self.currently_dragged_object
+
+        if level_object is None:
+            return QRect()
+
+        rect = drawn_bounds(level_object)
+
+        return QRect(rect.topLeft() * self.block_length, rect.size() * self.block_length)
 
     @undoable
     def dropEvent(self, event):
@@ -844,6 +930,17 @@ class LevelView(QWidget):
 
             return self.level_ref.level.enemy_item_factory.from_properties(enemy_id, 0, 0)
 
+    def visible_rect(self) -> QRect:
+        """
+        The part of the level view, that the scroll area it is put into currently shows, in pixels.
+        """
+        viewport = self.parentWidget()
+
+        if viewport is None:
+            return self.rect()
+
+        return QRect(self.mapFrom(viewport, QPoint(0, 0)), viewport.size()).intersected(self.rect())
+
     def paintEvent(self, event: QPaintEvent):
         painter = QPainter(self)
 
@@ -852,7 +949,10 @@ class LevelView(QWidget):
 
         self.level_drawer.block_length = self.block_length
 
-        self.level_drawer.draw(painter, self.level_ref.level)
+        if isinstance(self.level_ref.level, WorldMap):
+            self.level_drawer.draw(painter, self.level_ref.level, self.visible_rect().intersected(event.rect()))
+        else:
+            self.tile_renderer.draw(painter, self.level_ref.level, self.visible_rect().intersected(event.rect()))
 
         self.selection_square.draw(painter)
 
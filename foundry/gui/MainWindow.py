@@ -393,7 +393,7 @@ class MainWindow(QMainWindow):
             return False
 
         # Proceed loading the file chosen by the user
-        self.manager.screenshot.save(pathname)
+        self.manager.save_screenshot(pathname)
 
         return True
 
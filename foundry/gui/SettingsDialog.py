@@ -204,12 +204,45 @@ class SettingsDialog(CustomDialog):
         command_layout.addLayout(powerup_star_layout)
         command_layout.addLayout(starting_world_layout)
 
+        # -----------------------------------------------
+        # performance section
+
+        performance_box = QGroupBox("Performance", self)
+        performance_layout = QVBoxLayout(performance_box)
+
+        label = QLabel("Prefetched levels:")
+        label.setToolTip("How many jump destinations and neighbouring levels are loaded ahead of time.")
+        self.prefetch_size = QSpinBox(self)
+        self.prefetch_size.setRange(0, 64)
+        self.prefetch_size.setValue(SETTINGS["level_prefetch_size"])
+        self.prefetch_size.valueChanged.connect(self._update_settings)
+
+        prefetch_layout = QHBoxLayout()
+        prefetch_layout.addWidget(label)
+        prefetch_layout.addStretch(1)
+        prefetch_layout.addWidget(self.prefetch_size)
+
+        label = QLabel("Level previews in the level selector:")
+        label.setToolTip("Renders previews of levels in the background and keeps them in the home directory.")
+        self._thumbnails_check_box = QCheckBox("Enabled")
+        self._thumbnails_check_box.setChecked(SETTINGS["level_thumbnails_enabled"])
+        self._thumbnails_check_box.toggled.connect(self._update_settings)
+
+        thumbnails_layout = QHBoxLayout()
+        thumbnails_layout.addWidget(label)
+        thumbnails_layout.addStretch(1)
+        thumbnails_layout.addWidget(self._thumbnails_check_box)
+
+        performance_layout.addLayout(prefetch_layout)
+        performance_layout.addLayout(thumbnails_layout)
+
         # ----------------------
 
         layout = QVBoxLayout(self)
         layout.addWidget(mouse_box)
         layout.addWidget(self.gui_style_box)
         layout.addWidget(command_box)
+        layout.addWidget(performance_box)
 
         self.update()
 
@@ -237,6 +270,10 @@ class SettingsDialog(CustomDialog):
             SETTINGS["default_power_has_star"] = self.powerup_star.isChecked()
         if hasattr(self, "starting_world"):
             SETTINGS["default_starting_world"] = self.starting_world.value()
+        if hasattr(self, "prefetch_size"):
+            SETTINGS["level_prefetch_size"] = self.prefetch_size.value()
+        if hasattr(self, "_thumbnails_check_box"):
+            SETTINGS["level_thumbnails_enabled"] = self._thumbnails_check_box.isChecked()
 
         self.update()
 
@@ -11,7 +11,7 @@ from foundry.core.palette.PaletteGroup import MutablePaletteGroupProtocol
 from foundry.core.point.Point import Point
 from foundry.core.size.Size import Size, SizeProtocol
 from foundry.core.sprites import SPRITE_SIZE
-from foundry.game.gfx.drawable.Sprite import Sprite
+from foundry.game.gfx.drawable.SpriteAtlas import get_sprite_atlas
 from foundry.gui.CustomChildWindow import CustomChildWindow
 
 
@@ -163,15 +163,19 @@ class SpriteViewerView(QWidget):
     def paintEvent(self, event: QPaintEvent):
         painter = QPainter(self)
 
-        for i in range(self.SPRITES):
-            sprite = Sprite(
-                i * 2,
-                tuple(tuple(c for c in pal) for pal in self.palette_group),  # type: ignore
-                self.palette_index,
-                self.graphics_set,
-            )
+        atlas = get_sprite_atlas(self.graphics_set, self.palette_group)
 
+        for i in range(self.SPRITES):
             x = (i % self.SPRITES_PER_ROW) * self.sprite_size.width
             y = (i // self.SPRITES_PER_ROW) * self.sprite_size.height
 
-            sprite.draw(painter, x, y, SPRITE_SIZE.width * self.zoom, SPRITE_SIZE.height * self.zoom, transparent=True)
+            atlas.draw(
+                painter,
+                i * 2,
+                self.palette_index,
+                x,
+                y,
+                SPRITE_SIZE.width * self.zoom,
+                SPRITE_SIZE.height * self.zoom,
+                transparent=True,
+            )
@@ -0,0 +1,321 @@
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache
+from hashlib import sha1
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import QCoreApplication, QObject, Qt, Signal, SignalInstance
+from PySide6.QtGui import QGuiApplication, QPixmap
+
+from foundry import thumbnail_cache_path
+from foundry.game.File import ROM
+from foundry.game.level.Level import ENEMY_SIZE, Level
+from foundry.game.level.LevelPrefetcher import LevelKey, level_meta_key
+from foundry.game.ObjectSet import ObjectSet
+from foundry.gui.LevelRenderer import render_level
+from foundry.smb3parse.objects.object_set import WORLD_MAP_OBJECT_SET
+
+THUMBNAIL_ZOOM = 0.25
+THUMBNAIL_MAX_WIDTH = 512  # pixels
+
+_worker_app: Optional[QGuiApplication] = None
+
+
+class ThumbnailCache(QObject):
+    """
+    Previews of levels, saved as PNG files in the home directory.
+
+    Thumbnails are stored in a directory per ROM and named after the bytes of the level they show. Changing the
+    level makes its old thumbnail stale, which is then replaced, the next time it is requested. The ROM hash leaves
+    out the data of the levels in levels.json, so editing one level does not make the thumbnails of all other levels
+    stale.
+
+    Missing thumbnails are rendered in a pool of worker processes, which gets a copy of the ROM as it was at the time
+    of the request.
+
+    Every change of the ROM makes the ROM hash stale. It is then calculated again in a background thread, the next
+    time a thumbnail is asked for. Until it is done, thumbnails are not available and are handed out through
+    thumbnail_ready afterwards.
+    """
+
+    thumbnail_ready: SignalInstance = Signal(object)  # type: ignore
+    _thumbnail_rendered: SignalInstance = Signal(object, str)  # type: ignore
+    _rom_hashed: SignalInstance = Signal(int, object)  # type: ignore
+
+    def __init__(self, cache_dir: Path = thumbnail_cache_path, parent: Optional[QObject] = None):
+        super(ThumbnailCache, self).__init__(parent)
+
+        self.cache_dir = cache_dir
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_generation = -1
+
+        self._hash_executor: Optional[ThreadPoolExecutor] = None
+        self._hashing_generation = -1
+        self._rom_generation = -1
+        self._rom_hash = ""
+
+        self._pending: dict[LevelKey, Path] = {}
+        self._waiting_for_hash: dict[LevelKey, None] = {}
+
+        self._thumbnail_rendered.connect(self._on_thumbnail_rendered, Qt.QueuedConnection)
+        self._rom_hashed.connect(self._on_rom_hashed, Qt.QueuedConnection)
+
+    def thumbnail(self, key: LevelKey) -> Optional[QPixmap]:
+        """
+        Returns the thumbnail of a level, if it is up to date. Otherwise, queues it up to be rendered and emits
+        thumbnail_ready, once it is.
+        """
+        if self._rom_generation != ROM.generation:
+            self._wait_for_rom_hash(key)
+            return None
+
+        try:
+            path = self.thumbnail_path(key)
+        except (IndexError, ValueError):
+            # not a valid level, so there is nothing to show
+            return None
+
+        if path.exists():
+            return QPixmap(str(path))
+
+        self.request(key)
+
+        return None
+
+    def request(self, key: LevelKey):
+        if self._rom_generation != ROM.generation:
+            self._wait_for_rom_hash(key)
+            return
+
+        try:
+            path = self.thumbnail_path(key)
+        except (IndexError, ValueError):
+            return
+
+        if path.exists() or self._pending.get(key) == path:
+            return
+
+        executor = self._get_executor()
+
+        self._pending[key] = path
+
+        future = executor.submit(_render_thumbnail, key, path)
+        future.add_done_callback(lambda done_future: self._emit_rendered(key, path, done_future))
+
+    def request_all(self, keys: list[LevelKey]):
+        for key in keys:
+            self.request(key)
+
+    def thumbnail_path(self, key: LevelKey) -> Path:
+        if self._rom_generation != ROM.generation:
+            # the caller can not wait for the background thread
+            self._rom_generation = ROM.generation
+            self._rom_hash = rom_hash()
+
+        level_hash = sha1(b"".join(level_data(*key).values())).hexdigest()
+
+        return self.cache_dir / self._rom_hash / f"{_thumbnail_prefix(key)}{level_hash}.png"
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        if self._hash_executor is not None:
+            self._hash_executor.shutdown(wait=False, cancel_futures=True)
+            self._hash_executor = None
+
+        self._hashing_generation = -1
+
+        self._pending.clear()
+        self._waiting_for_hash.clear()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is not None and self._executor_generation != ROM.generation:
+            # the workers would render with outdated ROM data
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+            self._pending.clear()
+
+        if self._executor is None:
+            self._executor_generation = ROM.generation
+            self._executor = ProcessPoolExecutor(
+                max_workers=max(1, (os.cpu_count() or 2) // 2),
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(bytes(ROM.rom_data),),
+            )
+
+        return self._executor
+
+    def _wait_for_rom_hash(self, key: LevelKey):
+        self._waiting_for_hash[key] = None
+
+        if self._hashing_generation == ROM.generation:
+            return
+
+        self._hashing_generation = generation = ROM.generation
+
+        if self._hash_executor is None:
+            self._hash_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rom_hash")
+
+        future = self._hash_executor.submit(rom_hash)
+        future.add_done_callback(lambda done_future: self._emit_rom_hashed(generation, done_future))
+
+    def _emit_rom_hashed(self, generation: int, future: Future):
+        if future.cancelled() or future.exception() is not None:
+            self._rom_hashed.emit(generation, None)
+        else:
+            self._rom_hashed.emit(generation, future.result())
+
+    def _on_rom_hashed(self, generation: int, hash_: Optional[str]):
+        if generation != self._hashing_generation:
+            return
+
+        self._hashing_generation = -1
+
+        if hash_ is None:
+            self._waiting_for_hash.clear()
+            return
+
+        if generation != ROM.generation:
+            # the ROM changed while it was hashed, which might have happened in the middle of reading it
+            for key in list(self._waiting_for_hash):
+                self._wait_for_rom_hash(key)
+
+            return
+
+        self._rom_generation = generation
+        self._rom_hash = hash_
+
+        waiting_keys = list(self._waiting_for_hash)
+        self._waiting_for_hash.clear()
+
+        for key in waiting_keys:
+            try:
+                path = self.thumbnail_path(key)
+            except (IndexError, ValueError):
+                continue
+
+            if path.exists():
+                self.thumbnail_ready.emit(key)
+            else:
+                self.request(key)
+
+    def _emit_rendered(self, key: LevelKey, path: Path, future: Future):
+        if future.cancelled() or future.exception() is not None:
+            path = Path()
+
+        self._thumbnail_rendered.emit(key, str(path))
+
+    def _on_thumbnail_rendered(self, key: LevelKey, path: str):
+        if self._pending.get(key) != Path(path):
+            return
+
+        del self._pending[key]
+
+        self.thumbnail_ready.emit(key)
+
+
+@cache
+def get_thumbnail_cache() -> ThumbnailCache:
+    thumbnail_cache = ThumbnailCache()
+
+    if (app := QCoreApplication.instance()) is not None:
+        # the worker processes would keep the application from exiting
+        app.aboutToQuit.connect(thumbnail_cache.shutdown)
+
+    return thumbnail_cache
+
+
+def level_data(object_data_offset: int, enemy_data_offset: int, object_set: int) -> dict[int, bytes]:
+    """
+    Reads the header, object and enemy data of a level, without parsing the whole level.
+
+    :return: The bytes of each part of the level, mapped to the position in the ROM data they were read from.
+    """
+    rom = ROM()
+
+    header_offset = ROM.header.normalized_address(object_data_offset)
+    header = rom.bulk_read(Level.HEADER_LENGTH, object_data_offset)
+
+    object_start = object_data_offset + Level.HEADER_LENGTH
+    object_end = object_start
+
+    object_definitions = ObjectSet(object_set)
+
+    while ROM.rom_data[object_end] != 0xFF:
+        domain = (ROM.rom_data[object_end] & 0b1110_0000) >> 5
+        object_id = ROM.rom_data[object_end + 2]
+
+        object_end += object_definitions.get_object_byte_length(domain, object_id)
+
+    enemy_end = enemy_data_offset
+
+    while enemy_end < len(ROM.rom_data) and ROM.rom_data[enemy_end] != 0xFF:
+        enemy_end += ENEMY_SIZE
+
+    return {
+        header_offset: bytes(header),
+        object_start: bytes(ROM.rom_data[object_start : object_end + 1]),
+        enemy_data_offset: bytes(ROM.rom_data[enemy_data_offset : enemy_end + 1]),
+    }
+
+
+def rom_hash() -> str:
+    """
+    A hash of the ROM data, leaving out the data of the levels in levels.json.
+    """
+    data = bytearray(ROM.rom_data)
+
+    for level_meta in Level.offsets:
+        if level_meta.tileset == WORLD_MAP_OBJECT_SET:
+            continue
+
+        try:
+            parts = level_data(*level_meta_key(level_meta))
+        except (IndexError, ValueError):
+            continue
+
+        for position, part in parts.items():
+            data[position : position + len(part)] = bytes(len(part))
+
+    return sha1(data).hexdigest()
+
+
+def _thumbnail_prefix(key: LevelKey) -> str:
+    object_data_offset, enemy_data_offset, object_set = key
+
+    return f"{object_data_offset:X}_{enemy_data_offset:X}_{object_set:X}_"
+
+
+def _init_worker(rom_data: bytes):
+    global _worker_app
+
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    _worker_app = QGuiApplication([])
+
+    ROM.load_from_data(bytearray(rom_data))
+
+
+def _render_thumbnail(key: LevelKey, path: Path):
+    object_data_offset, enemy_data_offset, object_set = key
+
+    image = render_level(Level("", object_data_offset, enemy_data_offset, object_set), THUMBNAIL_ZOOM)
+
+    if image.width() > THUMBNAIL_MAX_WIDTH:
+        image = image.scaledToWidth(THUMBNAIL_MAX_WIDTH, Qt.SmoothTransformation)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # older versions of this level are stale now
+    for stale_path in path.parent.glob(f"{_thumbnail_prefix(key)}*.png"):
+        stale_path.unlink(missing_ok=True)
+
+    temporary_path = path.with_suffix(".tmp")
+    image.save(str(temporary_path), "PNG")
+    temporary_path.replace(path)
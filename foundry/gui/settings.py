@@ -58,6 +58,9 @@ SETTINGS["block_transparency"] = True
 SETTINGS["object_scroll_enabled"] = False
 SETTINGS["object_tooltip_enabled"] = True
 
+SETTINGS["level_prefetch_size"] = 8
+SETTINGS["level_thumbnails_enabled"] = True
+
 
 def load_settings():
     if not default_settings_path.exists():
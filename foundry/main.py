@@ -4,6 +4,7 @@ import os
 import sys
 import traceback
 from argparse import ArgumentParser, BooleanOptionalAction
+from multiprocessing import freeze_support
 
 import pretty_errors  # noqa: F401 is used to provide nicer messages throughout the project.
 from PySide6.QtWidgets import QApplication, QMessageBox
@@ -23,6 +24,11 @@ from foundry.gui.MainWindow import MainWindow  # noqa: E402
 
 
 def start():
+    if len(sys.argv) > 1 and sys.argv[1] == "render":
+        from foundry.render import start as start_render
+
+        return start_render(sys.argv[2:])
+
     parser = ArgumentParser(description="The future of editing SMB3!")
     parser.add_argument("--path", dest="path", type=str, help="The path to the ROM", default="")
     parser.add_argument(
@@ -63,6 +69,9 @@ def main(path_to_rom: str = "", world=None, level=None):
 
 
 if __name__ == "__main__":
+    # the level thumbnails are rendered in worker processes, which need this in frozen builds
+    freeze_support()
+
     if len(sys.argv) > 1:
         path = sys.argv[1]
     else:
@@ -0,0 +1,180 @@
+import os
+import re
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtGui import QGuiApplication
+
+from foundry import home_dir
+from foundry.game.File import ROM
+from foundry.game.gfx.drawable.TileAtlas import TileAtlas, graphics_hash
+from foundry.game.level.Level import Level
+from foundry.game.level.LevelPrefetcher import LevelKey, level_meta_key
+from foundry.game.level.util import Level as LevelMeta
+from foundry.gui.LevelRenderer import save_level_png
+from foundry.smb3parse.objects.object_set import WORLD_MAP_OBJECT_SET
+
+default_atlas_path = home_dir / "tile_atlas"
+
+_worker_app: Optional[QGuiApplication] = None
+
+
+def start(arguments: Optional[list[str]] = None):
+    parser = ArgumentParser(prog="foundry render", description="Renders the levels of a ROM into PNG files.")
+    parser.add_argument("path", type=str, help="The path to the ROM")
+    parser.add_argument("output", type=str, help="The directory to save the images in")
+    parser.add_argument(
+        "--world", type=int, action="append", help="Only render levels of this world, can be given multiple times"
+    )
+    parser.add_argument("--name", type=str, help="Only render levels, whose name contains this text", default=None)
+    parser.add_argument("--zoom", type=float, help="The zoom of the images, 1 being 16 pixels per block", default=1)
+    parser.add_argument("--jobs", type=int, help="The amount of worker processes", default=os.cpu_count())
+    parser.add_argument(
+        "--atlas", type=str, help="Where to keep the decoded graphics of the ROM", default=str(default_atlas_path)
+    )
+
+    args = parser.parse_args(arguments)
+
+    failed_levels = main(args.path, args.output, args.world, args.name, args.zoom, args.jobs, args.atlas)
+
+    if failed_levels:
+        raise SystemExit(1)
+
+
+def main(
+    path_to_rom: str,
+    output_dir: str,
+    worlds: Optional[list[int]] = None,
+    name: Optional[str] = None,
+    zoom: float = 1,
+    jobs: Optional[int] = None,
+    atlas_path: str = str(default_atlas_path),
+) -> list[str]:
+    """
+    Renders the levels listed in levels.json into PNG files, using a pool of worker processes.
+
+    The graphics of the ROM are decoded once into a tile atlas, which every worker loads, instead of decoding them
+    again. The atlas is kept between runs and only made anew, when the graphics of the ROM changed.
+
+    :param path_to_rom: The ROM to take the levels from.
+    :param output_dir: The directory to save the images in. Created, if it does not exist.
+    :param worlds: Only render levels appearing in these worlds. All levels, if None.
+    :param name: Only render levels, whose name contains this text, ignoring case. All levels, if None.
+    :param zoom: The zoom of the images, 1 being 16 pixels per block.
+    :param jobs: The amount of worker processes. The amount of CPUs, if None.
+    :param atlas_path: The file to save the tile atlas in.
+
+    :return: The names of the levels, that could not be rendered.
+    """
+    ROM.load_from_file(path_to_rom)
+
+    _prepare_atlas(Path(atlas_path))
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    levels = filter_levels(Level.offsets, worlds, name)
+
+    failed_levels = []
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(path_to_rom, atlas_path),
+    ) as executor:
+        futures = {
+            executor.submit(_render_level, key, output_path / file_name, zoom): file_name
+            for file_name, key in levels.items()
+        }
+
+        for count, future in enumerate(as_completed(futures), 1):
+            file_name = futures[future]
+            error = future.result()
+
+            if error is None:
+                print(f"[{count}/{len(futures)}] Rendered {file_name}")
+            else:
+                print(f"[{count}/{len(futures)}] Failed to render {file_name}: {error}")
+                failed_levels.append(file_name)
+
+    return failed_levels
+
+
+def filter_levels(
+    level_metas: list[LevelMeta], worlds: Optional[list[int]] = None, name: Optional[str] = None
+) -> dict[str, LevelKey]:
+    """
+    Selects the levels to render, skipping world maps and levels appearing more than once.
+
+    :return: The file names of the images mapped to the levels rendered into them.
+    """
+    levels: dict[str, LevelKey] = {}
+
+    for index, level_meta in enumerate(level_metas):
+        if level_meta.tileset == WORLD_MAP_OBJECT_SET:
+            continue
+
+        if worlds and not any(location.world in worlds for location in level_meta.display_information.locations):
+            continue
+
+        level_name = level_meta.display_information.name or "Unnamed level"
+
+        if name is not None and name.lower() not in level_name.lower():
+            continue
+
+        key = level_meta_key(level_meta)
+
+        if key in levels.values():
+            continue
+
+        levels[f"{index:03} {_to_file_name(level_name)}.png"] = key
+
+    return levels
+
+
+def _to_file_name(name: str) -> str:
+    return re.sub(r"[^\w\- ]", "_", name).strip()
+
+
+def _prepare_atlas(atlas_path: Path):
+    rom = ROM()
+
+    if atlas_path.exists():
+        try:
+            if TileAtlas.load(atlas_path).rom_hash == graphics_hash(rom):
+                return
+        except ValueError:
+            pass
+
+    atlas_path.parent.mkdir(parents=True, exist_ok=True)
+    TileAtlas.from_rom(rom).save(atlas_path)
+
+
+def _init_worker(path_to_rom: str, atlas_path: str):
+    global _worker_app
+
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    _worker_app = QGuiApplication([])
+
+    ROM.load_from_file(path_to_rom)
+    TileAtlas.install(TileAtlas.load(atlas_path))
+
+
+def _render_level(key: LevelKey, path: Path, zoom: float) -> Optional[str]:
+    object_data_offset, enemy_data_offset, object_set = key
+
+    try:
+        level = Level(path.stem, object_data_offset, enemy_data_offset, object_set)
+        save_level_png(level, path, zoom)
+    except (IndexError, ValueError) as error:
+        # hacked ROMs might have levels.json entries pointing to data, which is not a valid level anymore
+        return str(error)
+    except Exception as error:
+        # a single broken level should not keep the others from being rendered
+        return repr(error)
+
+    return None
@@ -0,0 +1,82 @@
+import pytest
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QColor, QImage, QPainter, Qt
+
+from foundry.game.EnemyDefinitions import GeneratorType, get_enemy_metadata
+from foundry.game.gfx.drawable import apply_selection_overlay
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.gfx.objects.EnemyItem import MASK_COLOR
+from foundry.game.gfx.objects.EnemyItemFactory import EnemyItemFactory
+from foundry.smb3parse.objects.object_set import PLAINS_OBJECT_SET
+
+
+def _block_enemy():
+    enemy_id = next(
+        enemy_id
+        for enemy_id, definition in enumerate(get_enemy_metadata().__root__)
+        if definition.orientation != GeneratorType.SINGLE_SPRITE_OBJECT and definition.blocks
+    )
+
+    return EnemyItemFactory(PLAINS_OBJECT_SET, 0).from_properties(enemy_id, 0, 0)
+
+
+def _draw(draw_function, block_length: int) -> QImage:
+    image = QImage(8 * block_length, 8 * block_length, QImage.Format_RGB888)
+    image.fill(0)
+
+    painter = QPainter(image)
+    draw_function(painter)
+    painter.end()
+
+    return image
+
+
+def _draw_uncached(painter: QPainter, enemy, block_length: int):
+    # how the blocks were drawn, before their images were cached
+    for i, block_id in enumerate(enemy.blocks):
+        x, y = enemy._block_position(i, True)
+
+        block = enemy.png_data.copy(
+            QRect((block_id % 64) * Block.WIDTH, (block_id // 64) * Block.WIDTH, Block.WIDTH, Block.HEIGHT)
+        )
+
+        mask = block.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskOutColor)
+        block.setAlphaChannel(mask)
+
+        if enemy.selected:
+            apply_selection_overlay(block, mask)
+
+        if block_length != Block.SIDE_LENGTH:
+            block = block.scaled(block_length, block_length)
+
+        painter.drawImage(x * block_length, y * block_length, block)
+
+
+@pytest.mark.parametrize("selected", [False, True])
+@pytest.mark.parametrize("block_length", [Block.SIDE_LENGTH, Block.SIDE_LENGTH // 2, Block.SIDE_LENGTH * 2])
+def test_cached_blocks_match_uncached_blocks(rom_singleton, qtbot, selected, block_length):
+    # GIVEN an enemy made of blocks, that was drawn before with another selection and block length
+    enemy = _block_enemy()
+
+    enemy.selected = not selected
+    _draw(lambda painter: enemy.draw_blocks(painter, Block.SIDE_LENGTH, True), Block.SIDE_LENGTH)
+
+    # WHEN it is drawn with its cached block images
+    enemy.selected = selected
+    image = _draw(lambda painter: enemy.draw_blocks(painter, block_length, True), block_length)
+
+    # THEN it looks the same, as when masking, selecting and scaling the blocks anew
+    assert image == _draw(lambda painter: _draw_uncached(painter, enemy, block_length), block_length)
+
+
+def test_blocks_change_with_selection(rom_singleton, qtbot):
+    # GIVEN an enemy made of blocks, that was drawn once
+    enemy = _block_enemy()
+
+    image = _draw(lambda painter: enemy.draw_blocks(painter, Block.SIDE_LENGTH, True), Block.SIDE_LENGTH)
+
+    # WHEN it is selected
+    enemy.selected = True
+
+    # THEN it is drawn with the selection
+    assert _draw(lambda painter: enemy.draw_blocks(painter, Block.SIDE_LENGTH, True), Block.SIDE_LENGTH) != image
@@ -1,5 +1,7 @@
+import json
 import os
 import subprocess
+from hashlib import sha1
 from itertools import product
 from pathlib import Path
 
@@ -8,9 +10,14 @@ from git.repo.base import Repo
 
 from foundry.core.point.Point import Point
 from foundry.game.File import ROM
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.gfx.objects.Jump import Jump
+from foundry.game.gfx.objects.LevelObject import ENDING_OBJECT_OFFSET
 from foundry.game.gfx.objects.LevelObjectFactory import LevelObjectFactory
+from foundry.game.ObjectDefinitions import GeneratorType
 from foundry.gui.ObjectIcon import get_minimal_icon_object
 from foundry.gui.ObjectViewer import ObjectDrawArea
+from foundry.smb3parse.constants import TILESET_ENDINGS
 from foundry.smb3parse.objects import MAX_DOMAIN, MAX_ID_VALUE
 from foundry.smb3parse.objects.object_set import (
     DUNGEON_GRAPHICS_SET,
@@ -19,6 +26,8 @@ from foundry.smb3parse.objects.object_set import (
     HILLY_OBJECT_SET,
     MAX_OBJECT_SET,
     MUSHROOM_OBJECT_SET,
+    PLAINS_GRAPHICS_SET,
+    PLAINS_OBJECT_SET,
     SPADE_BONUS_OBJECT_SET,
     UNDERGROUND_GRAPHICS_SET,
     UNDERGROUND_OBJECT_SET,
@@ -29,6 +38,20 @@ from tests.conftest import compare_images
 reference_image_dir = Path(__file__).parent.joinpath("test_refs")
 os.makedirs(reference_image_dir, exist_ok=True)
 
+rendered_blocks_path = Path(__file__).parent.joinpath("test_data", "rendered_blocks.json")
+
+RENDER_CASES = [
+    # x, y, length, in a vertical level, on top of a copy of itself
+    (0, 0, 0, False, False),
+    (21, 12, 9, False, False),
+    (250, 25, 0x0F, False, False),  # past the end of the level and below the ground
+    (5, 40, 9, True, False),
+    (21, 12, 9, False, True),
+]
+
+ENDING_GRAPHICS_START = ENDING_OBJECT_OFFSET - 1
+ENDING_GRAPHICS_LENGTH = (max(TILESET_ENDINGS) + 1) * 0x60 + 1
+
 
 def _test_object_against_reference(level_object, qtbot, minimal=False):
     object_set_number = level_object.object_set.number
@@ -209,3 +232,174 @@ def test_all_minimal_objects(factory, domain, obj_id, qtbot):
         pytest.skip("MSG_CRASH")
 
     _test_object_against_reference(get_minimal_icon_object(level_object), qtbot, minimal=True)
+
+
+def _visible_object(level):
+    return next(level_object for level_object in level.objects if level_object.rendered_blocks)
+
+
+def test_image_kept_until_object_changes(level):
+    # GIVEN an object, that was drawn once
+    level_object = _visible_object(level)
+
+    image = level_object._get_image(Block.WIDTH, False)
+
+    # WHEN it is drawn again without any changes
+    # THEN the same image is used
+    assert level_object._get_image(Block.WIDTH, False) is image
+
+
+def test_image_changes_with_selection(level):
+    # GIVEN an object, that was drawn once
+    level_object = _visible_object(level)
+
+    image = level_object._get_image(Block.WIDTH, False)
+
+    # WHEN it is selected
+    level_object.selected = True
+
+    # THEN it is drawn anew, with the selection
+    assert level_object._get_image(Block.WIDTH, False) != image
+
+
+def test_image_changes_with_palette(level):
+    # GIVEN an object, that was drawn once
+    level_object = _visible_object(level)
+
+    image = level_object._get_image(Block.WIDTH, False)
+
+    # WHEN its palettes change
+    level_object.palette_group = tuple(
+        tuple((color + 1) % 0x40 for color in palette) for palette in level_object.palette_group
+    )
+
+    # THEN it is drawn anew, with the new colors
+    assert level_object._get_image(Block.WIDTH, False) != image
+
+
+def test_image_changes_with_rom(level):
+    # GIVEN an object, that was drawn once
+    level_object = _visible_object(level)
+
+    image = level_object._get_image(Block.WIDTH, False)
+
+    # WHEN the ROM is written to, which might have changed the graphics of its blocks
+    rom = ROM()
+    rom.bulk_write(rom.bulk_read(1, level.object_offset), level.object_offset)
+
+    # THEN it is drawn anew
+    assert level_object._get_image(Block.WIDTH, False) is not image
+
+
+def test_rect_of_moved_object(level):
+    # GIVEN an object, that was moved, without rendering it right away
+    level_object = _visible_object(level)
+
+    rect = level_object.get_rect()
+    scaled_rect = level_object.get_rect(Block.WIDTH)
+
+    level_object.move_by(1, 0, render=False)
+
+    # WHEN its rect is requested
+    # THEN it is at its new position
+    assert level_object.get_rect().topLeft() == rect.translated(1, 0).topLeft()
+    assert level_object.get_rect(Block.WIDTH).topLeft() == scaled_rect.translated(Block.WIDTH, 0).topLeft()
+
+
+@pytest.mark.parametrize("block_length", [1, Block.WIDTH])
+def test_rect_is_a_copy(level, block_length):
+    # GIVEN the rect of an object
+    level_object = _visible_object(level)
+
+    rect = level_object.get_rect(block_length)
+
+    # WHEN it is changed by the caller
+    rect.translate(1, 1)
+
+    # THEN the object is still where it was
+    assert level_object.get_rect(block_length) == rect.translated(-1, -1)
+
+
+def _rendered_blocks_digests() -> dict[str, str]:
+    """
+    A digest of the rendered blocks and rects of objects in all kinds of places, for every object set and domain.
+    """
+    digests = {}
+
+    for object_set in range(MAX_OBJECT_SET + 1):
+        if object_set in [WORLD_MAP_OBJECT_SET, MUSHROOM_OBJECT_SET, SPADE_BONUS_OBJECT_SET]:
+            continue
+
+        for domain in range(MAX_DOMAIN + 1):
+            digest = sha1()
+
+            for obj_id, (x, y, length, is_vertical, is_stacked) in product(gen_object_ids(), RENDER_CASES):
+                objects_ref = []
+                factory = LevelObjectFactory(object_set, object_set, 0, objects_ref, is_vertical)
+
+                if is_stacked:
+                    objects_ref.append(factory.from_properties(domain, obj_id, x, y + 4, length, 0))
+
+                level_object = factory.from_properties(domain, obj_id, x, y, length, len(objects_ref))
+
+                if isinstance(level_object, Jump):
+                    continue
+
+                objects_ref.append(level_object)
+
+                level_object.render()
+
+                digest.update(
+                    str((obj_id, level_object.rect.getRect(), list(level_object.rendered_blocks))).encode("ascii")
+                )
+
+            digests[f"{object_set}_{domain}"] = digest.hexdigest()
+
+    return digests
+
+
+def test_rendered_blocks_unchanged():
+    # GIVEN the rendered blocks and rects of objects, from before they were kept in arrays, and ending graphics,
+    # which do not depend on the ROM used
+    expected_digests = json.loads(rendered_blocks_path.read_text())
+
+    rom = ROM()
+    original_data = rom.bulk_read(ENDING_GRAPHICS_LENGTH, ENDING_GRAPHICS_START)
+
+    rom.bulk_write(
+        bytearray((index * 37 + 11) % 0x100 for index in range(ENDING_GRAPHICS_LENGTH)), ENDING_GRAPHICS_START
+    )
+
+    # WHEN the same objects are rendered now
+    try:
+        digests = _rendered_blocks_digests()
+    finally:
+        rom.bulk_write(original_data, ENDING_GRAPHICS_START)
+
+    # THEN they are the same
+    assert digests == expected_digests
+
+
+def test_ending_changes_with_rom():
+    # GIVEN a rendered level ending
+    factory = LevelObjectFactory(PLAINS_OBJECT_SET, PLAINS_GRAPHICS_SET, 0, [], False)
+    ending = factory.from_properties(2, 0x09, 16, 16, 0, 0)
+
+    assert ending.orientation == GeneratorType.ENDING
+
+    rendered_blocks = list(ending.rendered_blocks)
+
+    # WHEN its graphic is changed in the ROM and it is rendered again
+    rom = ROM()
+    graphic_offset = ENDING_OBJECT_OFFSET + ending.object_set.get_ending_offset() * 0x60 - 1
+    original_data = rom.bulk_read(0x60, graphic_offset)
+
+    rom.bulk_write(bytearray((byte + 1) % 0x100 for byte in original_data), graphic_offset)
+
+    try:
+        ending.render()
+    finally:
+        rom.bulk_write(original_data, graphic_offset)
+
+    # THEN the new graphic is used
+    assert list(ending.rendered_blocks) != rendered_blocks
@@ -0,0 +1,52 @@
+import pytest
+from PySide6.QtGui import QImage, QPainter
+
+from foundry.core.graphics_set.GraphicsSet import GraphicsSet
+from foundry.core.palette.PaletteGroup import MutablePaletteGroup
+from foundry.game.gfx.drawable.Sprite import Sprite
+from foundry.game.gfx.drawable.SpriteAtlas import get_sprite_atlas
+from foundry.smb3parse.objects.object_set import PLAINS_GRAPHICS_SET
+
+
+def _draw(draw_function) -> QImage:
+    image = QImage(64, 64, QImage.Format_RGB888)
+    image.fill(0)
+
+    painter = QPainter(image)
+    draw_function(painter)
+    painter.end()
+
+    return image
+
+
+@pytest.mark.parametrize("horizontal_mirror", [False, True])
+@pytest.mark.parametrize("vertical_mirror", [False, True])
+@pytest.mark.parametrize("size", [(8, 16), (4, 8), (12, 24)])
+def test_atlas_matches_sprites(rom_singleton, qtbot, horizontal_mirror, vertical_mirror, size):
+    # GIVEN a graphics set and palette group
+    graphics_set = GraphicsSet.from_tileset(PLAINS_GRAPHICS_SET)
+    palette_group = tuple(tuple(palette) for palette in MutablePaletteGroup.from_tileset(1, 4))
+
+    width, height = size
+
+    for index in range(0, 0x100, 0x12):
+        sprite = Sprite(index, palette_group, 1, graphics_set, horizontal_mirror, vertical_mirror)
+
+        # WHEN a sprite is drawn from the atlas
+        atlas_image = _draw(
+            lambda painter: get_sprite_atlas(graphics_set, palette_group).draw(
+                painter, index, 1, 3, 5, width, height, horizontal_mirror, vertical_mirror
+            )
+        )
+
+        # THEN it looks the same as drawing the sprite on its own
+        assert atlas_image == _draw(lambda painter: sprite.draw(painter, 3, 5, width, height))
+
+
+def test_atlas_is_shared(rom_singleton):
+    # GIVEN a graphics set and palette group
+    graphics_set = GraphicsSet.from_tileset(PLAINS_GRAPHICS_SET)
+    palette_group = MutablePaletteGroup.from_tileset(1, 4)
+
+    # THEN asking for its atlas twice gives the same atlas
+    assert get_sprite_atlas(graphics_set, palette_group) is get_sprite_atlas(graphics_set, palette_group)
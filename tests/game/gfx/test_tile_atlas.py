@@ -0,0 +1,64 @@
+import pytest
+
+from foundry.core.graphics_set.GraphicsSet import GraphicsSet
+from foundry.game.File import ROM
+from foundry.game.gfx.drawable.TileAtlas import (
+    TILE_SIZE,
+    TileAtlas,
+    decode_color_indices,
+    graphics_hash,
+)
+from foundry.smb3parse.objects.object_set import PLAINS_GRAPHICS_SET
+
+
+@pytest.fixture
+def atlas(rom_singleton):
+    atlas = TileAtlas.from_rom(ROM())
+    TileAtlas.install(atlas)
+
+    yield atlas
+
+    TileAtlas.install(None)
+
+
+@pytest.mark.parametrize("mirrored", [False, True])
+def test_atlas_matches_decoded_tiles(atlas, mirrored):
+    # GIVEN a graphics set and an atlas of the whole ROM
+    graphics_set = GraphicsSet.from_tileset(PLAINS_GRAPHICS_SET)
+    graphics_data = bytes(graphics_set)
+
+    for tile_index in range(len(graphics_data) // TILE_SIZE):
+        tile_data = graphics_data[tile_index * TILE_SIZE : (tile_index + 1) * TILE_SIZE]
+        expected_indices = decode_color_indices(tile_data)
+
+        if mirrored:
+            expected_indices = b"".join(expected_indices[row : row + 8][::-1] for row in range(0, 64, 8))
+
+        # THEN the atlas holds the same palette indices as decoding the tile directly
+        assert atlas.covers(graphics_set, tile_index)
+        assert atlas.color_indices(graphics_set, tile_index, mirrored) == expected_indices
+
+
+def test_atlas_save_and_load(atlas, tmp_path):
+    # WHEN an atlas is saved and loaded again
+    path = tmp_path / "atlas"
+    atlas.save(path)
+
+    loaded_atlas = TileAtlas.load(path)
+
+    # THEN it is the same atlas and belongs to the loaded ROM
+    assert loaded_atlas.data == atlas.data
+    assert loaded_atlas.rom_hash == graphics_hash(ROM())
+
+
+def test_atlas_outdated_after_rom_write(atlas):
+    # GIVEN an installed atlas
+    graphics_set = GraphicsSet.from_tileset(PLAINS_GRAPHICS_SET)
+
+    assert atlas.covers(graphics_set, 0)
+
+    # WHEN the ROM is changed
+    ROM().write(0x10, ROM().read(0x10, 1))
+
+    # THEN the atlas is not used anymore
+    assert not atlas.covers(graphics_set, 0)
@@ -1,5 +1,6 @@
 import pytest
 
+from foundry.core.point.Point import Point
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
 from foundry.game.gfx.objects.Jump import Jump
 from foundry.game.gfx.objects.LevelObject import LevelObject
@@ -34,6 +35,23 @@ def test_not_too_big_jump(level):
     assert not level.is_too_big()
 
 
+def test_jump_at(level):
+    # GIVEN a level with a single jump
+    jump = level.jumps[0]
+    jump_rect = jump.get_rect(1, level.is_vertical)
+
+    # THEN the jump is found in its area and nowhere else
+    assert level.jump_at(*jump_rect.topLeft().toTuple()) is jump
+    assert level.jump_at(*jump_rect.bottomRight().toTuple()) is jump
+    assert level.jump_at(jump_rect.right() + 1, jump_rect.top()) is None
+
+    # WHEN the jump is removed
+    level.remove_jump(jump)
+
+    # THEN it is not found anymore
+    assert level.jump_at(*jump_rect.topLeft().toTuple()) is None
+
+
 def test_not_too_big_object(level):
     # GIVEN a level
     pass
@@ -94,3 +112,72 @@ def test_level_insert_in_vertical_level(level):
     assert added_object.obj_index == object_index
     assert added_object.rendered_position.x == x
     assert added_object.rendered_position.y == y
+
+
+def test_rendered_objects_are_clean(level):
+    # GIVEN a level, whose objects were rendered
+    for level_object in level.objects:
+        level_object.render_if_dirty()
+
+    # WHEN nothing changes
+    pass
+
+    # THEN no object needs to be rendered again
+    assert not any(level_object.is_dirty for level_object in level.objects)
+
+
+def test_remove_object_marks_dependents_dirty(level):
+    # GIVEN a level, whose objects were rendered
+    for level_object in level.objects:
+        level_object.render_if_dirty()
+
+    # WHEN the first object is removed
+    removed_object = level.objects[0]
+    level.remove_object(removed_object)
+
+    # THEN only the objects reaching down to the ground, that it could have been in the way of, have to be rendered
+    # again and the indexes are up to date
+    for index, level_object in enumerate(level.objects):
+        assert level_object.is_dirty == level_object.depends_on(removed_object.get_rect())
+        assert level_object.index_in_level == index
+
+
+def test_changing_object_index_marks_object_dirty(level):
+    # GIVEN a rendered object
+    level_object = level.objects[0]
+    level_object.render_if_dirty()
+
+    # WHEN its object index is set
+    level_object.obj_index = level_object.obj_index
+
+    # THEN it needs to be rendered again
+    assert level_object.is_dirty
+
+
+def test_moving_object_updates_cached_geometry(level):
+    # GIVEN an object, whose geometry was asked for before
+    level_object = level.objects[0]
+    old_position = level_object.position
+    level_object.get_rect(16)
+
+    # WHEN it is moved
+    level_object.position = Point(old_position.x + 1, old_position.y)
+
+    # THEN its position and rect are up to date
+    assert level_object.position == Point(old_position.x + 1, old_position.y)
+    assert level_object.get_rect(16).x() == level_object.rendered_position.x * 16
+
+
+def test_move_objects(level):
+    # GIVEN a selection of objects
+    objects = level.objects[1:4] + level.enemies[:2]
+    old_positions = [obj.position for obj in objects]
+
+    # WHEN they are moved at once
+    level.move_objects(objects, 1, 1)
+
+    # THEN all of them moved and all level objects are rendered again
+    for obj, old_position in zip(objects, old_positions):
+        assert obj.position == Point(old_position.x + 1, old_position.y + 1)
+
+    assert not any(level_object.is_dirty for level_object in level.objects)
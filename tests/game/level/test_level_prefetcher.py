@@ -0,0 +1,76 @@
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level
+from foundry.game.level.LevelPrefetcher import LevelPrefetcher
+from foundry.game.level.util import get_world_levels
+from foundry.gui.LevelSelector import LevelSelector
+from foundry.gui.settings import SETTINGS
+from foundry.smb3parse.objects.object_set import PLAINS_OBJECT_SET
+from tests.conftest import (
+    level_1_1_enemy_address,
+    level_1_1_object_address,
+    level_1_2_enemy_address,
+    level_1_2_object_address,
+)
+
+level_1_2_key = (level_1_2_object_address - Level.HEADER_LENGTH, level_1_2_enemy_address, PLAINS_OBJECT_SET)
+
+
+def test_prefetched_level_is_taken(rom_singleton, qtbot):
+    # GIVEN a prefetcher, that prefetched level 1-2
+    prefetcher = LevelPrefetcher(1)
+    prefetcher.prefetch([level_1_2_key])
+
+    qtbot.waitUntil(lambda: level_1_2_key in prefetcher)
+
+    # WHEN the level is taken out of it
+    level = prefetcher.take(*level_1_2_key)
+
+    # THEN it is the same as a freshly loaded level and is not cached anymore
+    assert level is not None
+    assert level.to_bytes() == Level("", *level_1_2_key).to_bytes()
+    assert level_1_2_key not in prefetcher
+
+
+def test_rom_write_invalidates_prefetched_levels(rom_singleton, qtbot):
+    # GIVEN a prefetcher, that prefetched level 1-2
+    prefetcher = LevelPrefetcher(1)
+    prefetcher.prefetch([level_1_2_key])
+
+    qtbot.waitUntil(lambda: level_1_2_key in prefetcher)
+
+    # WHEN the ROM is written to
+    rom = ROM()
+    rom.bulk_write(rom.bulk_read(1, level_1_2_object_address), level_1_2_object_address)
+
+    # THEN the prefetched level is discarded
+    assert prefetcher.take(*level_1_2_key) is None
+
+
+def test_neighbour_selected_in_level_selector_is_taken(rom_singleton, qtbot, monkeypatch):
+    # GIVEN a prefetcher, that prefetched the neighbours of level 1-1
+    monkeypatch.setitem(SETTINGS, "level_thumbnails_enabled", False)
+
+    level = Level("Level 1-1", level_1_1_object_address, level_1_1_enemy_address, PLAINS_OBJECT_SET)
+
+    prefetcher = LevelPrefetcher()
+    prefetcher.prefetch_around(level)
+
+    qtbot.waitUntil(lambda: not prefetcher._queue)
+
+    # WHEN the level after it is selected in the level selector
+    world_levels = get_world_levels(1, Level.offsets)
+    index = [level_meta.generator_pointer for level_meta in world_levels].index(level.object_offset)
+
+    level_selector = LevelSelector(None)
+    qtbot.addWidget(level_selector)
+
+    level_selector.world_list.setCurrentRow(1)
+    level_selector.level_list.setCurrentRow(index + 1)
+    level_selector.on_level_click()
+    level_selector.on_ok()
+
+    # THEN the level it loads was prefetched
+    assert (
+        prefetcher.take(level_selector.object_data_offset, level_selector.enemy_data_offset, level_selector.object_set)
+        is not None
+    )
@@ -0,0 +1,27 @@
+from foundry.game.File import ROM
+from foundry.gui.AutoScrollDrawer import HORIZONTAL_SCROLL_0, get_auto_scroll_path
+from foundry.smb3parse.constants import AScroll_Movement
+
+
+def test_path_kept_until_rom_changes(level):
+    # GIVEN the autoscroll path of a level, that was simulated once
+    auto_scroll_row = HORIZONTAL_SCROLL_0 << 4
+
+    path = get_auto_scroll_path(auto_scroll_row, level)
+
+    # WHEN it is asked for again without any changes
+    # THEN it is not simulated again
+    assert get_auto_scroll_path(auto_scroll_row, level) is path
+
+    # WHEN the ROM is written to, which might have changed the movements of the autoscroll
+    rom = ROM()
+    rom.bulk_write(rom.bulk_read(1, AScroll_Movement), AScroll_Movement)
+
+    # THEN it is simulated again, to the same path
+    new_path = get_auto_scroll_path(auto_scroll_row, level)
+
+    assert new_path is not path
+
+    assert new_path.movements == path.movements
+    assert new_path.end == path.end
+    assert new_path.screen_polygon.toList() == path.screen_polygon.toList()
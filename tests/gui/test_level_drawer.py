@@ -0,0 +1,225 @@
+import pytest
+from PySide6.QtCore import QLine, QPoint, QRect, QSize, Qt
+from PySide6.QtGui import QImage, QPainter
+
+from foundry import data_dir
+from foundry.game.gfx.drawable.Block import Block
+from foundry.game.gfx.objects.LevelObject import (
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    LevelObject,
+)
+from foundry.gui.LevelDrawer import (
+    CULLING_MARGIN,
+    ITEM_ARROW,
+    MARIO_POWERUP_Y_OFFSETS,
+    LevelDrawer,
+    OverlayKind,
+    _make_image_selected,
+    default_block_fills,
+    drawn_bounds,
+    get_overlay,
+)
+from foundry.gui.settings import SETTINGS
+
+
+def _draw(drawer: LevelDrawer, level, visible_rect=None) -> QImage:
+    image = QImage(level.get_rect(drawer.block_length).size(), QImage.Format_RGB888)
+
+    painter = QPainter(image)
+    drawer.draw(painter, level, visible_rect)
+    painter.end()
+
+    return image
+
+
+def test_objects_outside_visible_rect_are_culled(level, qtbot, monkeypatch):
+    # GIVEN a level drawer and the first screen of a level, that is longer than that
+    drawer = LevelDrawer()
+
+    visible_rect = QRect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    drawn_objects = []
+    monkeypatch.setattr(LevelObject, "draw", lambda level_object, *_, **__: drawn_objects.append(level_object))
+
+    # WHEN only the first screen is drawn
+    _draw(drawer, level, QRect(visible_rect.topLeft(), visible_rect.size() * drawer.block_length))
+
+    # THEN only the objects in or close to it are drawn
+    culling_rect = visible_rect.adjusted(-CULLING_MARGIN, -CULLING_MARGIN, CULLING_MARGIN, CULLING_MARGIN)
+
+    def is_close(level_object: LevelObject) -> bool:
+        bounds = drawn_bounds(level_object)
+
+        return culling_rect.intersects(QRect(bounds.topLeft(), bounds.size().expandedTo(QSize(1, 1))))
+
+    assert drawn_objects
+    assert all(is_close(level_object) for level_object in drawn_objects)
+    assert any(not is_close(level_object) for level_object in level.objects)
+
+
+def test_icons_scaled_to_new_block_length(qtbot):
+    # GIVEN a level drawer, that scaled an icon and its selection overlay for its block length
+    drawer = LevelDrawer()
+
+    drawer._icon(ITEM_ARROW)
+    drawer._icon(ITEM_ARROW, selected=True)
+
+    # WHEN the block length changes
+    drawer.block_length = Block.WIDTH // 2
+
+    # THEN the icon and its selection overlay are scaled to the new block length
+    scaled_icon = ITEM_ARROW.scaled(drawer.block_length, drawer.block_length)
+
+    assert drawer._icon(ITEM_ARROW) == scaled_icon
+    assert drawer._icon(ITEM_ARROW, selected=True) == _make_image_selected(scaled_icon)
+
+
+def test_overlays_drawn_after_zoom(level, qtbot):
+    # GIVEN a level with overlays, some of them selected, that was drawn at one block length
+    objects_with_overlays = [
+        level_object for level_object in level.get_all_objects() if get_overlay(level_object).kind != OverlayKind.NONE
+    ]
+
+    assert objects_with_overlays
+
+    for level_object in objects_with_overlays[::2]:
+        level_object.selected = True
+
+    drawer = LevelDrawer()
+    _draw(drawer, level)
+
+    # WHEN it is drawn at another block length
+    drawer.block_length = Block.WIDTH // 2
+
+    image = _draw(drawer, level)
+
+    # THEN it looks the same as drawing it at that block length for the first time
+    new_drawer = LevelDrawer()
+    new_drawer.block_length = drawer.block_length
+
+    assert image == _draw(new_drawer, level)
+
+
+@pytest.mark.parametrize("block_length", [Block.WIDTH, Block.WIDTH // 2])
+def test_block_fills_match_single_blocks(level, qtbot, block_length):
+    # GIVEN a level drawer, that only draws a part of the level, which does not start at a screen or block row border
+    drawer = LevelDrawer()
+    drawer.block_length = block_length
+
+    drawer._culling_rect = QRect(3, 0, SCREEN_WIDTH + 3, level.height)
+    drawer._update_palettes(level)
+
+    for rect, block_indexes in default_block_fills(level):
+        # WHEN the blocks, that the level is filled with, are drawn with a tiled brush
+        brush_image = QImage(level.get_rect(block_length).size(), QImage.Format_ARGB32_Premultiplied)
+        brush_image.fill(Qt.transparent)
+
+        painter = QPainter(brush_image)
+        drawer._fill_with_blocks(painter, rect, block_indexes)
+        painter.end()
+
+        # THEN the same pixels are painted, as when drawing them block by block
+        block_image = QImage(brush_image.size(), QImage.Format_ARGB32_Premultiplied)
+        block_image.fill(Qt.transparent)
+
+        painter = QPainter(block_image)
+
+        for x, y in drawer._visible_blocks(level, rect):
+            block = drawer._blocks[block_indexes[x % len(block_indexes)]]
+            block.draw(painter, x * block_length, y * block_length, block_length)
+
+        painter.end()
+
+        assert brush_image == block_image
+
+
+def _paint(size: QSize, draw_function) -> QImage:
+    image = QImage(size, QImage.Format_RGB888)
+    image.fill(Qt.black)
+
+    painter = QPainter(image)
+    draw_function(painter)
+    painter.end()
+
+    return image
+
+
+def _draw_mario_uncached(painter: QPainter, level, block_length: int):
+    # how Mario was drawn, before mario.png and his frames were cached
+    mario_actions = QImage(str(data_dir / "mario.png"))
+    mario_actions.convertTo(QImage.Format_RGBA8888)
+
+    x_offset = 32 * level.start_action
+    y_offset = MARIO_POWERUP_Y_OFFSETS[SETTINGS["default_powerup"]]
+
+    mario_frame = mario_actions.copy(QRect(x_offset, y_offset, 32, 32)).scaled(2 * block_length, 2 * block_length)
+
+    painter.drawImage(QPoint(*level.header.mario_position()) * block_length, mario_frame)
+
+
+def test_mario_follows_start_action_powerup_and_zoom(level, qtbot, monkeypatch):
+    # GIVEN a level drawer, that draws Mario at the start of the level
+    drawer = LevelDrawer()
+
+    for start_action, powerup, block_length in [(0, 0, 16), (1, 0, 16), (1, 3, 16), (1, 3, 8)]:
+        # WHEN the start action of the level, the default power-up or the block length change between paints
+        level.start_action = start_action
+        monkeypatch.setitem(SETTINGS, "default_powerup", powerup)
+        drawer.block_length = block_length
+
+        size = level.get_rect(block_length).size()
+
+        # THEN Mario is drawn, as if his frame was cut from mario.png anew
+        assert _paint(size, lambda painter: drawer._draw_mario(painter, level)) == _paint(
+            size, lambda painter: _draw_mario_uncached(painter, level, block_length)
+        )
+
+
+class _LineRecordingPainter(QPainter):
+    def __init__(self, image: QImage):
+        super().__init__(image)
+
+        self.lines: list[QLine] = []
+
+    def drawLines(self, lines):
+        self.lines.extend(lines)
+
+        super().drawLines(lines)
+
+
+def test_grid_only_drawn_in_visible_rect(level, qtbot):
+    # GIVEN a level drawer and a part of the level, that does not start at a block or screen border
+    drawer = LevelDrawer()
+
+    visible_rect = QRect(QPoint(3 * SCREEN_WIDTH + 5, 2), QSize(SCREEN_WIDTH, SCREEN_HEIGHT) * drawer.block_length)
+
+    full_grid = QImage(level.get_rect(drawer.block_length).size(), QImage.Format_RGB888)
+    full_grid.fill(Qt.black)
+
+    painter = QPainter(full_grid)
+    drawer._culling_rect = level.get_rect()
+    drawer._draw_grid(painter, level)
+    painter.end()
+
+    # WHEN the grid is only drawn in that part of the level
+    culled_grid = QImage(full_grid.size(), QImage.Format_RGB888)
+    culled_grid.fill(Qt.black)
+
+    painter = _LineRecordingPainter(culled_grid)
+    painter.setClipRect(visible_rect)
+
+    culling_rect = drawer._get_culling_rect(painter, level, visible_rect)
+
+    drawer._culling_rect = culling_rect
+    drawer._draw_grid(painter, level)
+    painter.end()
+
+    # THEN only lines inside the culling rect are drawn, and the visible part looks the same as the whole grid
+    pixel_rect = QRect(culling_rect.topLeft() * drawer.block_length, culling_rect.size() * drawer.block_length)
+
+    assert painter.lines
+    assert all(pixel_rect.adjusted(0, 0, 1, 1).contains(line.p1()) for line in painter.lines)
+    assert all(pixel_rect.adjusted(0, 0, 1, 1).contains(line.p2()) for line in painter.lines)
+
+    assert culled_grid.copy(visible_rect) == full_grid.copy(visible_rect)
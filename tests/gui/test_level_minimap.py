@@ -0,0 +1,56 @@
+import pytest
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+
+from foundry.gui.LevelMinimap import MINIMAP_BLOCK_LENGTH, LevelMinimap
+
+
+@pytest.fixture
+def minimap(main_window, qtbot) -> LevelMinimap:
+    return main_window.minimap
+
+
+def test_size(minimap):
+    # GIVEN the minimap of a loaded level
+    level = minimap.level_ref.level
+
+    # THEN it shows every block of the level
+    assert minimap.sizeHint().toTuple() == (level.width * MINIMAP_BLOCK_LENGTH, level.height * MINIMAP_BLOCK_LENGTH)
+
+
+def test_incremental_update(main_window, minimap):
+    # GIVEN the minimap of a loaded level
+    level = minimap.level_ref.level
+
+    # WHEN an object is moved
+    level_object = level.objects[-1]
+    level_object.move_by(1, 0)
+    minimap.level_ref.data_changed.emit()
+
+    # THEN the minimap looks the same, as if it was made from scratch
+    fresh_minimap = LevelMinimap(None, minimap.level_ref, minimap.level_view, minimap.scroll_area)
+    fresh_minimap.level_ref.data_changed.emit()
+
+    assert minimap._image == fresh_minimap._image
+
+
+def test_click_to_jump(main_window, minimap, qtbot):
+    # GIVEN the minimap of a loaded level, in a window small enough to scroll
+    main_window.resize(400, 400)
+    main_window.show()
+    qtbot.waitExposed(main_window)
+
+    scroll_bar = minimap.scroll_area.horizontalScrollBar()
+    scroll_bar.setValue(0)
+
+    # WHEN a point far into the level is clicked
+    position = QPointF(minimap.sizeHint().width() - 1, 0)
+    minimap.mousePressEvent(
+        QMouseEvent(QEvent.MouseButtonPress, position, position, Qt.LeftButton, Qt.LeftButton, Qt.NoModifier)
+    )
+
+    # THEN the level view is scrolled to the end of the level
+    assert scroll_bar.value() == scroll_bar.maximum()
+    assert minimap.level_view.visible_rect().contains(
+        QPoint(minimap.level_view.width() - 1, minimap.level_view.visible_rect().top())
+    )
@@ -1,9 +1,12 @@
 import pytest
-from PySide6.QtCore import QPoint
-from PySide6.QtGui import Qt, QWheelEvent
+from PySide6.QtCore import QEvent, QMimeData, QPoint, QPointF
+from PySide6.QtGui import QDragMoveEvent, QImage, QMouseEvent, QPainter, Qt, QWheelEvent
 
 from foundry.game.gfx.objects.LevelObject import LevelObject
 from foundry.gui.HeaderEditor import HeaderEditor
+from foundry.gui.LevelDrawer import LevelDrawer, covered_rect
+from foundry.gui.LevelRenderer import render_level
+from foundry.gui.LevelTileRenderer import LevelTileRenderer, _tile_rects, snapshot_level
 from foundry.gui.LevelView import LevelView
 from foundry.gui.settings import SETTINGS
 from foundry.smb3parse.objects.object_set import PLAINS_OBJECT_SET
@@ -111,3 +114,187 @@ def test_wheel_event(scroll_amount, coordinates, wheel_delta, type_change, main_
     new_type = level_view.object_at(*coordinates).type
 
     assert new_type == original_type + type_change, (original_type, new_type)
+
+
+def test_save_screenshot(level_view, tmp_path):
+    # GIVEN a level view showing a level and the screenshot made from it
+    screenshot = level_view.make_screenshot().toImage().convertToFormat(QImage.Format_RGB888)
+
+    # WHEN the screenshot is streamed to disk band by band
+    path = tmp_path / "screenshot.png"
+    level_view.save_screenshot(str(path))
+
+    # THEN the saved image is the same as the one rendered in one go
+    saved_image = QImage(str(path)).convertToFormat(QImage.Format_RGB888)
+
+    assert saved_image.size() == level_view.level_ref.level.get_rect(level_view.block_length).size()
+    assert saved_image == screenshot
+
+
+def test_culled_paint_matches_screenshot(main_window, level_view, qtbot):
+    # GIVEN a level view inside of a scroll area, that is scrolled to the middle of the level
+    scroll_area = main_window.scroll_panel
+    scroll_area.resize(400, 300)
+    scroll_area.show()
+    qtbot.waitExposed(scroll_area)
+
+    scroll_area.horizontalScrollBar().setValue(scroll_area.horizontalScrollBar().maximum() // 2)
+
+    # WHEN only the visible part of the level is painted
+    visible_rect = level_view.visible_rect()
+    visible_part = level_view.grab(visible_rect).toImage().convertToFormat(QImage.Format_RGB888)
+
+    # THEN it looks the same as the same part of the whole level
+    screenshot = level_view.make_screenshot().toImage().convertToFormat(QImage.Format_RGB888)
+
+    assert visible_rect.width() < level_view.width()
+    assert visible_part == screenshot.copy(visible_rect)
+
+
+def test_tiles_rendered_in_background(main_window, level_view, qtbot):
+    # GIVEN a level view, that was painted once
+    level_view.grab()
+
+    # WHEN an object is moved and the level view is painted again
+    level_object = level_view.level_ref.level.objects[-1]
+    level_object.move_by(1, 0)
+    level_view.update()
+
+    level_view.grab()
+
+    # THEN the stale tiles are rendered again in the background and look the same as the level rendered in one go
+    qtbot.waitUntil(lambda: not level_view.tile_renderer._pending)
+
+    painted_level = level_view.grab().toImage().convertToFormat(QImage.Format_RGB888)
+    screenshot = level_view.make_screenshot().toImage().convertToFormat(QImage.Format_RGB888)
+
+    assert painted_level == screenshot
+
+
+def test_snapshot_keeps_its_own_geometry(level):
+    # GIVEN a snapshot of a level
+    snapshot = snapshot_level(level)
+
+    level_object = level.objects[-1]
+    snapshot_object = snapshot.objects[-1]
+
+    position = snapshot_object.position
+
+    # WHEN an object of the level is moved and its snapshot is rendered again
+    level_object.move_by(1, 0)
+    snapshot_object._render()
+
+    # THEN both keep their own geometry and look only at their own objects
+    assert snapshot_object.position == position
+    assert level_object.position.x == position.x + 1
+
+    assert snapshot_object.objects_ref is snapshot.objects
+    assert level_object.objects_ref is level.objects
+
+
+def test_snapshot_only_copies_changed_objects(level):
+    # GIVEN a snapshot of a level
+    object_snapshots = {}
+    snapshot = snapshot_level(level, object_snapshots)
+
+    # WHEN an object of the level is moved and another snapshot is taken
+    level.objects[-1].move_by(1, 0)
+
+    new_snapshot = snapshot_level(level, object_snapshots)
+
+    # THEN only the moved object is copied again, all others are taken from the first snapshot
+    assert new_snapshot.objects[-1] is not snapshot.objects[-1]
+    assert new_snapshot.objects[-1].position == level.objects[-1].position
+
+    assert all(new is old for new, old in zip(new_snapshot.objects[:-1], snapshot.objects[:-1]))
+    assert all(new is old for new, old in zip(new_snapshot.enemies, snapshot.enemies))
+
+    assert new_snapshot.objects[0].objects_ref is new_snapshot.objects
+
+
+def test_only_changed_tiles_rendered_again(level, qtbot):
+    # GIVEN a tile renderer, that rendered all tiles of a level
+    renderer = LevelTileRenderer(LevelDrawer())
+    image = QImage(level.get_rect(renderer.drawer.block_length).size(), QImage.Format_RGB888)
+
+    def draw():
+        painter = QPainter(image)
+        renderer.draw(painter, level, image.rect())
+        painter.end()
+
+    draw()
+
+    # WHEN an object is moved and the level is drawn again
+    level_object = level.objects[-1]
+    level_object.move_by(1, 0)
+
+    renderer.level_changed()
+    draw()
+
+    # THEN only the tiles around the object are rendered again, after which the level looks, as if rendered in one go
+    tile_rects = _tile_rects(level)
+    object_tiles = {
+        index for index, tile_rect in enumerate(tile_rects) if tile_rect.intersects(covered_rect(level_object))
+    }
+
+    try:
+        assert object_tiles <= renderer._pending
+        assert len(renderer._pending) < len(tile_rects)
+
+        qtbot.waitUntil(lambda: not renderer._pending)
+    finally:
+        renderer.shutdown()
+
+    draw()
+
+    assert image == render_level(level, 1).convertToFormat(QImage.Format_RGB888)
+
+
+def test_drag_preview_reuses_object(level_view):
+    # GIVEN an object dragged in from the object toolbar
+    level_object = level_view.level_ref.level.objects[-1]
+
+    mime_data = QMimeData()
+    mime_data.setData("application/level-object", bytes([0]) + bytes(level_object.to_bytes()))
+
+    def drag_to(x, y):
+        level_view.dragMoveEvent(QDragMoveEvent(QPoint(x, y), Qt.MoveAction, mime_data, Qt.LeftButton, Qt.NoModifier))
+
+    drag_to(0, 0)
+    dragged_object = level_view.currently_dragged_object
+
+    # WHEN it is dragged across the level view
+    drag_to(5 * level_view.block_length, 3 * level_view.block_length)
+
+    # THEN the same object is moved along
+    assert level_view.currently_dragged_object is dragged_object
+    assert dragged_object.position.x == 5
+    assert dragged_object.position.y == 3
+
+
+def test_dragging_is_coalesced(level_view):
+    # GIVEN an object under the cursor, that is clicked on
+    level_object = level_view.level_ref.level.objects[-1]
+    start = QPointF(level_object.position.x + 0.5, level_object.position.y + 0.5) * level_view.block_length
+    level_object = level_view.object_at(*start.toPoint().toTuple())
+
+    start_x, start_y = level_object.position.x, level_object.position.y
+
+    def mouse_event(event_type, position, button=Qt.LeftButton):
+        return QMouseEvent(event_type, position, position, button, Qt.LeftButton, Qt.NoModifier)
+
+    level_view.mousePressEvent(mouse_event(QEvent.MouseButtonPress, start))
+
+    # WHEN it is dragged one block to the right and down with a lot of mouse events in a single frame
+    for step in range(1, 33):
+        offset = QPointF(step, step) * level_view.block_length / 32
+        level_view.mouseMoveEvent(mouse_event(QEvent.MouseMove, start + offset, Qt.NoButton))
+
+    # THEN it is only moved for the first of them, until the frame is over
+    assert (level_object.position.x, level_object.position.y) == (start_x, start_y)
+
+    # THEN it is where the last mouse event put it, when the mouse button is released
+    end = start + QPointF(1, 1) * level_view.block_length
+    level_view.mouseReleaseEvent(mouse_event(QEvent.MouseButtonRelease, end))
+
+    assert (level_object.position.x, level_object.position.y) == (start_x + 1, start_y + 1)
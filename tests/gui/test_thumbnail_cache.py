@@ -0,0 +1,107 @@
+from foundry.core.point.Point import Point
+from foundry.game.File import ROM
+from foundry.game.level.Level import Level
+from foundry.game.level.LevelPrefetcher import level_key
+from foundry.gui.LevelSelector import LevelSelector
+from foundry.gui.settings import SETTINGS
+from foundry.gui.ThumbnailCache import ThumbnailCache
+from foundry.smb3parse.objects.object_set import PLAINS_OBJECT_SET
+from tests.conftest import level_1_2_enemy_address, level_1_2_object_address
+
+
+def test_edited_level_gets_new_thumbnail(level, tmp_path, qtbot):
+    # GIVEN a thumbnail cache and two levels
+    thumbnail_cache = ThumbnailCache(tmp_path)
+
+    level_1_1 = level_key(level)
+    level_1_2 = (level_1_2_object_address, level_1_2_enemy_address, PLAINS_OBJECT_SET)
+
+    level_1_1_path = thumbnail_cache.thumbnail_path(level_1_1)
+    level_1_2_path = thumbnail_cache.thumbnail_path(level_1_2)
+
+    original_data = level.to_bytes()
+
+    # WHEN the first level is changed in the ROM
+    position = level.objects[0].position
+    level.objects[0].position = Point(position.x + 1, position.y)
+
+    for offset, data in level.to_bytes():
+        ROM().bulk_write(data, offset)
+
+    # THEN only the thumbnail of the changed level is stale
+    try:
+        assert thumbnail_cache.thumbnail_path(level_1_1) != level_1_1_path
+        assert thumbnail_cache.thumbnail_path(level_1_2) == level_1_2_path
+    finally:
+        for offset, data in original_data:
+            ROM().bulk_write(data, offset)
+
+
+def test_rom_hashed_in_background(level, tmp_path, qtbot):
+    # GIVEN a thumbnail cache with an up to date thumbnail of a level
+    thumbnail_cache = ThumbnailCache(tmp_path)
+
+    level_1_1 = level_key(level)
+
+    path = thumbnail_cache.thumbnail_path(level_1_1)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"")
+
+    # WHEN the ROM changes and the thumbnail is asked for
+    ROM().bulk_write(bytearray([ROM().get_byte(0x10)]), 0x10)
+
+    with qtbot.waitSignal(thumbnail_cache.thumbnail_ready) as blocker:
+        assert thumbnail_cache.thumbnail(level_1_1) is None
+
+    # THEN it is handed out, once the ROM was hashed again
+    assert blocker.args == [level_1_1]
+    assert thumbnail_cache.thumbnail_path(level_1_1) == path
+
+    thumbnail_cache.shutdown()
+
+
+def test_edited_enemy_gets_new_thumbnail(level, tmp_path, qtbot):
+    # GIVEN a thumbnail cache and a level
+    thumbnail_cache = ThumbnailCache(tmp_path)
+
+    level_1_1 = level_key(level)
+    level_1_1_path = thumbnail_cache.thumbnail_path(level_1_1)
+
+    original_data = level.to_bytes()
+
+    # WHEN an enemy of the level is moved in the ROM
+    level.enemies[0].move_by(1, 0)
+
+    for offset, data in level.to_bytes():
+        ROM().bulk_write(data, offset)
+
+    # THEN the thumbnail of the level is stale
+    try:
+        assert thumbnail_cache.thumbnail_path(level_1_1) != level_1_1_path
+    finally:
+        for offset, data in original_data:
+            ROM().bulk_write(data, offset)
+
+
+def test_preview_of_level_to_be_loaded(rom_singleton, qtbot, monkeypatch):
+    # GIVEN a level selector
+    monkeypatch.setitem(SETTINGS, "level_thumbnails_enabled", False)
+
+    level_selector = LevelSelector(None)
+    qtbot.addWidget(level_selector)
+
+    # WHEN a level is selected
+    level_selector.world_list.setCurrentRow(1)
+    level_selector.level_list.setCurrentRow(0)
+    level_selector.on_level_click()
+    level_selector.on_ok()
+
+    # THEN the preview is of the level, that the editor will load
+    level = Level(
+        level_selector.level_name,
+        level_selector.object_data_offset,
+        level_selector.enemy_data_offset,
+        level_selector.object_set,
+    )
+
+    assert level_selector._previewed_level == level_key(level)
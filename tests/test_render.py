@@ -0,0 +1,46 @@
+from PySide6.QtGui import QImage
+
+from foundry.game.level.Level import Level
+from foundry.gui.LevelRenderer import render_level
+from foundry.gui.LevelSelector import LevelSelector
+from foundry.gui.settings import SETTINGS
+from foundry.render import _render_level, filter_levels
+
+
+def test_level_rendered_as_loaded_in_editor(rom_singleton, tmp_path, qtbot, monkeypatch):
+    # GIVEN the first level of world 1, as the level selector loads it into the editor
+    monkeypatch.setitem(SETTINGS, "level_thumbnails_enabled", False)
+
+    level_selector = LevelSelector(None)
+    qtbot.addWidget(level_selector)
+
+    level_selector.world_list.setCurrentRow(1)
+    level_selector.level_list.setCurrentRow(0)
+    level_selector.on_level_click()
+    level_selector.on_ok()
+
+    level = Level(
+        level_selector.level_name,
+        level_selector.object_data_offset,
+        level_selector.enemy_data_offset,
+        level_selector.object_set,
+    )
+
+    # WHEN it is batch rendered
+    file_name, key = next(
+        (file_name, key)
+        for file_name, key in filter_levels(Level.offsets, worlds=[1]).items()
+        if key[0] == level.header_offset
+    )
+
+    path = tmp_path / file_name
+
+    assert _render_level(key, path, 1) is None
+
+    # THEN it has the same enemies and looks the same as in the editor
+    assert key == (level.header_offset, level.enemy_offset, level.object_set_number)
+    assert Level(path.stem, *key).to_bytes() == level.to_bytes()
+
+    rendered_image = QImage(str(path)).convertToFormat(QImage.Format_RGB888)
+
+    assert rendered_image == render_level(level, 1).convertToFormat(QImage.Format_RGB888)